@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+🎯 ACCURACY ENGINE - Infinity Research Paper
+============================================
+
+Derives the Infinity Research Real Accuracy Performance table (Section 4.8)
+from the data alone: the classification table says which field comparisons
+are conflicts and who flagged them, and the parsed conflict resolutions say
+who was right. Nothing is hard-coded, so a new project only needs its
+analysis_<model>.json files and its conflicts report.
+
+- Every (article, scientific field) classified by both evaluators is
+  'concordant' (both A-C) or a conflict of scope `claude_only`,
+  `deepseek_only` (only that evaluator said D-F) or `both_models`.
+- Conflict records of the report (conflicts_parser) are joined on
+  (article, field) and give the verdict: infinity, manual or both correct;
+  conflicts without a record stay unresolved.
+- Counts are kept as a (scopes x verdicts) matrix and updated cell by cell
+  when resolutions are added, so re-running with an extra resolutions file
+  (or a newer report) only touches the conflicts it resolves.
+
+Infinity accuracy credits the conflicts where the Infinity extraction was
+correct, including those where both extractions were; the overall Infinity
+Correct cell of the paper counts them the same way.
+
+Input: analysis/analysis_claude.json + analysis/analysis_deepseek.json + analysis/conflicts.txt
+Output: accuracy_table.txt
+"""
+
+import argparse
+from typing import Dict, List
+import numpy as np
+
+from classification_table import DEFAULT_ANALYSIS_FILES, is_concordant, load_classification_table
+from conflicts_parser import DEFAULT_CONFLICTS_FILE, SCOPES, parse_conflicts_report
+
+# Comparison scopes (code = index): concordant, then the conflict scopes of the report
+COMPARISON_SCOPES = ['concordant'] + SCOPES
+VERDICTS = ['infinity', 'manual', 'both', 'unresolved']
+UNRESOLVED = VERDICTS.index('unresolved')
+
+# Conflicts report field name -> scientific field (item) of the classification table
+CONFLICT_FIELDS = {
+    'Sample_Size': 'Sample Size (n), Population Characteristics',
+    'Key_Findings': 'Key Findings',
+    'Outcome_Measure': 'Outcome Measure'
+}
+
+ROW_LABELS = {
+    'concordant': 'Automatic Concordance',
+    'claude_only': 'Conflicts - Claude Only',
+    'deepseek_only': 'Conflicts - DeepSeek Only',
+    'both_models': 'Conflicts - Both Models'
+}
+
+def conflict_item(record: Dict) -> str:
+    """Scientific field of a conflict record ('Author_Year_StudyType' + 'Year' -> 'Year')"""
+    if record.get('subfield'):
+        return record['subfield']
+    return CONFLICT_FIELDS.get(record['field'], record['field'].replace('_', ' '))
+
+def comparison_scopes(table: Dict, first: str = 'claude', second: str = 'deepseek') -> np.ndarray:
+    """
+    (articles x items) COMPARISON_SCOPES codes of every field comparison (-1: not classified by both)
+    """
+    codes = table['codes'][:, :, [table['evaluators'].index(first), table['evaluators'].index(second)]]
+    compared = (codes >= 0).all(axis=2)
+    flagged = ~is_concordant(codes)
+    scope = np.select([flagged[..., 0] & flagged[..., 1], flagged[..., 0], flagged[..., 1]],
+                      [COMPARISON_SCOPES.index('both_models'), COMPARISON_SCOPES.index('claude_only'),
+                       COMPARISON_SCOPES.index('deepseek_only')], default=0)
+    return np.where(compared, scope, -1).astype(np.int8)
+
+class AccuracyEngine:
+    """
+    Conflict scopes joined with resolution verdicts, with incrementally maintained counts
+    """
+
+    def __init__(self, table: Dict, first: str = 'claude', second: str = 'deepseek'):
+        self.table = table
+        self.scopes = comparison_scopes(table, first, second)
+        self.verdicts = np.full(self.scopes.shape, UNRESOLVED, dtype=np.int8)
+        # (scopes x verdicts) counts; concordant comparisons need no resolution and count as 'both'
+        self.counts = np.zeros((len(COMPARISON_SCOPES), len(VERDICTS)), dtype=np.int64)
+        compared = self.scopes >= 0
+        self.verdicts[self.scopes == 0] = VERDICTS.index('both')
+        np.add.at(self.counts, (self.scopes[compared], self.verdicts[compared]), 1)
+        self.unmatched = []
+
+    def add_resolutions(self, records: List[Dict]) -> int:
+        """
+        Join conflict records on (article, field) and apply their verdicts
+        A later record for the same conflict replaces the earlier verdict. Records that match no
+        conflict of their scope are kept in `unmatched`. Returns the number of verdicts changed.
+        """
+        articles, items = self.table['articles'], self.table['items']
+        changed = 0
+        for record in records:
+            item = conflict_item(record)
+            row = int(np.searchsorted(articles, record['article']))
+            scope = COMPARISON_SCOPES.index(record['scope']) if record.get('scope') in SCOPES else None
+            if (row >= len(articles) or articles[row] != record['article'] or item not in items
+                    or self.scopes[row, items.index(item)] != scope):
+                self.unmatched.append(record)
+                continue
+            column = items.index(item)
+            verdict = VERDICTS.index(record['verdict'] or 'unresolved')
+            old = self.verdicts[row, column]
+            if old != verdict:
+                self.counts[scope, old] -= 1
+                self.counts[scope, verdict] += 1
+                self.verdicts[row, column] = verdict
+                changed += 1
+        return changed
+
+    def unresolved(self) -> List[tuple]:
+        """(article, field, scope) of the conflicts still awaiting a verdict"""
+        rows, columns = np.nonzero((self.scopes > 0) & (self.verdicts == UNRESOLVED))
+        return [(int(self.table['articles'][r]), self.table['items'][c], COMPARISON_SCOPES[self.scopes[r, c]])
+                for r, c in zip(rows, columns)]
+
+    def summary(self) -> Dict:
+        """
+        Accuracy rows: one per comparison scope, 'conflicts' (all conflict scopes) and 'overall'
+        Each row: {'cases', 'infinity', 'manual', 'both', 'unresolved', 'accuracy'}.
+        """
+        def row(counts: np.ndarray, concordant: int = 0) -> Dict:
+            values = dict(zip(VERDICTS, (int(v) for v in counts)))
+            values['cases'] = int(counts.sum())
+            # Concordant comparisons are stored as 'both' verdicts: every extraction is correct
+            values['accuracy'] = values['infinity'] + values['both']
+            values['infinity'] += concordant
+            values['manual'] += concordant
+            return values
+
+        concordant = int(self.counts[0].sum())
+        rows = {scope: row(self.counts[s]) for s, scope in enumerate(COMPARISON_SCOPES) if s > 0}
+        rows['concordant'] = row(self.counts[0], concordant)
+        rows['conflicts'] = row(self.counts[1:].sum(axis=0))
+        rows['overall'] = row(self.counts.sum(axis=0), concordant)
+        return rows
+
+def _cell(count: int, cases: int) -> str:
+    return f"{count} ({count / cases * 100:.1f}%)" if cases else f"{count}"
+
+def generate_accuracy_table(rows: Dict) -> str:
+    """
+    Generate the real accuracy performance table
+    """
+    order = [('concordant', ROW_LABELS['concordant'])] + [(s, ROW_LABELS[s]) for s in SCOPES] + \
+        [('conflicts', 'Total Conflicts'), ('overall', '**OVERALL PERFORMANCE**')]
+    body = []
+    for key, label in order:
+        row = rows[key]
+        if key in SCOPES and row['cases'] == 0:
+            continue
+        cells = [str(row['cases']), _cell(row['infinity'], row['cases']), _cell(row['manual'], row['cases']),
+                 _cell(row['both'], row['cases']), f"{row['accuracy']}/{row['cases']} "
+                 f"({row['accuracy'] / row['cases'] * 100 if row['cases'] else 0:.1f}%)"]
+        if key == 'overall':
+            # Paper's overall row: counts only, Infinity Correct includes the both-correct conflicts
+            cells = [str(row['cases']), str(row['accuracy']), str(row['manual']), str(row['both']), cells[-1]]
+            cells = [f"**{c}**" for c in cells]
+        body.append([label] + cells)
+
+    headers = [('Category', ''), ('Cases', ''), ('Infinity', 'Correct'), ('Manual', 'Correct'), ('Both', 'Correct'),
+               ('Infinity', 'Accuracy')]
+    widths = [max(len(headers[c][0]), *(len(r[c]) for r in body)) for c in range(len(headers))]
+
+    table = ["4.8 Infinity Research Real Accuracy Performance", ""]
+    for line in range(2):
+        table.append("| " + " | ".join(f"{h[line]:<{w}}" for h, w in zip(headers, widths)) + " |")
+    table.append("|" + "|".join('-' * (w + 2) for w in widths) + "|")
+    for cells in body:
+        table.append("| " + " | ".join(f"{c:<{w}}" for c, w in zip(cells, widths)) + " |")
+
+    table.append("")
+    table.append("Infinity Accuracy of conflicts: Infinity correct + both correct.")
+    if rows['conflicts']['unresolved']:
+        table.append(f"{rows['conflicts']['unresolved']} conflicts await a resolution and count as not correct.")
+    return "\n".join(table)
+
+def main(description: str = "Real accuracy performance table from classifications + conflict resolutions"):
+    """
+    Main function to generate the accuracy table (also the entry point of the generate_accuracy_table* scripts)
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--conflicts', nargs='+', default=[DEFAULT_CONFLICTS_FILE],
+                        help="Conflicts reports; later reports update the verdicts of earlier ones")
+    parser.add_argument('--output', default='plots/accuracy_table.txt')
+    args = parser.parse_args()
+
+    print("🎯 INFINITY RESEARCH - Accuracy Engine")
+    print("=" * 50)
+
+    engine = AccuracyEngine(load_classification_table(DEFAULT_ANALYSIS_FILES))
+    for path in args.conflicts:
+        changed = engine.add_resolutions(parse_conflicts_report(path)['records'])
+        print(f"📁 {path}: {changed} verdicts applied")
+    for record in engine.unmatched:
+        print(f"   ⚠️ No {record['scope']} conflict for Article {record['article']} - {conflict_item(record)}")
+
+    rows = engine.summary()
+    table_content = generate_accuracy_table(rows)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(table_content)
+
+    overall = rows['overall']
+    print(f"\n📈 Comparisons: {overall['cases']}, concordant: {rows['concordant']['cases']}, "
+          f"conflicts: {rows['conflicts']['cases']} ({rows['conflicts']['unresolved']} unresolved)")
+    print(f"\n{table_content}")
+    print(f"\n🎯 Accuracy table complete! Infinity accuracy {overall['accuracy']}/{overall['cases']}")
+    print(f"   📊 Table: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+🚨 ANOMALY DETECTION - Infinity Research Paper
+==============================================
+
+Robust (median/MAD) outlier pass over the columnar article metrics. Every
+cost, token and latency column is compared with what is expected for the
+article's page count and model: a Theil-Sen line (value vs. pages) is fitted
+per model group, and residuals are scored with the modified z-score
+0.6745 * (r - median(r)) / MAD. Articles with |z| above the threshold are
+flagged, so runaway prompts and retry storms stand out even in large runs.
+Zero values are reported separately as missing phases (processing failures).
+
+Used by the cost/token/time chart generators to mark flagged bars.
+
+Input: JSON files from infinity-research-paper/json/Article_XX/
+Output: anomaly_report.json
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, List
+import numpy as np
+
+from article_metrics import load_metrics_table
+
+# Iglewicz & Hoaglin cut-off for the modified z-score
+DEFAULT_THRESHOLD = 3.5
+
+# Groups smaller than this are scored against all articles instead of their model
+MIN_GROUP_SIZE = 8
+
+# Cap on slope pairs per Theil-Sen fit (pairs are sampled beyond this)
+MAX_SLOPE_PAIRS = 200_000
+
+# Metric column -> (display name, chart family, phase whose model defines the group)
+ANOMALY_METRICS = {
+    'total_cost': ('Total cost', 'cost', None),
+    'vision_cost': ('Vision cost', 'cost', 'vision'),
+    'consensus_cost': ('Consensus cost', 'cost', 'consensus'),
+    'topics_cost': ('Topics cost', 'cost', 'topics'),
+    'total_tokens': ('Total tokens', 'tokens', None),
+    'vision_tokens': ('Vision tokens', 'tokens', 'vision'),
+    'consensus_tokens': ('Consensus tokens', 'tokens', 'consensus'),
+    'topics_tokens': ('Topics tokens', 'tokens', 'topics'),
+    'total_time_ms': ('Total time', 'time', None),
+    'vision_time_ms': ('Vision time', 'time', 'vision'),
+    'apis_time_ms': ('APIs+Consensus time', 'time', None),
+    'consensus_time_ms': ('Consensus time', 'time', 'consensus'),
+    'fanout_time_ms': ('API fan-out time', 'time', None),
+    'topics_time_ms': ('Topics time', 'time', 'topics')
+}
+
+def theil_sen_fit(x: np.ndarray, y: np.ndarray, rng: np.random.Generator) -> tuple:
+    """
+    Robust line y = intercept + slope * x (median of pairwise slopes)
+    Falls back to a flat line at median(y) when x has no spread.
+    """
+    n = len(x)
+    if n < 2 or np.ptp(x) == 0:
+        return float(np.median(y)) if n else 0.0, 0.0
+
+    i, j = np.triu_indices(n, k=1)
+    if len(i) > MAX_SLOPE_PAIRS:
+        pick = rng.choice(len(i), MAX_SLOPE_PAIRS, replace=False)
+        i, j = i[pick], j[pick]
+    dx = x[j] - x[i]
+    valid = dx != 0
+    slope = float(np.median((y[j] - y[i])[valid] / dx[valid]))
+    intercept = float(np.median(y - slope * x))
+    return intercept, slope
+
+def robust_z_scores(residuals: np.ndarray) -> np.ndarray:
+    """
+    Modified z-score; uses the mean absolute deviation when MAD is 0
+    """
+    center = np.median(residuals)
+    deviation = residuals - center
+    mad = np.median(np.abs(deviation))
+    if mad > 0:
+        return 0.6745 * deviation / mad
+    meanad = np.mean(np.abs(deviation))
+    if meanad > 0:
+        return deviation / (1.253314 * meanad)
+    return np.zeros_like(residuals)
+
+def model_groups(table: Dict[str, np.ndarray], phase) -> np.ndarray:
+    """Model key per article: the phase model, or all three models for totals"""
+    if phase is not None:
+        return table[f'{phase}_model'].astype(str)
+    return np.array([f"{v}/{c}/{t}" for v, c, t in zip(table['vision_model'], table['consensus_model'],
+                                                       table['topics_model'])])
+
+def detect_anomalies(table: Dict[str, np.ndarray], threshold: float = DEFAULT_THRESHOLD,
+                     seed: int = 42) -> Dict:
+    """
+    Score every metric column against page count and model
+
+    Returns per-metric arrays ('expected', 'z', 'flagged', 'zero') plus a flat
+    list of flags, one dict per (article, metric).
+    """
+    rng = np.random.default_rng(seed)
+    n = len(table['article_num'])
+    document_pages = table['topics_total_pages'].astype(float)
+    document_pages = np.where(document_pages > 0, document_pages, table['vision_pages'])
+
+    metrics = {}
+    flags = []
+    for column, (name, family, phase) in ANOMALY_METRICS.items():
+        values = table[column].astype(float)
+        expected = np.full(n, np.nan)
+        z = np.zeros(n)
+        zero = values <= 0
+        groups = model_groups(table, phase)
+        # Vision and Topics are compared with the pages they actually rendered
+        pages = table[f'{phase}_pages'].astype(float) if phase in ('vision', 'topics') else document_pages
+
+        keys, inverse = np.unique(groups, return_inverse=True)
+        counts = np.bincount(inverse[~zero], minlength=len(keys))
+        # Small model groups are pooled so the median/MAD stay meaningful
+        inverse = np.where(counts[inverse] >= MIN_GROUP_SIZE, inverse, -1)
+        for g in np.unique(inverse[~zero]):
+            members = (inverse == g) & ~zero
+            reference = ~zero if g < 0 else members
+            if reference.sum() < 3:
+                continue
+            intercept, slope = theil_sen_fit(pages[reference], values[reference], rng)
+            fitted = intercept + slope * pages
+            scores = np.zeros(n)
+            scores[reference] = robust_z_scores(values[reference] - fitted[reference])
+            expected[members] = fitted[members]
+            z[members] = scores[members]
+
+        flagged = np.abs(z) > threshold
+        metrics[column] = {'name': name, 'family': family, 'expected': expected,
+                           'z': z, 'flagged': flagged, 'zero': zero, 'groups': groups}
+
+        for i in np.flatnonzero(flagged | zero):
+            flags.append({
+                'article_num': int(table['article_num'][i]),
+                'label': str(table['label'][i]),
+                'metric': column,
+                'metric_name': name,
+                'family': family,
+                'kind': 'zero' if zero[i] else ('high' if z[i] > 0 else 'low'),
+                'value': float(values[i]),
+                'expected': None if np.isnan(expected[i]) else round(float(expected[i]), 6),
+                'robust_z': round(float(z[i]), 3),
+                'pages': int(pages[i]),
+                'model': str(groups[i])
+            })
+
+    return {'articles': n, 'threshold': threshold, 'metrics': metrics, 'flags': flags}
+
+def chart_anomalies(family: str, json_dir: str = "json",
+                    threshold: float = DEFAULT_THRESHOLD) -> Dict[str, List[str]]:
+    """
+    Outlier reasons per article label for one chart family ('cost', 'tokens', 'time')
+    Zero values are left out: the charts already report them as processing failures.
+    """
+    result = detect_anomalies(load_metrics_table(json_dir), threshold)
+    reasons = {}
+    for flag in result['flags']:
+        if flag['family'] == family and flag['kind'] != 'zero':
+            reasons.setdefault(flag['label'], []).append(f"{flag['metric_name'].lower()} {flag['kind']}")
+    return reasons
+
+def describe_chart_anomalies(reasons: Dict[str, List[str]], threshold: float = DEFAULT_THRESHOLD) -> str:
+    """Legend sentence listing flagged articles (empty when nothing is flagged)"""
+    if not reasons:
+        return ""
+    ordered = sorted(reasons.items(), key=lambda item: int(item[0].replace('Art', '')))
+    items = [f"{label} ({', '.join(r)})" for label, r in ordered]
+    return (f" Robust outliers for page count and model (|modified z| > {threshold}): "
+            f"{'; '.join(items)}.")
+
+def generate_anomaly_report(result: Dict) -> Dict:
+    """
+    Machine-readable report: settings, per-metric counts and the flag list
+    """
+    summary = {}
+    for column, metric in result['metrics'].items():
+        summary[column] = {
+            'name': metric['name'],
+            'family': metric['family'],
+            'flagged_high': int((metric['flagged'] & (metric['z'] > 0)).sum()),
+            'flagged_low': int((metric['flagged'] & (metric['z'] < 0)).sum()),
+            'zero_values': int(metric['zero'].sum())
+        }
+
+    return {
+        'method': 'Theil-Sen fit on page count per model, modified z-score (median/MAD)',
+        'threshold': result['threshold'],
+        'min_group_size': MIN_GROUP_SIZE,
+        'articles': result['articles'],
+        'flagged_articles': sorted({f['article_num'] for f in result['flags']}),
+        'metrics': summary,
+        'flags': result['flags']
+    }
+
+def main():
+    """
+    Main function to run the anomaly pass and save the report
+    """
+    parser = argparse.ArgumentParser(description="Flag cost/token/latency outliers for page count and model")
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--output', default='plots/anomaly_report.json')
+    args = parser.parse_args()
+
+    print("🚨 INFINITY RESEARCH - Anomaly Detection")
+    print("=" * 50)
+
+    if not os.path.exists(args.json_dir):
+        print(f"❌ Error: {args.json_dir} folder not found!")
+        return
+
+    table = load_metrics_table(args.json_dir)
+    print(f"📁 Found {len(table['article_num'])} article folders")
+
+    result = detect_anomalies(table, args.threshold)
+    report = generate_anomaly_report(result)
+
+    print(f"\n📈 ANOMALY RESULTS (|modified z| > {args.threshold}):")
+    print("=" * 50)
+    if not report['flags']:
+        print("   ✅ No outliers found")
+    for flag in report['flags']:
+        if flag['kind'] == 'zero':
+            print(f"   ⚠️ {flag['label']}: {flag['metric_name']} is zero (processing failure)")
+        else:
+            print(f"   🚨 {flag['label']}: {flag['metric_name']} {flag['kind']} "
+                  f"({flag['value']:.6g} vs expected {flag['expected']:.6g}, z={flag['robust_z']:+.1f})")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"\n🎯 Anomaly detection complete!")
+    print(f"   📊 Report: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+🧭 ARTICLE MANIFEST - Infinity Research Paper
+=============================================
+
+Precomputed join between the three artifacts that describe one article:
+
+- the evaluation entries (analysis_<model>.json `article_number`),
+- the pipeline output folder (json/Article_XX, number = article ID),
+- the input PDF (pdfs/N) Title.pdf; the N prefix is the reviewer's
+  numbering, not the article ID, and one PDF has no prefix at all).
+
+PDFs are matched to folders by title, not by sorted order: the
+`processing_metadata.filename` of each folder (and its consensus/Vision
+title) is normalized (number prefix, extension, copy suffix, punctuation
+removed) and looked up exactly first; the remaining folders are matched
+with difflib similarity, best pairs first, one PDF per folder. Each entry
+carries the PDF SHA-256, size and page count, DOI and title, so scripts get
+O(1) lookups by article, folder, DOI, PDF name or content hash through
+load_manifest() instead of re-deriving the link.
+
+Input: json/Article_XX/ + pdfs/ + analysis/analysis_<model>.json
+Output: article_manifest.json
+"""
+
+import argparse
+import difflib
+import glob
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+from article_metrics import load_article_jsons
+from classification_table import discover_analysis_files
+from field_normalizer import TITLE_SIMILARITY, fold_text
+from forecast_batch import count_pdf_pages
+from source_extractors import strip_doi
+
+DEFAULT_MANIFEST = "plots/article_manifest.json"
+
+_NUMBER_PREFIX = re.compile(r'^\s*(\d+)\)\s*')
+_COPY_SUFFIX = re.compile(r'[-_ ]\(?\d\)?$')
+
+def normalize_title(name: Optional[str]) -> str:
+    """'3) The photoreal..._tool-2.pdf' -> 'the photoreal tool' (folded words, no prefix/suffix)"""
+    if not name:
+        return ''
+    stem = _NUMBER_PREFIX.sub('', os.path.basename(str(name)))
+    stem = re.sub(r'\.pdf$', '', stem, flags=re.IGNORECASE)
+    return fold_text(_COPY_SUFFIX.sub('', stem))
+
+def pdf_number(name: str) -> Optional[int]:
+    match = _NUMBER_PREFIX.match(os.path.basename(name))
+    return int(match.group(1)) if match else None
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def article_identity(article: Dict) -> Dict:
+    """Source filename, title and DOI of an article folder (consensus first, then Vision)"""
+    consensus = article['apis_clean'].get('consensus_result', {}) or {}
+    vision = article['vision'].get('extracted_data', {}) or {}
+    metadata = article['final'].get('processing_metadata', {}) or {}
+    title = consensus.get('Title') or vision.get('Title')
+    doi = strip_doi(consensus.get('DOI')) or strip_doi(vision.get('DOI'))
+    return {'source_filename': metadata.get('filename'), 'title': title, 'doi': doi.lower() if doi else None}
+
+def match_pdfs(identities: Dict[int, Dict], pdf_paths: List[str],
+               threshold: float = TITLE_SIMILARITY) -> Dict[int, tuple]:
+    """
+    {article: (pdf path, score)} - exact normalized-name matches first, then the most similar
+    remaining (article, PDF) pairs above the threshold, each PDF used once
+    """
+    by_name = {}
+    for path in pdf_paths:
+        by_name.setdefault(normalize_title(path), path)
+    matches, used = {}, set()
+    for article, identity in identities.items():
+        for key in (normalize_title(identity['source_filename']), normalize_title(identity['title'])):
+            path = by_name.get(key)
+            if key and path and path not in used:
+                matches[article] = (path, 1.0)
+                used.add(path)
+                break
+
+    # Fuzzy pass over what is left only (the exact pass resolves the common case)
+    remaining = [a for a in identities if a not in matches]
+    free = [p for p in pdf_paths if p not in used]
+    candidates = []
+    for article in remaining:
+        keys = [k for k in (normalize_title(identities[article]['source_filename']),
+                            normalize_title(identities[article]['title'])) if k]
+        for path in free:
+            name = normalize_title(path)
+            score = max((difflib.SequenceMatcher(None, key, name).ratio() for key in keys), default=0.0)
+            if score >= threshold:
+                candidates.append((score, article, path))
+    for score, article, path in sorted(candidates, key=lambda c: -c[0]):
+        if article not in matches and path not in used:
+            matches[article] = (path, round(score, 3))
+            used.add(path)
+    return matches
+
+def build_manifest(json_dir: str = "json", pdf_dir: str = "pdfs", analysis_dir: str = "analysis") -> Dict:
+    """
+    Manifest: {'articles': {article: entry}, 'unmatched_pdfs': [...]}
+    """
+    articles = load_article_jsons(json_dir)
+    identities = {a['article_num']: dict(article_identity(a), folder=os.path.join(json_dir, a['folder']))
+                  for a in articles}
+    pdf_paths = sorted(glob.glob(os.path.join(pdf_dir, '**', '*.pdf'), recursive=True))
+    matches = match_pdfs(identities, pdf_paths)
+
+    evaluations = {}
+    for evaluator, path in discover_analysis_files(analysis_dir).items():
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for position, entry in enumerate(data):
+            evaluations.setdefault(int(entry.get('article_number', position + 1)), []).append(evaluator)
+
+    entries = {}
+    for article, identity in sorted(identities.items()):
+        path, score = matches.get(article, (None, None))
+        entries[article] = {
+            'article': article,
+            'folder': identity['folder'],
+            'source_filename': identity['source_filename'],
+            'title': identity['title'],
+            'doi': identity['doi'],
+            'pdf': path,
+            'pdf_number': pdf_number(path) if path else None,
+            'pdf_sha256': file_sha256(path) if path else None,
+            'pdf_bytes': os.path.getsize(path) if path else None,
+            'pdf_pages': count_pdf_pages(path) if path else None,
+            'match_score': score,
+            'evaluators': evaluations.get(article, [])
+        }
+    used = {entry['pdf'] for entry in entries.values()}
+    return {'articles': entries, 'unmatched_pdfs': [p for p in pdf_paths if p not in used]}
+
+def load_manifest(path: str = DEFAULT_MANIFEST) -> Dict:
+    """
+    Manifest entries with lookup indexes: {'articles', 'by_folder', 'by_doi', 'by_pdf', 'by_sha256'}
+    (article IDs are ints again; every index maps to the entry dict)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    entries = {int(article): entry for article, entry in manifest['articles'].items()}
+    return {
+        'articles': entries,
+        'by_folder': {os.path.basename(e['folder']): e for e in entries.values()},
+        'by_doi': {e['doi']: e for e in entries.values() if e['doi']},
+        'by_pdf': {os.path.basename(e['pdf']): e for e in entries.values() if e['pdf']},
+        'by_sha256': {e['pdf_sha256']: e for e in entries.values() if e['pdf_sha256']},
+        'unmatched_pdfs': manifest.get('unmatched_pdfs', [])
+    }
+
+def main():
+    """
+    Main function to build the article manifest
+    """
+    parser = argparse.ArgumentParser(description="Join analysis entries, json/Article_XX folders and PDFs")
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--pdf-dir', default='pdfs')
+    parser.add_argument('--analysis-dir', default='analysis')
+    parser.add_argument('--output', default=DEFAULT_MANIFEST)
+    args = parser.parse_args()
+
+    print("🧭 INFINITY RESEARCH - Article Manifest")
+    print("=" * 50)
+
+    manifest = build_manifest(args.json_dir, args.pdf_dir, args.analysis_dir)
+    entries = manifest['articles']
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    for entry in entries.values():
+        pdf = os.path.basename(entry['pdf']) if entry['pdf'] else '❌ no PDF'
+        score = f" ({entry['match_score']:.2f})" if entry['match_score'] not in (None, 1.0) else ''
+        print(f"   Art{entry['article']:<3} {entry['doi'] or '-':<32} {pdf[:60]}{score}")
+    matched = sum(1 for e in entries.values() if e['pdf'])
+    print(f"\n✅ {len(entries)} articles, {matched} matched to a PDF, "
+          f"{len(manifest['unmatched_pdfs'])} PDFs without an article")
+    for path in manifest['unmatched_pdfs']:
+        print(f"   ⚠️ Unmatched PDF: {path}")
+    print(f"\n🎯 Article manifest complete!")
+    print(f"   📁 Manifest: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+📦 ARTICLE METRICS LOADER - Infinity Research Paper
+===================================================
+
+Loads the modular pipeline JSONs of every article once and exposes the
+per-phase cost, token and latency values as columnar NumPy arrays
+(one row per article), so analysis scripts do not re-walk the JSON tree.
+
+Input: JSON files from infinity-research-paper/json/Article_XX/
+Output: metrics table (Dict[str, np.ndarray])
+"""
+
+import json
+import os
+import glob
+from typing import Dict, List
+import numpy as np
+
+# Phase name -> JSON file written by the platform for each article
+PHASE_FILES = {
+    'vision': 'vision_json.json',
+    'apis_raw': 'apis_raw_json.json',
+    'apis_clean': 'apis_clean_json.json',
+    'topics': 'llm_topics_json.json',
+    'final': 'final_json.json'
+}
+
+# Key used for each phase inside final_json.json (fallback when a phase file is missing)
+FINAL_JSON_KEYS = {
+    'vision': 'vision_json',
+    'apis_raw': 'apis_raw_json',
+    'apis_clean': 'apis_clean_json',
+    'topics': 'llm_topics_json'
+}
+
+# The 11 bibliographic API sources queried during the fan-out phase
+API_SOURCES = [
+    'core', 'doaj', 'arxiv', 'orcid', 'pubmed', 'crossref',
+    'datacite', 'openalex', 'unpaywall', 'europe_pmc', 'semantic_scholar'
+]
+
+# The 16 bibliographic metadata fields (Vision extraction / consensus_result keys)
+METADATA_FIELDS = [
+    'Title', 'Authors', 'Journal', 'Year', 'Volume', 'Issue', 'Pages', 'DOI',
+    'PMID', 'PMCID', 'Publisher', 'Keywords', 'Abstract', 'Citations', 'OpenAccess', 'PDFUrl'
+]
+
+def source_entries(apis_raw: Dict) -> Dict[str, Dict]:
+    """
+    Per-source entries of an apis_raw_json file
+    Keys starting with '_' (e.g. '_cache' from the fan-out client) are run metadata, not sources.
+    """
+    return {key: entry for key, entry in (apis_raw or {}).items()
+            if not key.startswith('_') and isinstance(entry, dict)}
+
+def is_field_filled(value) -> bool:
+    """Check if a field is considered filled (non-null, non-empty) - same rule as Figure 5"""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return len(value.strip()) > 0
+    if isinstance(value, list):
+        return len(value) > 0
+    return bool(value)
+
+def load_article_jsons(json_dir: str = "json") -> List[Dict]:
+    """
+    Load every phase JSON of every article folder (sorted by folder name)
+    Returns list of dicts: {'folder', 'article_num', 'vision', 'apis_raw', ...}
+    """
+    articles = []
+
+    article_folders = glob.glob(os.path.join(json_dir, "Article_*"))
+    article_folders.sort()
+
+    for folder in article_folders:
+        if not os.path.isdir(folder):
+            continue
+
+        folder_name = os.path.basename(folder)
+        article = {
+            'folder': folder_name,
+            'article_num': int(folder_name.split('_')[1])
+        }
+
+        for phase, filename in PHASE_FILES.items():
+            data = {}
+            path = os.path.join(folder, filename)
+            if os.path.exists(path):
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except Exception as e:
+                    print(f"      ⚠️ Error reading {folder_name}/{filename}: {e}")
+            article[phase] = data
+
+        # Fall back to the copies embedded in final_json.json
+        for phase, final_key in FINAL_JSON_KEYS.items():
+            if not article[phase]:
+                article[phase] = article['final'].get(final_key, {}) or {}
+
+        articles.append(article)
+
+    return articles
+
+def parse_timestamps(values) -> np.ndarray:
+    """
+    Vectorized ISO-8601 parsing into datetime64[us]
+    Missing/empty values become NaT; a trailing 'Z' (UTC) is accepted.
+    """
+    cleaned = np.array([v if isinstance(v, str) and v else 'NaT' for v in values], dtype=object)
+    cleaned = np.char.rstrip(cleaned.astype(str), 'Z')
+    return cleaned.astype('datetime64[us]')
+
+def _ms_to_timedelta(values: np.ndarray) -> np.ndarray:
+    """Convert millisecond floats (NaN allowed) to timedelta64[us]"""
+    micros = np.where(np.isfinite(values), values * 1000.0, 0).astype(np.int64)
+    deltas = micros.astype('timedelta64[us]')
+    deltas[~np.isfinite(values)] = np.timedelta64('NaT')
+    return deltas
+
+def _cost_field(phase_data: Dict, key: str) -> float:
+    """Read a cost_tracking value with the same fallback as the chart generators"""
+    if 'cost_tracking' in phase_data:
+        return float(phase_data['cost_tracking'].get(key, 0) or 0)
+    return float(phase_data.get(key, 0) or 0)
+
+def build_metrics_table(articles: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Build the columnar metrics table (one row per article)
+
+    Scalar columns are 1-D arrays; per-source API columns are
+    (n_articles, len(API_SOURCES)) matrices ordered as API_SOURCES.
+    Timestamps (*_start_at/*_end_at/completed_at) are datetime64[us].
+    Missing latencies are NaN, missing timestamps NaT.
+    """
+    n = len(articles)
+    n_sources = len(API_SOURCES)
+
+    table = {
+        'article_num': np.zeros(n, dtype=np.int32),
+        'folder': np.empty(n, dtype=object),
+        'label': np.empty(n, dtype=object),
+        'api_time_ms': np.full((n, n_sources), np.nan),
+        'api_success': np.zeros((n, n_sources), dtype=bool)
+    }
+
+    # Raw timestamp strings, parsed in one vectorized pass after the loop
+    raw_timestamps = {
+        'vision_end_at': [None] * n,
+        'consensus_end_at': [None] * n,
+        'topics_end_at': [None] * n,
+        'completed_at': [None] * n
+    }
+    raw_api_timestamps = [[None] * n_sources for _ in range(n)]
+
+    phases = ['vision', 'consensus', 'topics']
+    phase_keys = {'vision': 'vision', 'consensus': 'apis_clean', 'topics': 'topics'}
+    for phase in phases:
+        table[f'{phase}_cost'] = np.zeros(n)
+        table[f'{phase}_tokens'] = np.zeros(n, dtype=np.int64)
+        table[f'{phase}_input_tokens'] = np.zeros(n, dtype=np.int64)
+        table[f'{phase}_output_tokens'] = np.zeros(n, dtype=np.int64)
+        table[f'{phase}_model'] = np.empty(n, dtype=object)
+
+    for phase in ['vision', 'apis', 'consensus', 'topics']:
+        table[f'{phase}_time_ms'] = np.zeros(n)
+
+    # Page/rendering settings of the two vision calls and fields they filled
+    for phase in ['vision', 'topics']:
+        table[f'{phase}_pages'] = np.zeros(n, dtype=np.int32)
+        table[f'{phase}_dpi'] = np.zeros(n, dtype=np.int32)
+        table[f'{phase}_strategy'] = np.empty(n, dtype=object)
+    table['topics_total_pages'] = np.zeros(n, dtype=np.int32)
+    table['vision_fields_filled'] = np.zeros(n, dtype=np.int32)
+    table['consensus_fields_filled'] = np.zeros(n, dtype=np.int32)
+    table['topics_fields_filled'] = np.zeros(n, dtype=np.int32)
+
+    for i, article in enumerate(articles):
+        table['article_num'][i] = article['article_num']
+        table['folder'][i] = article['folder']
+        table['label'][i] = f"Art{article['article_num']}"
+
+        for phase in phases:
+            data = article[phase_keys[phase]]
+            table[f'{phase}_cost'][i] = _cost_field(data, 'total_cost')
+            table[f'{phase}_tokens'][i] = int(_cost_field(data, 'total_tokens'))
+            table[f'{phase}_input_tokens'][i] = int(_cost_field(data, 'input_tokens'))
+            table[f'{phase}_output_tokens'][i] = int(_cost_field(data, 'output_tokens'))
+            table[f'{phase}_model'][i] = data.get('cost_tracking', {}).get('model', '')
+
+        # Phase latencies exactly as the time chart reads them (final_json.json)
+        final_data = article['final']
+        table['vision_time_ms'][i] = int(final_data.get('vision_json', {}).get('processing_time_ms', 0))
+        table['apis_time_ms'][i] = int(final_data.get('apis_clean_json', {}).get('processing_time_ms', 0))
+        table['topics_time_ms'][i] = int(final_data.get('llm_topics_json', {}).get('processing_time_ms', 0))
+
+        # Consensus LLM call alone (the APIs+Consensus phase also contains the fan-out)
+        table['consensus_time_ms'][i] = int(
+            article['apis_clean'].get('cost_tracking', {}).get('processing_time_ms', 0) or 0
+        )
+
+        vision_details = article['vision'].get('input_details', {}) or {}
+        topics_details = article['topics'].get('input_details', {}) or {}
+        table['vision_pages'][i] = int(vision_details.get('pdf_pages_processed')
+                                       or article['vision'].get('pages_processed') or 0)
+        table['vision_dpi'][i] = int(vision_details.get('dpi') or 0)
+        table['vision_strategy'][i] = vision_details.get('page_strategy') or 'unknown'
+        table['topics_pages'][i] = int(topics_details.get('pdf_pages_processed')
+                                       or article['topics'].get('pages_processed') or 0)
+        table['topics_total_pages'][i] = int(topics_details.get('pdf_total_pages') or 0)
+        table['topics_dpi'][i] = int(topics_details.get('dpi') or 0)
+        table['topics_strategy'][i] = topics_details.get('strategy_used') or 'unknown'
+
+        extracted = article['vision'].get('extracted_data') or {}
+        consensus = article['apis_clean'].get('consensus_result') or {}
+        topics = article['topics'].get('extracted_topics') or {}
+        table['vision_fields_filled'][i] = sum(1 for f in METADATA_FIELDS if is_field_filled(extracted.get(f)))
+        table['consensus_fields_filled'][i] = sum(1 for f in METADATA_FIELDS if is_field_filled(consensus.get(f)))
+        table['topics_fields_filled'][i] = sum(1 for v in topics.values() if is_field_filled(v))
+
+        entries = source_entries(article['apis_raw'])
+        for j, source in enumerate(API_SOURCES):
+            entry = entries.get(source)
+            if entry is None:
+                continue
+            if entry.get('processing_time_ms') is not None:
+                table['api_time_ms'][i, j] = float(entry['processing_time_ms'])
+            table['api_success'][i, j] = bool(entry.get('success', False))
+            raw_api_timestamps[i][j] = entry.get('timestamp')
+
+        raw_timestamps['vision_end_at'][i] = article['vision'].get('processing_timestamp')
+        raw_timestamps['consensus_end_at'][i] = (
+            article['apis_clean'].get('cost_tracking', {}).get('timestamp')
+            or article['apis_clean'].get('timestamp')
+        )
+        raw_timestamps['topics_end_at'][i] = article['topics'].get('processing_timestamp')
+        raw_timestamps['completed_at'][i] = final_data.get('processing_metadata', {}).get('aggregated_at')
+
+    # Fan-out wall time is bounded by the slowest source of each article
+    has_api = ~np.all(np.isnan(table['api_time_ms']), axis=1)
+    table['fanout_time_ms'] = np.zeros(n)
+    table['fanout_time_ms'][has_api] = np.nanmax(table['api_time_ms'][has_api], axis=1)
+
+    # Phase timestamps: each phase records when it finished; start = end - duration
+    for column, values in raw_timestamps.items():
+        table[column] = parse_timestamps(values)
+    table['api_timestamp'] = parse_timestamps(
+        [ts for row in raw_api_timestamps for ts in row]
+    ).reshape(n, n_sources) if n else np.empty((0, n_sources), dtype='datetime64[us]')
+
+    table['vision_start_at'] = table['vision_end_at'] - _ms_to_timedelta(table['vision_time_ms'])
+    table['consensus_start_at'] = table['consensus_end_at'] - _ms_to_timedelta(table['consensus_time_ms'])
+    table['topics_start_at'] = table['topics_end_at'] - _ms_to_timedelta(table['topics_time_ms'])
+
+    api_start = table['api_timestamp'] - _ms_to_timedelta(table['api_time_ms'])
+    table['apis_start_at'] = np.full(n, np.datetime64('NaT'), dtype='datetime64[us]')
+    table['apis_end_at'] = np.full(n, np.datetime64('NaT'), dtype='datetime64[us]')
+    has_ts = ~np.all(np.isnat(table['api_timestamp']), axis=1)
+    if has_ts.any():
+        # np.min/np.max propagate NaT, so mask missing entries with sentinel values first
+        far_future = np.datetime64('9999-01-01', 'us')
+        far_past = np.datetime64('0001-01-01', 'us')
+        table['apis_start_at'][has_ts] = np.where(np.isnat(api_start), far_future, api_start)[has_ts].min(axis=1)
+        table['apis_end_at'][has_ts] = np.where(np.isnat(table['api_timestamp']), far_past,
+                                                table['api_timestamp'])[has_ts].max(axis=1)
+
+    table['total_cost'] = table['vision_cost'] + table['consensus_cost'] + table['topics_cost']
+    table['total_tokens'] = table['vision_tokens'] + table['consensus_tokens'] + table['topics_tokens']
+    table['total_time_ms'] = table['vision_time_ms'] + table['apis_time_ms'] + table['topics_time_ms']
+
+    return table
+
+def load_metrics_table(json_dir: str = "json") -> Dict[str, np.ndarray]:
+    """Convenience wrapper: load all article JSONs and build the metrics table"""
+    return build_metrics_table(load_article_jsons(json_dir))
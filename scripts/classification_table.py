@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+🗂️ CLASSIFICATION TABLE - Infinity Research Paper
+=================================================
+
+Loads the manual evaluation files (analysis_claude.json,
+analysis_deepseek.json) once into one flat, columnar table with one row per
+classification: article x field x subfield x evaluator -> category code.
+The composite "Author, Year, Study Type" field is split into its Author,
+Year and Study Type subfields here, so the table scripts do not re-walk the
+nested `article['fields'][name]['analysis']` structure.
+
+Columns are small integer arrays (category codes 0-5 for A-F); `codes` is
+the prebuilt (articles x items x evaluators) index of the same data, where
+an item is a scientific field of Table 3.6 (a subfield for the composite
+field) and -1 marks a missing classification. Concordance, field analysis
+and accuracy are group-bys over these arrays.
+
+Any number of evaluators can be loaded: discover_analysis_files() finds
+every analysis/analysis_<evaluator>.json, and concordance_summary() computes
+the distributions and concordance groups of all of them at once.
+
+Input: analysis/analysis_<evaluator>.json (claude, deepseek, ...)
+Output: classification table (Dict[str, np.ndarray])
+"""
+
+import glob
+import json
+import os
+from typing import Dict, List, Optional
+import numpy as np
+
+# Six-level concordance scale (code = index)
+CATEGORIES = ['A', 'B', 'C', 'D', 'E', 'F']
+STRONG_CODES = [0, 1]          # A+B
+CONCORDANT_CODES = [0, 1, 2]   # A+B+C (general concordance)
+
+# Evaluator -> manual evaluation file
+DEFAULT_ANALYSIS_FILES = {
+    'claude': 'analysis/analysis_claude.json',
+    'deepseek': 'analysis/analysis_deepseek.json'
+}
+
+# Evaluator -> display name (evaluators not listed are shown by their file name)
+EVALUATOR_NAMES = {
+    'claude': 'Claude 3.5 Sonnet',
+    'deepseek': 'DeepSeek V3'
+}
+
+# Evaluator registry: analysis/analysis_<evaluator>.json
+ANALYSIS_PATTERN = 'analysis_*.json'
+
+# Composite field -> (analysis key prefix, subfield) of each part
+COMPOSITE_FIELDS = {
+    'Author, Year, Study Type': [('author', 'Author'), ('year', 'Year'), ('study_type', 'Study Type')]
+}
+
+# Scientific fields of Table 3.6 (items of the `codes` index), in table order
+ITEMS = [
+    'Author', 'Year', 'Study Type', 'Methodology',
+    'Sample Size (n), Population Characteristics',
+    'Outcome Measure', 'Key Findings', 'Limitations'
+]
+
+def flatten_analysis(data: List[Dict]) -> List[tuple]:
+    """
+    (article_number, field, subfield, category) for every classification of one
+    evaluation file ('' subfield for single fields)
+    """
+    rows = []
+    for position, article in enumerate(data):
+        article_number = int(article.get('article_number', position + 1))
+        for field_name, field_data in article['fields'].items():
+            analysis = field_data.get('analysis', {}) or {}
+            if field_name in COMPOSITE_FIELDS:
+                for prefix, subfield in COMPOSITE_FIELDS[field_name]:
+                    if f'{prefix}_classification' in analysis:
+                        rows.append((article_number, field_name, subfield, analysis[f'{prefix}_classification']))
+            elif 'classification' in analysis:
+                rows.append((article_number, field_name, '', analysis['classification']))
+    return rows
+
+def _codes(values: List[str], known: List[str]) -> np.ndarray:
+    """Factorize values against a known order (new values are appended to it)"""
+    index = {value: i for i, value in enumerate(known)}
+    for value in values:
+        if value not in index:
+            index[value] = len(known)
+            known.append(value)
+    return np.array([index[v] for v in values], dtype=np.int16)
+
+def build_classification_table(analyses: Dict[str, List[Dict]]) -> Dict:
+    """
+    Build the columnar classification table from {evaluator: evaluation file data}
+
+    Columns (one entry per classification): 'article' (article number),
+    'field', 'subfield', 'item', 'evaluator', 'category' (codes into the
+    'fields', 'subfields', 'items', 'evaluators' and CATEGORIES lists).
+    'codes' is the (articles x items x evaluators) int8 category cube
+    (-1: not classified) with rows ordered as 'articles'.
+    """
+    evaluators = list(analyses)
+    rows, row_evaluators = [], []
+    for e, evaluator in enumerate(evaluators):
+        flat = flatten_analysis(analyses[evaluator])
+        rows.extend(flat)
+        row_evaluators.extend([e] * len(flat))
+
+    fields, subfields, items = [], [''], list(ITEMS)
+    categories = list(CATEGORIES)
+    table = {
+        'article': np.array([r[0] for r in rows], dtype=np.int16),
+        'field': _codes([r[1] for r in rows], fields).astype(np.int8),
+        'subfield': _codes([r[2] for r in rows], subfields).astype(np.int8),
+        'item': _codes([r[2] or r[1] for r in rows], items).astype(np.int8),
+        'evaluator': np.array(row_evaluators, dtype=np.int8),
+        'category': _codes([r[3] for r in rows], categories).astype(np.int8)
+    }
+    if len(categories) > len(CATEGORIES):
+        raise ValueError(f"Unknown concordance categories: {categories[len(CATEGORIES):]}")
+
+    articles = np.unique(table['article'])
+    article_rows = np.searchsorted(articles, table['article'])
+    codes = np.full((len(articles), len(items), len(evaluators)), -1, dtype=np.int8)
+    codes[article_rows, table['item'], table['evaluator']] = table['category']
+
+    table.update({
+        'fields': fields,
+        'subfields': subfields,
+        'items': items,
+        'evaluators': evaluators,
+        'articles': articles,
+        'codes': codes
+    })
+    return table
+
+def load_classification_table(files: Optional[Dict[str, str]] = None) -> Dict:
+    """Convenience wrapper: load the evaluation files and build the table"""
+    analyses = {}
+    for evaluator, path in (files or DEFAULT_ANALYSIS_FILES).items():
+        with open(path, 'r', encoding='utf-8') as f:
+            analyses[evaluator] = json.load(f)
+    return build_classification_table(analyses)
+
+def discover_analysis_files(directory: str = 'analysis') -> Dict[str, str]:
+    """
+    {evaluator: path} of every analysis_<evaluator>.json in a directory
+    The paper's evaluators come first (in DEFAULT_ANALYSIS_FILES order), then the others alphabetically.
+    """
+    files = {}
+    for path in sorted(glob.glob(os.path.join(directory, ANALYSIS_PATTERN))):
+        files[os.path.basename(path)[len('analysis_'):-len('.json')]] = path
+    order = [e for e in DEFAULT_ANALYSIS_FILES if e in files] + [e for e in files if e not in DEFAULT_ANALYSIS_FILES]
+    return {evaluator: files[evaluator] for evaluator in order}
+
+def evaluator_name(evaluator: str) -> str:
+    return EVALUATOR_NAMES.get(evaluator, evaluator)
+
+def concordance_summary(table: Dict) -> Dict:
+    """
+    Category distributions and concordance groups of every evaluator and item in one pass
+
+    One bincount over (evaluator, item, category) gives the
+    (evaluators x items x categories) 'item_counts'; 'counts' are the
+    per-evaluator totals over items, and 'strong' / 'general' / 'totals'
+    the (evaluators x items) A+B, A+B+C and classification counts.
+    """
+    n_evaluators, n_items, n_categories = len(table['evaluators']), len(table['items']), len(CATEGORIES)
+    keys = (table['evaluator'].astype(np.int32) * n_items + table['item']) * n_categories + table['category']
+    item_counts = np.bincount(keys, minlength=n_evaluators * n_items * n_categories)
+    item_counts = item_counts.reshape(n_evaluators, n_items, n_categories)
+    return {
+        'evaluators': table['evaluators'],
+        'items': table['items'],
+        'articles': len(table['articles']),
+        'item_counts': item_counts,
+        'counts': item_counts.sum(axis=1),
+        'strong': item_counts[..., STRONG_CODES].sum(axis=2),
+        'general': item_counts[..., CONCORDANT_CODES].sum(axis=2),
+        'totals': item_counts.sum(axis=2)
+    }
+
+def evaluator_mask(table: Dict, evaluator: str) -> np.ndarray:
+    return table['evaluator'] == table['evaluators'].index(evaluator)
+
+def paired_codes(table: Dict, first: str, second: str) -> np.ndarray:
+    """
+    (n x 2) category codes of the classifications both evaluators made
+    (same article and item), ordered article by article
+    """
+    codes = table['codes'][:, :, [table['evaluators'].index(first), table['evaluators'].index(second)]]
+    pairs = codes.reshape(-1, 2)
+    return pairs[(pairs >= 0).all(axis=1)]
+
+def is_concordant(codes: np.ndarray) -> np.ndarray:
+    """General concordance (A+B+C) of category codes"""
+    return (codes >= 0) & (codes <= CONCORDANT_CODES[-1])
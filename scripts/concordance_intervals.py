@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+📏 CONCORDANCE CONFIDENCE INTERVALS - Infinity Research Paper
+=============================================================
+
+Bootstrap confidence intervals for the concordance rates of Tables 3.5 and
+3.6: Strong (A+B) and General (A+B+C) concordance of each evaluator, the
+General concordance of every scientific field, and the Claude - DeepSeek
+difference of each rate.
+
+Resampling is by article (the classifications of one article are not
+independent): each bootstrap replicate draws the articles with replacement,
+and the same draw is used for both evaluators so the difference is paired.
+Replicates are computed as matrix products of multinomial article weights
+with per-article counts, in chunks, so 10k+ resamples take well under a
+second here and memory stays bounded for large evaluation sets.
+
+Input: analysis/analysis_claude.json + analysis/analysis_deepseek.json
+Output: concordance_intervals.txt
+"""
+
+import argparse
+import time
+from typing import Dict, Tuple
+import numpy as np
+
+from classification_table import (CONCORDANT_CODES, DEFAULT_ANALYSIS_FILES, STRONG_CODES, evaluator_name,
+                                  load_classification_table)
+
+DEFAULT_RESAMPLES = 10000
+DEFAULT_CONFIDENCE = 0.95
+
+# Upper bound on resamples x articles weights held in memory at once
+CHUNK_CELLS = 1 << 22
+
+def article_counts(table: Dict, evaluator: str, codes: list) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-article (articles x items) counts of classifications in `codes` and of all classifications
+    """
+    cube = table['codes'][:, :, table['evaluators'].index(evaluator)]
+    hits = np.isin(cube, codes).astype(np.int32)
+    totals = (cube >= 0).astype(np.int32)
+    return hits, totals
+
+def bootstrap_rates(hits: np.ndarray, totals: np.ndarray, resamples: int = DEFAULT_RESAMPLES,
+                    seed: int = 0) -> np.ndarray:
+    """
+    (resamples x columns) ratio estimates sum(hits) / sum(totals) over articles drawn with replacement
+
+    hits/totals are (articles x columns) counts; all columns share each article draw.
+    """
+    n_articles = hits.shape[0]
+    rng = np.random.default_rng(seed)
+    chunk = max(1, CHUNK_CELLS // max(n_articles, 1))
+    uniform = np.full(n_articles, 1.0 / n_articles)
+    replicates = []
+    for start in range(0, resamples, chunk):
+        weights = rng.multinomial(n_articles, uniform, size=min(chunk, resamples - start)).astype(np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            replicates.append((weights @ hits) / (weights @ totals))
+    return np.vstack(replicates)
+
+def percentile_interval(replicates: np.ndarray, confidence: float = DEFAULT_CONFIDENCE) -> np.ndarray:
+    """(2 x columns) percentile interval of bootstrap replicates (NaN replicates ignored)"""
+    alpha = (1 - confidence) / 2
+    return np.nanquantile(replicates, [alpha, 1 - alpha], axis=0)
+
+def concordance_intervals(table: Dict, first: str = 'claude', second: str = 'deepseek',
+                          resamples: int = DEFAULT_RESAMPLES, confidence: float = DEFAULT_CONFIDENCE,
+                          seed: int = 0) -> Dict:
+    """
+    Point estimates and bootstrap intervals of every rate of both evaluators and of their difference
+
+    Rows: 'Strong (A+B)', 'General (A+B+C)' over all fields, then the General
+    concordance of each item (scientific field).
+    """
+    columns_hits, columns_totals = {}, {}
+    for evaluator in (first, second):
+        strong_hits, totals = article_counts(table, evaluator, STRONG_CODES)
+        general_hits, _ = article_counts(table, evaluator, CONCORDANT_CODES)
+        # Columns: overall strong, overall general, general per item
+        columns_hits[evaluator] = np.column_stack([strong_hits.sum(axis=1), general_hits.sum(axis=1), general_hits])
+        columns_totals[evaluator] = np.column_stack([totals.sum(axis=1), totals.sum(axis=1), totals])
+    labels = ['Strong (A+B)', 'General (A+B+C)'] + [f"General: {item}" for item in table['items']]
+
+    # One draw for both evaluators: stack their columns side by side
+    hits = np.hstack([columns_hits[first], columns_hits[second]])
+    totals = np.hstack([columns_totals[first], columns_totals[second]])
+    started = time.perf_counter()
+    replicates = bootstrap_rates(hits, totals, resamples, seed)
+    n = len(labels)
+    difference = replicates[:, :n] - replicates[:, n:]
+    elapsed = time.perf_counter() - started
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        point = hits.sum(axis=0) / totals.sum(axis=0)
+    rows = []
+    first_ci = percentile_interval(replicates[:, :n], confidence)
+    second_ci = percentile_interval(replicates[:, n:], confidence)
+    difference_ci = percentile_interval(difference, confidence)
+    for j, label in enumerate(labels):
+        rows.append({
+            'label': label,
+            'n': (int(totals[:, j].sum()), int(totals[:, n + j].sum())),
+            first: (point[j], first_ci[0, j], first_ci[1, j]),
+            second: (point[n + j], second_ci[0, j], second_ci[1, j]),
+            'difference': (point[j] - point[n + j], difference_ci[0, j], difference_ci[1, j])
+        })
+    return {'rows': rows, 'evaluators': (first, second), 'resamples': resamples, 'confidence': confidence,
+            'articles': len(table['articles']), 'seconds': elapsed}
+
+def _cell(estimate: Tuple[float, float, float], signed: bool = False) -> str:
+    point, low, high = (value * 100 for value in estimate)
+    sign = '+' if signed else ''
+    return f"{point:{sign}6.1f}% [{low:{sign}6.1f}, {high:{sign}6.1f}]"
+
+def generate_intervals_report(result: Dict) -> str:
+    """
+    Generate the concordance confidence interval table
+    """
+    first, second = result['evaluators']
+    confidence = result['confidence'] * 100
+    lines = [f"Concordance Rates with {confidence:.0f}% Bootstrap Confidence Intervals", ""]
+    lines.append(f"{result['resamples']:,} resamples of {result['articles']} articles (classifications of an article "
+                 f"resampled together, same draw for both evaluators).")
+    lines.append("")
+    first_name, second_name = (evaluator_name(e) for e in (first, second))
+    lines.append(f"| Rate                                                 | N       | {first_name:<24} | "
+                 f"{second_name:<24} | {'Difference':<24} |")
+    lines.append("|------------------------------------------------------|---------|--------------------------|"
+                 "--------------------------|--------------------------|")
+    for row in result['rows']:
+        n = f"{row['n'][0]}/{row['n'][1]}" if row['n'][0] != row['n'][1] else str(row['n'][0])
+        lines.append(f"| {row['label']:<52} | {n:<7} | {_cell(row[first])} | {_cell(row[second])} | "
+                     f"{_cell(row['difference'], signed=True)} |")
+    lines.append("")
+    lines.append(f"Difference = {first_name} - {second_name}; intervals that exclude 0 indicate a difference between the "
+                 f"evaluators at the {confidence:.0f}% level.")
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to bootstrap the concordance rates
+    """
+    parser = argparse.ArgumentParser(description="Article-level bootstrap intervals for concordance rates")
+    parser.add_argument('--resamples', type=int, default=DEFAULT_RESAMPLES)
+    parser.add_argument('--confidence', type=float, default=DEFAULT_CONFIDENCE)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='plots/concordance_intervals.txt')
+    args = parser.parse_args()
+
+    print("📏 INFINITY RESEARCH - Concordance Confidence Intervals")
+    print("=" * 50)
+
+    table = load_classification_table(DEFAULT_ANALYSIS_FILES)
+    print(f"📁 {len(table['category'])} classifications, {len(table['articles'])} articles")
+
+    result = concordance_intervals(table, resamples=args.resamples, confidence=args.confidence, seed=args.seed)
+    report = generate_intervals_report(result)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(report)
+
+    print(f"✅ {args.resamples:,} resamples in {result['seconds']:.2f}s")
+    print(f"\n{report}")
+    print(f"\n🎯 Confidence intervals complete!")
+    print(f"   📊 Report: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+🧾 CONFLICTS REPORT PARSER - Infinity Research Paper
+====================================================
+
+Single-pass parser for the conflict analysis report (analysis/conflicts.txt)
+written by the manual review. Each conflict becomes a structured record:
+
+    {'article': 4, 'field': 'Author_Year_StudyType', 'subfield': 'Year',
+     'category': 'D', 'scope': 'claude_only',
+     'classification': {'claude': 'Year=D'},
+     'explanation': {'claude': 'Different years (2024 vs 2023).'},
+     'resolution': 'Infinity correct (2024)', 'verdict': 'infinity'}
+
+The scope says which evaluator flagged the conflict (`claude_only`,
+`deepseek_only`, `both_models`); the verdict is read from the reviewer's
+resolution text: 'infinity', 'manual', 'both' (both extractions correct)
+or None while the conflict is unresolved. Records are indexed by article,
+field and category, and the resolution tables (4.7, 4.8) are counted from
+them, so they follow the report as reviewers resolve more conflicts.
+
+Input: analysis/conflicts.txt
+Output: conflict records (+ conflicts_records.json with --output)
+"""
+
+import argparse
+import json
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+DEFAULT_CONFLICTS_FILE = "analysis/conflicts.txt"
+
+# Conflict categories of the concordance scale
+CATEGORY_LABELS = {
+    'D': 'D (Factual)',
+    'E': 'E (Conceptual)',
+    'F': 'F (Incomparable)'
+}
+
+# Section header of the report -> scope of the records below it
+SCOPE_HEADERS = {
+    'Claude-only': 'claude_only',
+    'DeepSeek-only': 'deepseek_only',
+    'Both models agree': 'both_models'
+}
+SCOPES = ['claude_only', 'deepseek_only', 'both_models']
+
+# Report line prefix -> (kind, evaluator) of a record attribute (None: the model of a *-only scope)
+_ATTRIBUTES = {
+    'Description': ('classification', None),
+    'Explanation': ('explanation', None),
+    'Full classification': ('full_classification', 'claude'),
+    'Claude': ('classification', 'claude'),
+    'Claude explanation': ('explanation', 'claude'),
+    'DeepSeek': ('classification', 'deepseek'),
+    'DeepSeek explanation': ('explanation', 'deepseek')
+}
+
+_CATEGORY_HEADER = re.compile(r'^\S+\s+CATEGORY ([A-Z]) \(')
+_SCOPE_HEADER = re.compile(r'^\S+\s+(Claude-only|DeepSeek-only|Both models agree) \((\d+) instances?\):')
+_RECORD = re.compile(r'^\s*•\s*Article (\d+) - (.+?)\s*$')
+_ATTRIBUTE = re.compile(r'^\s+(Description|Explanation|Full classification|Claude|Claude explanation|'
+                        r'DeepSeek|DeepSeek explanation): ?(.*)$')
+_RESOLUTION = re.compile(r'^Resolution: ?(.*)$')
+_SUMMARY = re.compile(r'^(Claude-only conflicts|DeepSeek-only conflicts|Both models \(same category\)|'
+                      r'Both models \(different categories\)|Total unique conflicts): (\d+)')
+
+# Reviewer verdicts in the resolution text
+_BOTH_CORRECT = re.compile(r'\bboth\b(?:\s+\w+){0,2}\s+correct\b|\bboth approaches are defensible\b', re.IGNORECASE)
+_PARTY_VERDICT = re.compile(r'\b(infinity|manual)\b(?:\s+is)?\s+(partially\s+)?(in)?correct\b', re.IGNORECASE)
+_PARTY_MENTION = re.compile(r'\b(infinity|manual)\b', re.IGNORECASE)
+_PREFERRED = re.compile(r'\bmore (precise|accurate|complete)\b', re.IGNORECASE)
+
+def resolution_verdict(resolution: Optional[str]) -> Optional[str]:
+    """
+    'infinity', 'manual' or 'both' from a reviewer's resolution text (None if unresolved)
+
+    'Both correct' / 'Both factually correct' -> both; otherwise the first
+    verdict on each side ranks correct > partially correct > incorrect, and
+    equal positive verdicts mean both. Without a verdict, the side described
+    as 'more precise' wins.
+    """
+    if not resolution or not resolution.strip():
+        return None
+    if _BOTH_CORRECT.search(resolution):
+        return 'both'
+
+    rank = {}
+    for match in _PARTY_VERDICT.finditer(resolution):
+        party = match.group(1).lower()
+        if party not in rank:
+            rank[party] = 0 if match.group(3) else (1 if match.group(2) else 2)
+    if rank:
+        infinity, manual = rank.get('infinity', 0), rank.get('manual', 0)
+        if infinity == manual:
+            return 'both' if infinity else None
+        return 'infinity' if infinity > manual else 'manual'
+
+    # 'Manual: ... Infinity: ... (more precise)': the side whose text says so
+    mentions = list(_PARTY_MENTION.finditer(resolution))
+    for match, following in zip(mentions, mentions[1:] + [None]):
+        segment = resolution[match.end():following.start() if following else len(resolution)]
+        if _PREFERRED.search(segment):
+            return match.group(1).lower()
+    return None
+
+def _split_field(name: str, classification: str):
+    """'Author_Year_StudyType_Year' + 'Year=D' -> ('Author_Year_StudyType', 'Year', 'D')"""
+    subfield, _, category = classification.rpartition('=')
+    if subfield and name.endswith(f"_{subfield}"):
+        return name[:-len(subfield) - 1], subfield, category.strip()
+    return name, subfield or None, category.strip()
+
+def _finish(record: Dict) -> Dict:
+    record['resolution'] = "\n".join(record['resolution']).strip() or None
+    classification = next(iter(record['classification'].values()), '')
+    record['field'], record['subfield'], _ = _split_field(record['field'], classification)
+    record['verdict'] = resolution_verdict(record['resolution'])
+    return record
+
+def parse_conflicts_text(content: str) -> Dict:
+    """
+    Parse the report text in one pass
+    Returns {'records': [...], 'summary': {header line: count}}.
+    """
+    records, summary = [], {}
+    category, scope, record = None, None, None
+    in_resolution = False
+
+    for line in content.splitlines():
+        match = _SUMMARY.match(line)
+        if match:
+            summary[match.group(1)] = int(match.group(2))
+            continue
+        match = _CATEGORY_HEADER.match(line) or _SCOPE_HEADER.match(line) or _RECORD.match(line)
+        if match:
+            if record is not None:
+                records.append(_finish(record))
+                record = None
+            in_resolution = False
+            if match.re is _CATEGORY_HEADER:
+                category, scope = match.group(1), None
+            elif match.re is _SCOPE_HEADER:
+                scope = SCOPE_HEADERS[match.group(1)]
+            else:
+                record = {'article': int(match.group(1)), 'field': match.group(2), 'subfield': None,
+                          'category': category, 'scope': scope, 'classification': {}, 'explanation': {},
+                          'resolution': []}
+            continue
+        if record is None:
+            continue
+
+        match = _RESOLUTION.match(line)
+        if match:
+            in_resolution = True
+            record['resolution'].append(match.group(1))
+        elif in_resolution:
+            if line.strip():
+                record['resolution'].append(line.strip())
+            elif record['resolution']:
+                in_resolution = False
+        else:
+            match = _ATTRIBUTE.match(line)
+            if match:
+                kind, evaluator = _ATTRIBUTES[match.group(1)]
+                evaluator = evaluator or ('deepseek' if scope == 'deepseek_only' else 'claude')
+                if kind == 'full_classification':
+                    record['full_classification'] = match.group(2).strip()
+                else:
+                    record[kind][evaluator] = match.group(2).strip()
+
+    if record is not None:
+        records.append(_finish(record))
+    return {'records': records, 'summary': summary}
+
+def parse_conflicts_report(file_path: str = DEFAULT_CONFLICTS_FILE) -> Dict:
+    """Parse a conflicts report file (see parse_conflicts_text)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return parse_conflicts_text(f.read())
+
+def index_conflicts(records: List[Dict]) -> Dict[str, Dict]:
+    """Records grouped by 'article', 'field' and 'category'"""
+    index = {'article': defaultdict(list), 'field': defaultdict(list), 'category': defaultdict(list)}
+    for record in records:
+        for key in index:
+            index[key][record[key]].append(record)
+    return {key: dict(groups) for key, groups in index.items()}
+
+def resolution_counts(records: List[Dict], **criteria) -> Dict[str, int]:
+    """
+    Verdict counts of the records matching every criterion (e.g. scope='claude_only', category='D')
+    Returns {'total', 'infinity', 'manual', 'both', 'unresolved'}.
+    """
+    counts = {'total': 0, 'infinity': 0, 'manual': 0, 'both': 0, 'unresolved': 0}
+    for record in records:
+        if all(record.get(key) == value for key, value in criteria.items()):
+            counts['total'] += 1
+            counts[record['verdict'] or 'unresolved'] += 1
+    return counts
+
+def check_summary(parsed: Dict) -> List[str]:
+    """Differences between the report's summary statistics and the parsed records"""
+    expected = {
+        'Claude-only conflicts': 'claude_only',
+        'DeepSeek-only conflicts': 'deepseek_only',
+        'Both models (same category)': 'both_models'
+    }
+    issues = []
+    for header, scope in expected.items():
+        parsed_count = resolution_counts(parsed['records'], scope=scope)['total']
+        if header in parsed['summary'] and parsed['summary'][header] != parsed_count:
+            issues.append(f"{header}: summary says {parsed['summary'][header]}, parsed {parsed_count}")
+    total = parsed['summary'].get('Total unique conflicts')
+    if total is not None and total != len(parsed['records']):
+        issues.append(f"Total unique conflicts: summary says {total}, parsed {len(parsed['records'])}")
+    return issues
+
+def main():
+    """
+    Main function to parse the conflicts report and summarize the resolutions
+    """
+    parser = argparse.ArgumentParser(description="Parse analysis/conflicts.txt into structured records")
+    parser.add_argument('--conflicts-file', default=DEFAULT_CONFLICTS_FILE)
+    parser.add_argument('--output', help="write the records as JSON here")
+    args = parser.parse_args()
+
+    print("🧾 INFINITY RESEARCH - Conflicts Report Parser")
+    print("=" * 50)
+
+    parsed = parse_conflicts_report(args.conflicts_file)
+    records = parsed['records']
+    index = index_conflicts(records)
+    print(f"📁 {len(records)} conflicts in {len(index['article'])} articles, {len(index['field'])} fields")
+    for issue in check_summary(parsed):
+        print(f"   ⚠️ {issue}")
+
+    for scope in SCOPES:
+        for category, label in CATEGORY_LABELS.items():
+            counts = resolution_counts(records, scope=scope, category=category)
+            if counts['total']:
+                print(f"   {scope:<14} {label:<17} {counts['total']:3d}: infinity {counts['infinity']}, "
+                      f"manual {counts['manual']}, both {counts['both']}, unresolved {counts['unresolved']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+        print(f"✅ Records saved to {args.output}")
+
+    print(f"\n🎯 Conflicts parsing complete!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+🧑‍⚖️ INTER-EVALUATOR AGREEMENT - Infinity Research Paper
+========================================================
+
+Item-level agreement between the Claude 3.5 Sonnet and DeepSeek V3
+classifications: both evaluators are aligned on the same (article, field)
+items of the classification table, so the statistics show where they
+disagree on the same comparison rather than only how their marginal
+category counts differ (Table 3.5):
+
+- confusion matrix over categories A-F (rows: first evaluator)
+- Cohen's kappa, unweighted and weighted (linear / quadratic weights on the
+  A-F scale, i.e. A-F treated as ordered from equivalent to incomparable)
+- kappa on the binary General concordance decision (A-C vs D-F)
+- per-field kappa and observed agreement
+
+All statistics come from one bincount over first * 6 + second codes
+(per field: field * 36 + first * 6 + second) and are computed on the
+(fields x 6 x 6) confusion cube at once.
+
+Input: analysis/analysis_<model>.json (default pair: claude, deepseek)
+Output: evaluator_agreement_table.txt
+"""
+
+import argparse
+from typing import Dict, Optional
+import numpy as np
+
+from classification_table import (CATEGORIES, CONCORDANT_CODES, discover_analysis_files, evaluator_name,
+                                  load_classification_table)
+
+def aligned_codes(table: Dict, first: str, second: str):
+    """
+    Category codes of both evaluators on the items both classified
+    Returns (first_codes, second_codes, item_codes).
+    """
+    codes = table['codes'][:, :, [table['evaluators'].index(first), table['evaluators'].index(second)]]
+    items = np.broadcast_to(np.arange(codes.shape[1]), codes.shape[:2])
+    both = (codes >= 0).all(axis=2)
+    return codes[..., 0][both], codes[..., 1][both], items[both]
+
+def confusion_matrices(first: np.ndarray, second: np.ndarray, groups: Optional[np.ndarray] = None,
+                       n_groups: int = 1, n_categories: int = len(CATEGORIES)) -> np.ndarray:
+    """(groups x categories x categories) confusion counts from one bincount"""
+    groups = np.zeros(len(first), dtype=np.int64) if groups is None else groups.astype(np.int64)
+    keys = (groups * n_categories + first) * n_categories + second
+    counts = np.bincount(keys, minlength=n_groups * n_categories * n_categories)
+    return counts.reshape(n_groups, n_categories, n_categories)
+
+def disagreement_weights(n_categories: int, kind: str) -> np.ndarray:
+    """0 on the diagonal; 'unweighted' 1 elsewhere, 'linear' |i-j|/(k-1), 'quadratic' squared"""
+    i, j = np.indices((n_categories, n_categories))
+    distance = np.abs(i - j) / (n_categories - 1)
+    if kind == 'linear':
+        return distance
+    if kind == 'quadratic':
+        return distance ** 2
+    return (i != j).astype(float)
+
+def cohen_kappa(confusion: np.ndarray, kind: str = 'unweighted') -> np.ndarray:
+    """
+    Cohen's kappa of each (categories x categories) matrix of a (groups x k x k) cube
+    NaN when chance disagreement is zero (e.g. both evaluators always chose the same category).
+    """
+    confusion = confusion.astype(float)
+    n = confusion.sum(axis=(1, 2))
+    weights = disagreement_weights(confusion.shape[1], kind)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        observed = confusion / n[:, None, None]
+        expected = observed.sum(axis=2)[:, :, None] * observed.sum(axis=1)[:, None, :]
+        observed_disagreement = (weights * observed).sum(axis=(1, 2))
+        expected_disagreement = (weights * expected).sum(axis=(1, 2))
+        kappa = 1 - observed_disagreement / expected_disagreement
+    return np.where(expected_disagreement > 0, kappa, np.nan)
+
+def observed_agreement(confusion: np.ndarray) -> np.ndarray:
+    n = confusion.sum(axis=(1, 2))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.trace(confusion, axis1=1, axis2=2) / n
+
+def binary_confusion(confusion: np.ndarray) -> np.ndarray:
+    """Collapse A-F confusion matrices to General concordance (A-C) vs D-F"""
+    concordant = np.isin(np.arange(confusion.shape[1]), CONCORDANT_CODES)
+    collapse = np.column_stack([concordant, ~concordant]).astype(int)
+    return np.einsum('ia,gij,jb->gab', collapse, confusion, collapse)
+
+def evaluator_agreement(table: Dict, first: str = 'claude', second: str = 'deepseek') -> Dict:
+    """
+    Confusion matrices and kappa statistics, overall and per field
+    """
+    first_codes, second_codes, item_codes = aligned_codes(table, first, second)
+    overall = confusion_matrices(first_codes, second_codes)
+    per_item = confusion_matrices(first_codes, second_codes, item_codes, len(table['items']))
+    stats = {}
+    for name, confusion in (('overall', overall), ('items', per_item)):
+        stats[name] = {
+            'n': confusion.sum(axis=(1, 2)),
+            'agreement': observed_agreement(confusion),
+            'kappa': cohen_kappa(confusion),
+            'kappa_linear': cohen_kappa(confusion, 'linear'),
+            'kappa_quadratic': cohen_kappa(confusion, 'quadratic'),
+            'kappa_binary': cohen_kappa(binary_confusion(confusion)),
+            'agreement_binary': observed_agreement(binary_confusion(confusion))
+        }
+    return {'evaluators': (first, second), 'items': table['items'], 'confusion': overall[0],
+            'item_confusion': per_item, 'stats': stats}
+
+def _kappa(value: float) -> str:
+    return f"{value:6.3f}" if np.isfinite(value) else f"{'n/a':>6}"
+
+def landis_koch(kappa: float) -> str:
+    """Landis & Koch (1977) strength of agreement"""
+    if not np.isfinite(kappa):
+        return "n/a"
+    for bound, label in ((0, "poor"), (0.2, "slight"), (0.4, "fair"), (0.6, "moderate"), (0.8, "substantial")):
+        if kappa <= bound:
+            return label
+    return "almost perfect"
+
+def generate_agreement_table(result: Dict) -> str:
+    """
+    Generate the inter-evaluator agreement table
+    """
+    first, second = (evaluator_name(e) for e in result['evaluators'])
+    confusion = result['confusion']
+    overall = {key: values[0] for key, values in result['stats']['overall'].items()}
+
+    lines = [f"Inter-Evaluator Agreement: {first} vs {second}", ""]
+    lines.append(f"{int(overall['n'])} items classified by both evaluators (rows: {first}, columns: {second}).")
+    lines.append("")
+    lines.append("|       | " + " | ".join(f"{c:>3}" for c in CATEGORIES) + " | Total |")
+    lines.append("|-------|" + "|".join("-----" for _ in CATEGORIES) + "|-------|")
+    for i, category in enumerate(CATEGORIES):
+        lines.append(f"| {category:<5} | " + " | ".join(f"{v:3d}" for v in confusion[i]) + f" | {confusion[i].sum():5d} |")
+    lines.append("| Total | " + " | ".join(f"{v:3d}" for v in confusion.sum(axis=0)) + f" | {confusion.sum():5d} |")
+    lines.append("")
+    lines.append(f"Observed agreement (same category): {overall['agreement'] * 100:.1f}%")
+    lines.append(f"Cohen's kappa: {overall['kappa']:.3f} ({landis_koch(overall['kappa'])}); "
+                 f"linear weighted {overall['kappa_linear']:.3f}; quadratic weighted {overall['kappa_quadratic']:.3f}")
+    lines.append(f"General concordance decision (A-C vs D-F): {overall['agreement_binary'] * 100:.1f}% agreement, "
+                 f"kappa {overall['kappa_binary']:.3f} ({landis_koch(overall['kappa_binary'])})")
+    lines.append("")
+
+    # Largest off-diagonal cells: where the evaluators disagree on the same item
+    off_diagonal = [(confusion[i, j], CATEGORIES[i], CATEGORIES[j]) for i in range(len(CATEGORIES))
+                    for j in range(len(CATEGORIES)) if i != j and confusion[i, j]]
+    off_diagonal.sort(key=lambda cell: -cell[0])
+    lines.append("Most frequent disagreements: " +
+                 ", ".join(f"{a}->{b} {count}" for count, a, b in off_diagonal[:6]))
+    lines.append("")
+
+    items = result['stats']['items']
+    lines.append("| Scientific Field                            |  N | Agreement | Kappa  | Linear | Quadr. | A-C vs D-F kappa |")
+    lines.append("|---------------------------------------------|----|-----------|--------|--------|--------|------------------|")
+    for j, item in enumerate(result['items']):
+        if not items['n'][j]:
+            continue
+        lines.append(f"| {item:<43} | {int(items['n'][j]):2d} | {items['agreement'][j] * 100:8.1f}% | "
+                     f"{_kappa(items['kappa'][j])} | {_kappa(items['kappa_linear'][j])} | "
+                     f"{_kappa(items['kappa_quadratic'][j])} | {_kappa(items['kappa_binary'][j]):>16} |")
+    lines.append("")
+    lines.append("n/a: kappa is undefined when chance agreement is 100% (both evaluators used a single category).")
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to compute inter-evaluator agreement
+    """
+    parser = argparse.ArgumentParser(description="Confusion matrix and Cohen's kappa between the two evaluators")
+    parser.add_argument('--analysis-dir', default='analysis', help="Directory of analysis_<model>.json files")
+    parser.add_argument('--first', default='claude')
+    parser.add_argument('--second', default='deepseek')
+    parser.add_argument('--output', default='plots/evaluator_agreement_table.txt')
+    args = parser.parse_args()
+
+    print("🧑‍⚖️ INFINITY RESEARCH - Inter-Evaluator Agreement")
+    print("=" * 50)
+
+    table = load_classification_table(discover_analysis_files(args.analysis_dir))
+    for evaluator in (args.first, args.second):
+        if evaluator not in table['evaluators']:
+            parser.error(f"no analysis_{evaluator}.json in {args.analysis_dir} "
+                         f"(evaluators: {', '.join(table['evaluators'])})")
+    result = evaluator_agreement(table, args.first, args.second)
+    report = generate_agreement_table(result)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(report)
+
+    print(f"\n{report}")
+    print(f"\n🎯 Inter-evaluator agreement complete!")
+    print(f"   📊 Table: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+⚖️ EVALUATOR SIGNIFICANCE TESTS - Infinity Research Paper
+=========================================================
+
+Paired significance tests of the concordance differences between evaluators,
+overall and per scientific field (the rows of Table 3.6), for the Strong
+(A+B) and General (A+B+C) concordance flags of each item:
+
+- exact McNemar test on the discordant pairs (b: only the first evaluator
+  concordant, c: only the second), two-sided binomial p-value
+- paired permutation test of the rate difference, flipping the evaluator
+  labels article by article (classifications of an article move together)
+
+Every (evaluator pair, field, concordance level) test is one row of a
+(tests x articles) difference matrix: McNemar p-values come from one
+vectorized binomial CDF, and the permutations are random sign matrices
+multiplied with it in chunks, so all evaluator pairs of the registry are
+tested in one pass.
+
+Input: analysis/analysis_<model>.json (claude, deepseek, ...)
+Output: evaluator_significance_table.txt
+"""
+
+import argparse
+import itertools
+from typing import Dict, List, Tuple
+import numpy as np
+
+from classification_table import (CONCORDANT_CODES, STRONG_CODES, discover_analysis_files, evaluator_name,
+                                  load_classification_table)
+
+DEFAULT_PERMUTATIONS = 10000
+SIGNIFICANCE_LEVEL = 0.05
+
+# Upper bound on permutations x articles signs held in memory at once
+CHUNK_CELLS = 1 << 22
+
+LEVELS = [('Strong (A+B)', STRONG_CODES), ('General (A+B+C)', CONCORDANT_CODES)]
+
+def _scoped(flags: np.ndarray) -> np.ndarray:
+    """(articles x items) -> (articles x scopes): overall column, then one column per item"""
+    return np.column_stack([flags.sum(axis=1), flags]).astype(np.int64)
+
+def build_tests(table: Dict, pairs: List[Tuple[str, str]]) -> Dict:
+    """
+    Discordant counts and per-article concordance differences of every test
+
+    Tests are ordered pair -> level -> scope, scope 'Overall' then each item.
+    'difference' is (tests x articles): first minus second concordant count of the
+    article's items in scope that both evaluators classified.
+    """
+    codes = table['codes']
+    scopes = ['Overall'] + list(table['items'])
+    rows = {'pair': [], 'level': [], 'scope': []}
+    b, c, n, first_hits, second_hits, difference = [], [], [], [], [], []
+    for first, second in pairs:
+        i, j = table['evaluators'].index(first), table['evaluators'].index(second)
+        both = (codes[:, :, i] >= 0) & (codes[:, :, j] >= 0)
+        for level, level_codes in LEVELS:
+            flags_first = np.isin(codes[:, :, i], level_codes) & both
+            flags_second = np.isin(codes[:, :, j], level_codes) & both
+            only_first, only_second = _scoped(flags_first & ~flags_second), _scoped(flags_second & ~flags_first)
+            b.append(only_first.sum(axis=0))
+            c.append(only_second.sum(axis=0))
+            n.append(_scoped(both).sum(axis=0))
+            first_hits.append(_scoped(flags_first).sum(axis=0))
+            second_hits.append(_scoped(flags_second).sum(axis=0))
+            difference.append((only_first - only_second).T)
+            rows['pair'] += [(first, second)] * len(scopes)
+            rows['level'] += [level] * len(scopes)
+            rows['scope'] += scopes
+    return dict(rows, b=np.concatenate(b), c=np.concatenate(c), n=np.concatenate(n),
+                first_hits=np.concatenate(first_hits), second_hits=np.concatenate(second_hits),
+                difference=np.vstack(difference))
+
+def mcnemar_exact(b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Two-sided exact McNemar p-values: 2 * P(X <= min(b, c)), X ~ Binomial(b + c, 1/2), capped at 1
+    """
+    discordant = b + c
+    n_max = int(discordant.max()) if len(discordant) else 0
+    log_factorial = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, n_max + 1)))])
+    k = np.arange(n_max + 1)
+    # (tests x k) binomial(n, 1/2) pmf, zero beyond n
+    valid = k[None, :] <= discordant[:, None]
+    n_k = np.where(valid, discordant[:, None] - k[None, :], 0)
+    log_pmf = log_factorial[discordant][:, None] - log_factorial[k][None, :] - log_factorial[n_k] \
+        - discordant[:, None] * np.log(2)
+    pmf = np.where(valid, np.exp(log_pmf), 0.0)
+    tail = np.where(k[None, :] <= np.minimum(b, c)[:, None], pmf, 0.0).sum(axis=1)
+    return np.where(discordant > 0, np.minimum(1.0, 2 * tail), 1.0)
+
+def permutation_pvalues(difference: np.ndarray, permutations: int = DEFAULT_PERMUTATIONS,
+                        seed: int = 0) -> np.ndarray:
+    """
+    Two-sided paired permutation p-values of the summed differences of every test row
+
+    Each permutation flips the evaluator labels of each article at random, i.e. multiplies
+    its difference by +-1; all tests share the same sign draws. p = (1 + #|perm| >= |obs|) / (1 + permutations).
+    """
+    rng = np.random.default_rng(seed)
+    observed = np.abs(difference.sum(axis=1))
+    n_articles = difference.shape[1]
+    chunk = max(1, CHUNK_CELLS // max(n_articles, 1))
+    extreme = np.zeros(len(difference), dtype=np.int64)
+    weights = difference.T.astype(np.float64)
+    for start in range(0, permutations, chunk):
+        signs = rng.choice(np.array([-1.0, 1.0]), size=(min(chunk, permutations - start), n_articles))
+        # Small tolerance: statistics are integer sums computed in floating point
+        extreme += (np.abs(signs @ weights) >= observed - 1e-9).sum(axis=0)
+    return (1 + extreme) / (1 + permutations)
+
+def evaluator_significance(table: Dict, pairs: List[Tuple[str, str]] = None,
+                           permutations: int = DEFAULT_PERMUTATIONS, seed: int = 0) -> Dict:
+    """
+    McNemar and permutation p-values of every evaluator pair (default: all pairs of the table)
+    """
+    pairs = pairs or list(itertools.combinations(table['evaluators'], 2))
+    tests = build_tests(table, pairs)
+    tests['mcnemar'] = mcnemar_exact(tests['b'], tests['c'])
+    tests['permutation'] = permutation_pvalues(tests['difference'], permutations, seed)
+    tests['permutations'] = permutations
+    tests['pairs'] = pairs
+    return tests
+
+def _p(value: float) -> str:
+    marker = '*' if value < SIGNIFICANCE_LEVEL else ' '
+    return f"{value:6.4f}{marker}" if value >= 0.0001 else f"<0.0001{marker}"
+
+def significance_legend(tests: Dict) -> List[str]:
+    return [f"Exact McNemar (b: only first concordant, c: only second) and paired permutation test "
+            f"({tests['permutations']:,} article-level label flips).",
+            f"* p < {SIGNIFICANCE_LEVEL}; no correction for multiple comparisons."]
+
+def significance_block(tests: Dict, pair: Tuple[str, str], level: str) -> List[str]:
+    """Title and table lines of one evaluator pair and concordance level (Overall, then each field)"""
+    first, second = (evaluator_name(e) for e in pair)
+    rows = [t for t in range(len(tests['scope'])) if tests['pair'][t] == pair and tests['level'][t] == level]
+    lines = [f"{level}: {first} vs {second}", ""]
+    lines.append(f"| {'Scientific Field':<43} | {'N':>3} | {first[:17]:<17} | {second[:17]:<17} | "
+                 f"  b |   c | McNemar p | Permutation p |")
+    lines.append(f"|{'-' * 45}|-----|-------------------|-------------------|-----|-----|-----------|"
+                 f"---------------|")
+    for t in rows:
+        n = tests['n'][t]
+        first_rate = tests['first_hits'][t] / n * 100 if n else 0.0
+        second_rate = tests['second_hits'][t] / n * 100 if n else 0.0
+        lines.append(f"| {tests['scope'][t]:<43} | {n:3d} | {first_rate:5.1f}% ({tests['first_hits'][t]:3d})"
+                     f"      | {second_rate:5.1f}% ({tests['second_hits'][t]:3d})      | {tests['b'][t]:3d} | "
+                     f"{tests['c'][t]:3d} | {_p(tests['mcnemar'][t]):>9} | {_p(tests['permutation'][t]):>13} |")
+    return lines
+
+def generate_significance_table(tests: Dict) -> str:
+    """
+    Generate the paired significance table (one block per evaluator pair and concordance level)
+    """
+    lines = ["Paired Significance Tests of Concordance Between Evaluators", ""] + significance_legend(tests)
+    for pair in tests['pairs']:
+        for level, _ in LEVELS:
+            lines += [""] + significance_block(tests, pair, level)
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to run the paired significance tests
+    """
+    parser = argparse.ArgumentParser(description="McNemar and permutation tests between evaluators")
+    parser.add_argument('--analysis-dir', default='analysis', help="Directory of analysis_<model>.json files")
+    parser.add_argument('--permutations', type=int, default=DEFAULT_PERMUTATIONS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='plots/evaluator_significance_table.txt')
+    args = parser.parse_args()
+
+    print("⚖️ INFINITY RESEARCH - Evaluator Significance Tests")
+    print("=" * 50)
+
+    table = load_classification_table(discover_analysis_files(args.analysis_dir))
+    tests = evaluator_significance(table, permutations=args.permutations, seed=args.seed)
+    print(f"✅ {len(tests['scope'])} tests ({len(tests['pairs'])} evaluator pairs), "
+          f"{args.permutations:,} permutations each")
+
+    report = generate_significance_table(tests)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(report)
+
+    print(f"\n{report}")
+    print(f"\n🎯 Significance tests complete!")
+    print(f"   📊 Table: {args.output}")
+
+if __name__ == "__main__":
+    main()
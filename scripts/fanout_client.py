@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""
+🌐 API FAN-OUT CLIENT - Infinity Research Paper
+===============================================
+
+asyncio client for the 11 bibliographic API sources, built for a fan-out
+whose latency is bounded by the slowest source:
+
+- per-source pool of keep-alive HTTP/1.1 connections
+- per-source concurrency caps (pool size)
+- adaptive per-source timeouts (EWMA of latency and deviation, like TCP's
+  RTO: srtt + 4 * rttvar, clamped, doubled after each timeout until the
+  next answer). Latency is measured from the moment a pooled connection
+  is acquired, so time queued behind the concurrency cap neither counts
+  against the timeout nor feeds the estimator
+- optional hedged requests: a slow request gets a duplicate on a second
+  connection after srtt + 2 * rttvar; the first answer wins
+- 429 responses are retried after Retry-After (seconds or HTTP-date) within
+  the timeout budget; a wait that does not fit is reported as rate limited,
+  not as a timeout, and leaves the adaptive timeout unchanged
+- optional on-disk response cache (scripts/response_cache.py); per-article
+  hit/miss counters are stored under the `_cache` key
+- pre-flight skip rules and a negative cache (scripts/preflight_rules.py):
+  calls that cannot succeed are not made and are recorded with a distinct
+  `status` (`skipped_missing_identifier`, `skipped_rule`,
+  `skipped_negative_cache`); per-article counts go under `_preflight`
+
+The script exits with status 1 when every request made fails (e.g. the
+server refuses connections).
+
+Results are written in the exact `apis_raw_json.json` shape
+(`data`/`error`, `success`, `timestamp`, `processing_time_ms`). Requests
+follow the replay server routes (`GET /<source>?doi=...`), so the client can
+be benchmarked offline against scripts/replay_server.py.
+
+Input: Vision extractions (DOI/PMID/Title) from json/Article_XX/
+Output: <output-dir>/Article_XX/apis_raw_json.json + fanout_report.txt
+
+Example:
+    python scripts/replay_server.py --mode sampled --time-scale 0.1 &
+    python scripts/fanout_client.py --base-url http://127.0.0.1:8765 --hedge
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from article_metrics import API_SOURCES, load_article_jsons
+from preflight_rules import PreflightRules, article_identifiers, is_structural_error
+from response_cache import DEFAULT_CACHE_PATH, ResponseCache
+from simulate_pipeline import format_duration, parse_source_overrides
+
+class AdaptiveTimeout:
+    """
+    Per-source timeout from an EWMA of observed latencies (Jacobson/Karels)
+    """
+
+    ALPHA = 0.125
+    BETA = 0.25
+
+    def __init__(self, initial: float, minimum: float, maximum: float):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.initial = initial
+        self.srtt: Optional[float] = None
+        self.rttvar = 0.0
+        self.samples = 0
+        self.backoff = 1
+
+    def observe(self, seconds: float):
+        if self.srtt is None:
+            self.srtt, self.rttvar = seconds, seconds / 2
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - seconds)
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * seconds
+        self.samples += 1
+        self.backoff = 1
+
+    def expired(self):
+        """A request timed out: double the timeout until the next answer (TCP RTO backoff)"""
+        if self.timeout < self.maximum:
+            self.backoff *= 2
+
+    @property
+    def timeout(self) -> float:
+        base = self.initial if self.srtt is None else max(self.minimum, self.srtt + 4 * self.rttvar)
+        return min(self.maximum, base * self.backoff)
+
+    @property
+    def hedge_delay(self) -> Optional[float]:
+        """Delay before a duplicate request (None until enough samples)"""
+        if self.srtt is None or self.samples < 3:
+            return None
+        return min(self.timeout, self.srtt + 2 * self.rttvar)
+
+class HTTPConnection:
+    """One keep-alive HTTP/1.1 connection (asyncio streams)"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str):
+        self.reader = reader
+        self.writer = writer
+        self.host = host
+
+    @classmethod
+    async def open(cls, host: str, port: int) -> 'HTTPConnection':
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer, host)
+
+    async def get(self, path: str) -> Tuple[int, Dict[str, str], bytes]:
+        self.writer.write(f"GET {path} HTTP/1.1\r\nHost: {self.host}\r\nConnection: keep-alive\r\n"
+                          f"Accept: application/json\r\n\r\n".encode('latin-1'))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by server")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        body = await self.reader.readexactly(int(headers.get('content-length', 0)))
+        return status, headers, body
+
+    def close(self):
+        self.writer.close()
+
+class SourcePool:
+    """
+    Connection pool and concurrency cap for one source
+    """
+
+    def __init__(self, source: str, host: str, port: int, size: int, timeout: AdaptiveTimeout):
+        self.source = source
+        self.host = host
+        self.port = port
+        self.size = size
+        self.slots = asyncio.Semaphore(size)
+        self.idle: List[HTTPConnection] = []
+        self.timeout = timeout
+        self.stats = {'requests': 0, 'timeouts': 0, 'hedges': 0, 'hedges_won': 0, 'retries_429': 0,
+                      'connections_opened': 0, 'queued_seconds': 0.0}
+
+    async def acquire(self) -> HTTPConnection:
+        queued = time.perf_counter()
+        await self.slots.acquire()
+        self.stats['queued_seconds'] += time.perf_counter() - queued
+        if self.idle:
+            return self.idle.pop()
+        try:
+            self.stats['connections_opened'] += 1
+            return await HTTPConnection.open(self.host, self.port)
+        except BaseException:
+            self.slots.release()
+            raise
+
+    def release(self, connection: HTTPConnection, reusable: bool):
+        if reusable:
+            self.idle.append(connection)
+        else:
+            connection.close()
+        self.slots.release()
+
+    async def request_once(self, path: str, timeout: float,
+                           acquired: Optional[asyncio.Event] = None) -> Tuple[int, Dict[str, str], bytes, float]:
+        """
+        One request on a pooled connection, timed from the moment the connection is acquired
+        Returns (status, headers, body, seconds); the timeout only covers the request itself.
+        Broken, timed-out or cancelled connections are dropped.
+        """
+        connection = await self.acquire()
+        started = time.perf_counter()
+        if acquired is not None:
+            acquired.set()
+        reusable = False
+        try:
+            status, headers, body = await asyncio.wait_for(connection.get(path), timeout)
+            reusable = headers.get('connection', '').lower() != 'close'
+            return status, headers, body, time.perf_counter() - started
+        finally:
+            self.release(connection, reusable)
+
+    async def request(self, path: str, hedge: bool, timeout: float) -> Tuple[int, Dict[str, str], bytes, float]:
+        """
+        Request with optional hedging: a duplicate is started once the primary
+        has held its connection for the hedge delay, and the first response
+        wins (the loser is cancelled)
+        """
+        self.stats['requests'] += 1
+        delay = self.timeout.hedge_delay if hedge else None
+        acquired = asyncio.Event()
+        primary = asyncio.ensure_future(self.request_once(path, timeout, acquired))
+        if delay is None:
+            return await primary
+
+        waiting = asyncio.ensure_future(acquired.wait())
+        await asyncio.wait({primary, waiting}, return_when=asyncio.FIRST_COMPLETED)
+        waiting.cancel()
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        self.stats['hedges'] += 1
+        backup = asyncio.ensure_future(self.request_once(path, max(0.0, timeout - delay)))
+        pending = {primary, backup}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self.stats['hedges_won'] += 1
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self):
+        for connection in self.idle:
+            connection.close()
+        self.idle.clear()
+
+def build_query(source: str, identifiers: Dict) -> str:
+    """Request path for one source (replay server routes)"""
+    for key in ('DOI', 'PMID', 'Title'):
+        if identifiers.get(key):
+            return f"/{source}?{urlencode({key.lower(): str(identifiers[key])})}"
+    return f"/{source}/{identifiers['folder']}"
+
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date; default if absent or invalid)"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return default
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+class RateLimited(Exception):
+    """429 whose Retry-After wait does not fit in the remaining timeout budget"""
+
+class FanoutClient:
+    """
+    Fan-out of one article to all sources with per-source pools
+    """
+
+    def __init__(self, base_url: str, concurrency: Dict[str, int], default_concurrency: int = 4,
+                 hedge: bool = False, initial_timeout: float = 30.0, min_timeout: float = 1.0,
+                 max_timeout: float = 60.0, sources: Optional[List[str]] = None,
+                 cache: Optional[ResponseCache] = None, preflight: Optional[PreflightRules] = None):
+        url = urlsplit(base_url)
+        self.hedge = hedge
+        self.cache = cache
+        self.preflight = preflight
+        self.sources = sources or API_SOURCES
+        self.pools = {
+            source: SourcePool(source, url.hostname or '127.0.0.1', url.port or 80,
+                               concurrency.get(source, default_concurrency),
+                               AdaptiveTimeout(initial_timeout, min_timeout, max_timeout))
+            for source in self.sources
+        }
+
+    async def fetch_source(self, source: str, identifiers: Dict) -> Tuple[Dict, bool]:
+        """
+        Query one source; returns an apis_raw_json entry and whether it came from the cache
+        """
+        pool = self.pools[source]
+        path = build_query(source, identifiers)
+        started = time.perf_counter()
+
+        skip = self.preflight.check(source, identifiers) if self.preflight is not None else None
+        if skip is None and self.cache is not None:
+            negative = self.cache.get_negative(source, identifiers)
+            if negative is not None:
+                seen = datetime.fromtimestamp(negative[1]).isoformat(timespec='seconds')
+                skip = 'skipped_negative_cache', f"Skipped: '{negative[0]}' on {seen}"
+        if skip is not None:
+            return {'error': skip[1], 'success': False, 'status': skip[0],
+                    'timestamp': datetime.now().isoformat(), 'processing_time_ms': 0}, False
+
+        if self.cache is not None:
+            cached = self.cache.get(source, identifiers)
+            if cached is not None:
+                return {'data': cached, 'success': True, 'timestamp': datetime.now().isoformat(),
+                        'processing_time_ms': int((time.perf_counter() - started) * 1000)}, True
+        # Timeout budget: time spent on connections and Retry-After waits (not queueing for a slot)
+        budget = pool.timeout.timeout
+        spent = 0.0
+
+        try:
+            while True:
+                if budget - spent <= 0:
+                    raise asyncio.TimeoutError
+                status, headers, body, seconds = await pool.request(path, self.hedge, budget - spent)
+                spent += seconds
+                if status != 429:
+                    break
+                # Rate limited: wait for Retry-After if it fits in the timeout budget
+                pool.stats['retries_429'] += 1
+                retry_after = parse_retry_after(headers.get('retry-after'))
+                if spent + retry_after >= budget:
+                    raise RateLimited(f"HTTP 429: Retry-After {retry_after:.1f}s exceeds the {budget:.1f}s budget")
+                await asyncio.sleep(retry_after)
+                spent += retry_after
+
+            pool.timeout.observe(seconds)
+            payload = json.loads(body.decode('utf-8')) if body else {}
+            if status == 200 and payload.get('success', True):
+                result = {'data': payload.get('data')}
+                result['success'] = True
+                if self.cache is not None:
+                    self.cache.put(source, identifiers, result['data'])
+            else:
+                result = {'error': payload.get('error') or f"HTTP {status}", 'success': False}
+                if self.cache is not None and is_structural_error(result['error']):
+                    self.cache.put_negative(source, identifiers, result['error'])
+        except asyncio.TimeoutError:
+            pool.stats['timeouts'] += 1
+            result = {'error': f"Timeout after {budget:.1f}s", 'success': False}
+            pool.timeout.expired()
+            spent = budget
+        except RateLimited as e:
+            result = {'error': f"Rate limited ({e})", 'success': False}
+        except (ConnectionError, OSError, ValueError, asyncio.IncompleteReadError) as e:
+            result = {'error': f"Request failed: {e}", 'success': False}
+
+        # Time on the connection (+ Retry-After waits); queueing is reported per pool
+        result['timestamp'] = datetime.now().isoformat()
+        result['processing_time_ms'] = int(spent * 1000)
+        return result, False
+
+    async def fetch_article(self, identifiers: Dict) -> Dict:
+        """All sources for one article, in apis_raw_json key order (+ '_cache' counters)"""
+        fetched = await asyncio.gather(*[self.fetch_source(s, identifiers) for s in self.sources])
+        results = {source: entry for source, (entry, _) in zip(self.sources, fetched)}
+        skipped = {source: entry['status'] for source, entry in results.items() if 'status' in entry}
+        if self.cache is None and self.preflight is None:
+            return results
+
+        results['_preflight'] = {'skipped': len(skipped), 'skipped_sources': skipped}
+        if self.cache is None:
+            return results
+
+        hit_sources = [source for source, (_, cached) in zip(self.sources, fetched) if cached]
+        results['_cache'] = {
+            'hits': len(hit_sources),
+            'misses': len(self.sources) - len(hit_sources) - len(skipped),
+            'hit_sources': hit_sources
+        }
+        return results
+
+    def close(self):
+        for pool in self.pools.values():
+            pool.close()
+        if self.cache is not None:
+            self.cache.close()
+
+async def run_fanout(client: FanoutClient, articles: List[Dict], repeat: int,
+                     article_concurrency: int) -> List[Tuple[str, Dict, float]]:
+    """Fan out every article (repeat times), at most article_concurrency at once"""
+    gate = asyncio.Semaphore(article_concurrency)
+
+    async def one(article: Dict) -> Tuple[str, Dict, float]:
+        async with gate:
+            started = time.perf_counter()
+            result = await client.fetch_article(article_identifiers(article))
+            return article['folder'], result, time.perf_counter() - started
+
+    try:
+        return await asyncio.gather(*[one(a) for _ in range(repeat) for a in articles])
+    finally:
+        client.close()
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+def generate_fanout_report(results: List[Tuple[str, Dict, float]], client: FanoutClient,
+                           wall_seconds: float, config: Dict) -> str:
+    """
+    Generate the fan-out benchmark report
+    """
+    spans = [span for _, _, span in results]
+    lines = ["API Fan-out Client Benchmark", ""]
+    lines.append(f"Target: {config['base_url']}; {len(results)} article fan-outs "
+                 f"({config['articles']} articles x {config['repeat']}), up to {config['article_concurrency']} "
+                 f"in flight; hedging {'on' if config['hedge'] else 'off'}.")
+    lines.append(f"Wall time {format_duration(wall_seconds)} "
+                 f"({len(results) / wall_seconds * 3600:,.0f} articles/hour). "
+                 f"Fan-out latency p50 {percentile(spans, 50):.2f}s, p95 {percentile(spans, 95):.2f}s, "
+                 f"max {max(spans) if spans else 0:.2f}s.")
+    if client.cache is not None:
+        hits = sum(r['_cache']['hits'] for _, r, _ in results)
+        total = sum(r['_cache']['hits'] + r['_cache']['misses'] for _, r, _ in results)
+        lines.append(f"Response cache {client.cache.path}: {hits}/{total} calls served locally "
+                     f"({hits / total * 100 if total else 0:.1f}%), {client.cache.evicted} entries evicted.")
+    if client.cache is not None or client.preflight is not None:
+        statuses = Counter(s for _, r, _ in results for s in r['_preflight']['skipped_sources'].values())
+        lines.append(f"Skipped calls: {sum(statuses.values())}"
+                     + "".join(f", {status} {count}" for status, count in sorted(statuses.items())) + ".")
+    lines.append("")
+    lines.append("| Source           | Pool | Requests | OK   | p50 (s) | p95 (s) | Queued (s) | Timeout (s) | Timeouts | Hedges | Hedges won | 429 retries |")
+    lines.append("|------------------|------|----------|------|---------|---------|------------|-------------|----------|--------|------------|-------------|")
+    for source, pool in client.pools.items():
+        latencies = [r[source]['processing_time_ms'] / 1000 for _, r, _ in results]
+        ok = sum(1 for _, r, _ in results if r[source]['success'])
+        stats = pool.stats
+        lines.append(
+            f"| {source:<16} | {pool.size:4d} | {stats['requests']:8d} | {ok:4d} | {percentile(latencies, 50):7.2f} | "
+            f"{percentile(latencies, 95):7.2f} | {stats['queued_seconds'] / max(1, stats['requests']):10.2f} | "
+            f"{pool.timeout.timeout:11.2f} | {stats['timeouts']:8d} | "
+            f"{stats['hedges']:6d} | {stats['hedges_won']:10d} | {stats['retries_429']:11d} |"
+        )
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to fan out the articles and save apis_raw_json files
+    """
+    parser = argparse.ArgumentParser(description="asyncio fan-out client for the 11 API sources")
+    parser.add_argument('--base-url', default='http://127.0.0.1:8765', help="replay server (or compatible proxy)")
+    parser.add_argument('--default-concurrency', type=int, default=4, help="connections per source")
+    parser.add_argument('--concurrency', action='append', metavar='SOURCE=N',
+                        help="connections for one source (repeatable)")
+    parser.add_argument('--hedge', action='store_true', help="send a duplicate request for slow sources")
+    parser.add_argument('--initial-timeout', type=float, default=30.0)
+    parser.add_argument('--min-timeout', type=float, default=1.0)
+    parser.add_argument('--max-timeout', type=float, default=60.0)
+    parser.add_argument('--article-concurrency', type=int, default=16, help="articles fanned out at once")
+    parser.add_argument('--repeat', type=int, default=1, help="fan out every article this many times")
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help="sqlite response cache")
+    parser.add_argument('--no-cache', action='store_true', help="always query the sources")
+    parser.add_argument('--cache-ttl-days', type=float, default=30)
+    parser.add_argument('--cache-max-mb', type=float, default=512)
+    parser.add_argument('--preflight-rules', default='plots/preflight_rules.json',
+                        help="learned skip rules (identifier rules always apply)")
+    parser.add_argument('--no-preflight', action='store_true', help="make every call")
+    parser.add_argument('--probe-rate', type=float, default=0.05, help="share of skippable calls made anyway")
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--output-dir', default='plots/fanout', help="where Article_XX/apis_raw_json.json go")
+    parser.add_argument('--report', default='plots/fanout_report.txt')
+    args = parser.parse_args()
+
+    print("🌐 INFINITY RESEARCH - API Fan-out Client")
+    print("=" * 50)
+
+    articles = load_article_jsons(args.json_dir)
+    if not articles:
+        print("❌ No article data found!")
+        return
+    print(f"📁 Found {len(articles)} article folders")
+
+    client = FanoutClient(
+        args.base_url,
+        parse_source_overrides(args.concurrency, int),
+        default_concurrency=args.default_concurrency,
+        hedge=args.hedge,
+        initial_timeout=args.initial_timeout,
+        min_timeout=args.min_timeout,
+        max_timeout=args.max_timeout,
+        cache=None if args.no_cache else ResponseCache(args.cache, args.cache_ttl_days * 86400,
+                                                       int(args.cache_max_mb * 1024 * 1024)),
+        preflight=None if args.no_preflight else PreflightRules.load(args.preflight_rules, args.probe_rate)
+    )
+
+    print(f"🚀 Fanning out {len(articles) * args.repeat} articles to {len(client.sources)} sources...")
+    started = time.perf_counter()
+    results = asyncio.run(run_fanout(client, articles, args.repeat, args.article_concurrency))
+    wall_seconds = time.perf_counter() - started
+
+    # Last fan-out of each article is saved in apis_raw_json shape
+    for folder, result, _ in results:
+        article_dir = os.path.join(args.output_dir, folder)
+        os.makedirs(article_dir, exist_ok=True)
+        with open(os.path.join(article_dir, 'apis_raw_json.json'), 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+    report = generate_fanout_report(results, client, wall_seconds, {
+        'base_url': args.base_url, 'articles': len(articles), 'repeat': args.repeat,
+        'article_concurrency': args.article_concurrency, 'hedge': args.hedge
+    })
+    with open(args.report, 'w', encoding='utf-8') as f:
+        f.write(report)
+
+    print(f"\n{report}")
+
+    # Calls actually made (not skipped by the pre-flight rules or served from the cache)
+    made = [entry for _, result, _ in results for source, entry in result.items()
+            if not source.startswith('_') and 'status' not in entry]
+    if made and not any(entry['success'] for entry in made):
+        print(f"\n❌ All {len(made)} requests failed (first error: {made[0]['error']})")
+        sys.exit(1)
+
+    print(f"\n🎯 Fan-out complete!")
+    print(f"   📁 Results: {args.output_dir}/Article_XX/apis_raw_json.json")
+    print(f"   📊 Report: {args.report}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+🤝 FIELD AGREEMENT SCORING - Infinity Research Paper
+====================================================
+
+Numeric cross-source agreement for every (article, field) of the consensus:
+how many sources report a value that matches the `consensus_result` value
+(same comparison rules as the local consensus, `field_normalizer`), how many
+dissent, and which values they dissent with.
+
+Sources are Vision (`extracted_data`) and the API payloads of
+`apis_raw_json.json` (source_extractors). As in the local consensus, sources
+describing another work are left out and other versions of the work (same
+title, another DOI) only count for Title, Authors, Abstract and Keywords.
+Sources without a value for the field neither agree nor dissent.
+Citation counts differ between sources by nature (index coverage, update
+dates), so Citations agree within a relative tolerance instead of exactly.
+
+The score is agree / (agree + dissent), NaN when no source reported the
+field. All values of a field are normalized in one batched pass over the
+corpus; the counts are added to the metrics table as (articles x 16
+fields) columns ordered as METADATA_FIELDS (`field_agree`,
+`field_dissent`, `field_agreement`). Fields scoring below the review
+threshold form the manual review queue.
+
+Input: JSON files from infinity-research-paper/json/Article_XX/
+Output: field_agreement.json + field_agreement_report.txt
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, List
+import numpy as np
+
+from article_metrics import API_SOURCES, METADATA_FIELDS, build_metrics_table, is_field_filled, load_article_jsons
+from field_normalizer import normalize_column, pair_agreement
+from local_consensus import WORK_FIELDS, coherent_sources
+from source_extractors import extract_all_sources
+
+# Fields where fewer than half of the reporting sources back the consensus value
+DEFAULT_REVIEW_THRESHOLD = 0.5
+
+# Citation counts agree within 25% of the larger count (and always within 2 citations)
+CITATION_TOLERANCE = 0.25
+CITATION_SLACK = 2
+
+def citations_agree(key_a, key_b) -> bool:
+    """Two citation counts (comparison keys) describing the same work's reception"""
+    if key_a is None or key_b is None:
+        return key_a is None and key_b is None
+    return abs(key_a - key_b) <= max(CITATION_SLACK, CITATION_TOLERANCE * max(key_a, key_b))
+
+def field_candidates(article: Dict) -> Dict[str, List]:
+    """
+    (source, value) pairs per field for one article: Vision first, then the
+    API sources that describe the same work
+    """
+    extracted = article['vision'].get('extracted_data') or {}
+    sources = extract_all_sources(article['apis_raw'])
+    coherent, other_version, _ = coherent_sources(extracted, sources)
+
+    candidates = {}
+    for field in METADATA_FIELDS:
+        pairs = [('vision', extracted[field])] if is_field_filled(extracted.get(field)) else []
+        contributors = [s for s in API_SOURCES if s in coherent or (s in other_version and field in WORK_FIELDS)]
+        pairs += [(s, sources[s][field]) for s in contributors if field in sources[s]]
+        candidates[field] = pairs
+    return candidates
+
+def score_agreement(articles: List[Dict]) -> Dict:
+    """
+    Agreement counts of every (article, field) in one pass per field
+    Returns (articles x fields) arrays 'agree', 'dissent', 'score' and the
+    per-cell lists 'agreeing' / 'dissenting' ({'source', 'value'}).
+    """
+    n, n_fields = len(articles), len(METADATA_FIELDS)
+    agree = np.zeros((n, n_fields), dtype=np.int16)
+    dissent = np.zeros((n, n_fields), dtype=np.int16)
+    agreeing = [[[] for _ in METADATA_FIELDS] for _ in range(n)]
+    dissenting = [[[] for _ in METADATA_FIELDS] for _ in range(n)]
+
+    candidates = [field_candidates(article) for article in articles]
+    consensus = [(article['apis_clean'] or {}).get('consensus_result') or {} for article in articles]
+
+    for j, field in enumerate(METADATA_FIELDS):
+        # One column per field: the n consensus values, then every source value
+        rows = [(i, source, value) for i in range(n) for source, value in candidates[i][field]]
+        column = [c.get(field) for c in consensus] + [value for _, _, value in rows]
+        article_rows = np.array([i for i, _, _ in rows], dtype=np.int64)
+        if field == 'Citations':
+            keys = normalize_column(field, column)
+            agrees = [citations_agree(keys[i], key) for i, key in zip(article_rows, keys[n:])]
+        else:
+            agrees = pair_agreement(field, column, article_rows, n + np.arange(len(rows)))
+        for (i, source, value), agreed in zip(rows, agrees):
+            if agreed:
+                agree[i, j] += 1
+                agreeing[i][j].append(source)
+            else:
+                dissent[i, j] += 1
+                dissenting[i][j].append({'source': source, 'value': value})
+
+    reported = agree + dissent
+    with np.errstate(invalid='ignore', divide='ignore'):
+        score = np.where(reported > 0, agree / reported, np.nan)
+    return {'agree': agree, 'dissent': dissent, 'score': score,
+            'agreeing': agreeing, 'dissenting': dissenting}
+
+def add_agreement_columns(table: Dict[str, np.ndarray], agreement: Dict) -> Dict[str, np.ndarray]:
+    """Store the agreement counts next to the other metrics columns (rows = articles)"""
+    table['field_agree'] = agreement['agree']
+    table['field_dissent'] = agreement['dissent']
+    table['field_agreement'] = agreement['score']
+    return table
+
+def review_mask(table: Dict[str, np.ndarray], threshold: float = DEFAULT_REVIEW_THRESHOLD) -> np.ndarray:
+    """(articles x fields) cells to send to manual review (fields no source reported are not scored)"""
+    return np.nan_to_num(table['field_agreement'], nan=1.0) < threshold
+
+def agreement_records(table: Dict[str, np.ndarray], agreement: Dict, review: np.ndarray) -> List[Dict]:
+    """Per-article JSON records: counts, score and dissenting values of each field"""
+    records = []
+    for i, folder in enumerate(table['folder']):
+        fields = {}
+        for j, field in enumerate(METADATA_FIELDS):
+            score = table['field_agreement'][i, j]
+            fields[field] = {
+                'agree': int(table['field_agree'][i, j]),
+                'dissent': int(table['field_dissent'][i, j]),
+                'score': None if np.isnan(score) else round(float(score), 3),
+                'agreeing_sources': agreement['agreeing'][i][j],
+                'dissenting': agreement['dissenting'][i][j],
+                'review': bool(review[i, j])
+            }
+        records.append({'folder': folder, 'fields': fields})
+    return records
+
+def generate_agreement_report(table: Dict[str, np.ndarray], review: np.ndarray, threshold: float) -> str:
+    """
+    Generate the per-field agreement table and the review queue
+    """
+    n = len(table['folder'])
+    agree, dissent, score = table['field_agree'], table['field_dissent'], table['field_agreement']
+    reported = (agree + dissent) > 0
+
+    lines = ["Cross-Source Field Agreement with the Consensus", ""]
+    lines.append(f"{n} articles x {len(METADATA_FIELDS)} fields; sources: Vision + coherent API sources. "
+                 f"Fields scoring below {threshold:.2f} go to manual review.")
+    lines.append("")
+    lines.append("| Field       | Reported | Mean agree | Mean dissent | Mean score | Unanimous | Review |")
+    lines.append("|-------------|----------|------------|--------------|------------|-----------|--------|")
+    for j, field in enumerate(METADATA_FIELDS):
+        cells = reported[:, j]
+        count = int(cells.sum())
+        mean_score = f"{np.nanmean(score[cells, j]):10.2f}" if count else f"{'-':>10}"
+        unanimous = int((cells & (dissent[:, j] == 0)).sum())
+        lines.append(f"| {field:<11} | {count:5d}/{n:<2d} | {agree[cells, j].mean() if count else 0:10.1f} | "
+                     f"{dissent[cells, j].mean() if count else 0:12.1f} | {mean_score} | {unanimous:9d} | "
+                     f"{int(review[:, j].sum()):6d} |")
+
+    total = int(reported.sum())
+    flagged = int(review.sum())
+    lines.append("")
+    lines.append(f"{flagged} of {total} reported fields ({flagged / total * 100 if total else 0:.1f}%) go to manual "
+                 f"review; {total - flagged} are confirmed by the sources.")
+    lines.append("")
+    lines.append("| Article | Review fields |")
+    lines.append("|---------|---------------|")
+    for i, label in enumerate(table['label']):
+        fields = [f"{field} ({score[i, j]:.2f})" for j, field in enumerate(METADATA_FIELDS) if review[i, j]]
+        lines.append(f"| {label:<7} | {', '.join(fields) or '-'} |")
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to score cross-source agreement and build the review queue
+    """
+    parser = argparse.ArgumentParser(description="Per-field agreement of the sources with the consensus")
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REVIEW_THRESHOLD,
+                        help="review fields scoring below this (0-1)")
+    parser.add_argument('--output-dir', default='plots')
+    args = parser.parse_args()
+
+    print("🤝 INFINITY RESEARCH - Field Agreement Scoring")
+    print("=" * 50)
+
+    articles = load_article_jsons(args.json_dir)
+    if not articles:
+        print("❌ No article data found!")
+        return
+    print(f"📁 Found {len(articles)} article folders")
+
+    agreement = score_agreement(articles)
+    table = add_agreement_columns(build_metrics_table(articles), agreement)
+    review = review_mask(table, args.threshold)
+    report = generate_agreement_report(table, review, args.threshold)
+
+    results_file = os.path.join(args.output_dir, "field_agreement.json")
+    with open(results_file, 'w', encoding='utf-8') as f:
+        json.dump(agreement_records(table, agreement, review), f, indent=2, ensure_ascii=False)
+    report_file = os.path.join(args.output_dir, "field_agreement_report.txt")
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write(report)
+
+    print(f"\n{report}")
+    print(f"\n🎯 Field agreement scoring complete!")
+    print(f"   📁 Scores: {results_file}")
+    print(f"   📊 Report: {report_file}")
+
+if __name__ == "__main__":
+    main()
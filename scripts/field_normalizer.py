@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+🧹 FIELD NORMALIZER - Infinity Research Paper
+=============================================
+
+Shared normalization of the 16 metadata fields, used wherever values from
+Vision, the API sources and the consensus are compared (local consensus,
+payload minimizer, agreement scoring, Figure 5/6 field checks):
+
+- DOI: resolver prefix stripped, lowercase
+- PMID/Year/Citations: digits as int (Year: first 4 digits); PMCID: 'PMC' + digits
+- Pages: 'e2366' / '2583-91' -> '2366' / '2583-2591' (article-number 'e'
+  prefix dropped, abbreviated range end expanded, dashes unified)
+- Journal: HTML entities decoded, parentheses, ': subtitle' and stopwords
+  ('The', 'of', '&', ...) dropped, accent-folded; names agree only on equal
+  keys ('The Lancet' = 'Lancet', but not 'Lancet Oncology')
+- Publisher: parentheses, dots, stopwords and legal/generic words dropped
+  ('Ltd', 'Inc', 'B.V.', 'Press', ...), equal keys
+- Authors: family-name tuple ('Borgmann, Hendrik' and 'Hendrik Borgmann'
+  both give 'borgmann')
+- Title/Abstract/Keywords: folded token sets (compared by overlap)
+
+Columns are factorized first (`factorize`: integer codes + distinct
+values), so `normalize_column` runs each key function on the distinct values
+only and expands the keys through the codes. `agreement_matrix` compares a
+whole column as array operations on the distinct keys: exact-key fields by
+key codes, token-set fields (Title, Abstract, Keywords, Authors) through a value x token incidence matrix whose product gives every
+pairwise intersection at once; `pair_agreement` looks up selected pairs
+of a column in the same distinct-value matrix. Single-value helpers
+(`comparison_key`, `values_agree`, `keys_agree`) implement the same rules.
+
+Input: field values (Vision / API / consensus)
+Output: comparison keys and agreement decisions
+"""
+
+import argparse
+import html
+import re
+import time
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence
+import numpy as np
+
+from article_metrics import METADATA_FIELDS, is_field_filled
+from source_extractors import strip_doi
+
+# Minimum token overlap (Jaccard) for two texts to be the same title/abstract
+TITLE_SIMILARITY = 0.8
+ABSTRACT_SIMILARITY = 0.5
+AUTHOR_OVERLAP = 0.8
+KEYWORD_OVERLAP = 0.5
+
+# Unicode letters and digits: CJK, Cyrillic and Greek names keep their words
+_WORDS = re.compile(r'[^\W_]+')
+_NON_DIGITS = re.compile(r'\D')
+_SPACES = re.compile(r'\s+')
+_PAGE_RANGE = re.compile(r'([a-z]*)(\d+)-([a-z]*)(\d+)')
+_ARTICLE_NUMBER = re.compile(r'(?:^|(?<=-))e(?=\d)')
+_URL_SCHEME = re.compile(r'^https?://(www\.)?')
+_PARENTHESES = re.compile(r'\([^)]*\)')
+# Journal subtitle (' : the official journal of ...')
+_SUBTITLE = re.compile(r'\s+:\s.*$')
+# Articles and stopwords dropped from venue names before the (exact) key comparison
+_VENUE_STOPWORDS = {'the', 'of', 'and', 'a', 'an', 'for', 'in', 'on', 'de', 'la', 'le', 'der', 'die', 'und'}
+_PUBLISHER_NOISE = _VENUE_STOPWORDS | {'ltd', 'inc', 'ag', 'gmbh', 'llc', 'co', 'sons', 'publishing', 'publishers',
+                                       'publications', 'press', 'john', 'bv', 'sa'}
+
+# Lowercase field name (field_sources keys) -> METADATA_FIELDS name
+_FIELD_NAMES = {field.lower(): field for field in METADATA_FIELDS}
+
+def canonical_field(name: str) -> Optional[str]:
+    """'openaccess' / 'OpenAccess' -> 'OpenAccess' (None for unknown fields)"""
+    return _FIELD_NAMES.get(str(name).lower())
+
+@lru_cache(maxsize=1 << 16)
+def _fold(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    return ' '.join(_WORDS.findall(text))
+
+def fold_text(value) -> str:
+    """Lowercase accent-folded text with punctuation replaced by single spaces"""
+    return _fold(str(value))
+
+def tokens(value) -> set:
+    return set(fold_text(value).split())
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a | b else 0.0
+
+def normalize_pages(value) -> str:
+    """'2583-91' -> '2583-2591', 'e2366' -> '2366', en dashes and spaces removed"""
+    text = _SPACES.sub('', str(value)).replace('–', '-').replace('—', '-').lower()
+    text = _ARTICLE_NUMBER.sub('', text)
+    match = _PAGE_RANGE.fullmatch(text)
+    if match and len(match.group(4)) < len(match.group(2)):
+        start = match.group(2)
+        text = f"{match.group(1)}{start}-{match.group(3)}{start[:len(start) - len(match.group(4))]}{match.group(4)}"
+    return text
+
+def family_names(authors) -> List[str]:
+    """Family-name key per author ('Family, Given' or 'Given Family')"""
+    names = []
+    for author in authors if isinstance(authors, list) else [authors]:
+        author = str(author)
+        family = author.split(',')[0] if ',' in author else (author.split() or [''])[-1]
+        names.append(fold_text(family))
+    return [n for n in names if n]
+
+def _digits_key(value):
+    digits = _NON_DIGITS.sub('', str(value))
+    return int(digits) if digits else None
+
+def _year_key(value):
+    digits = _NON_DIGITS.sub('', str(value))
+    return int(digits[:4]) if digits else None
+
+def _open_access_key(value):
+    return value if isinstance(value, bool) else str(value).lower() in ('true', 'yes', 'y', '1')
+
+def _keywords_key(value):
+    return frozenset(fold_text(k) for k in (value if isinstance(value, list) else [value]))
+
+def _venue_key(text: str, stopwords: set) -> str:
+    return ' '.join(t for t in fold_text(text).split() if t not in stopwords)
+
+# Field -> comparison key of a filled value
+KEY_FUNCTIONS: Dict[str, Callable] = {
+    'DOI': lambda v: strip_doi(str(v)).lower(),
+    'PMID': _digits_key,
+    'Year': _year_key,
+    'Citations': _digits_key,
+    'PMCID': lambda v: 'PMC' + _NON_DIGITS.sub('', str(v)),
+    'OpenAccess': _open_access_key,
+    'Pages': normalize_pages,
+    'Journal': lambda v: _venue_key(_SUBTITLE.sub('', _PARENTHESES.sub(' ', html.unescape(str(v)))),
+                                    _VENUE_STOPWORDS),
+    'Publisher': lambda v: _venue_key(_PARENTHESES.sub(' ', html.unescape(str(v))).replace('.', ''),
+                                      _PUBLISHER_NOISE),
+    'PDFUrl': lambda v: _URL_SCHEME.sub('', str(v).strip().lower()).rstrip('/'),
+    'Keywords': _keywords_key,
+    'Authors': lambda v: tuple(family_names(v)),
+    'Title': lambda v: frozenset(tokens(v)),
+    'Abstract': lambda v: frozenset(tokens(v))
+}
+
+def _is_value(value) -> bool:
+    # False (closed access) and 0 (no citations) are values, not gaps
+    return value is not None and (is_field_filled(value) or value in (False, 0))
+
+def _hashable(value):
+    return tuple(map(_hashable, value)) if isinstance(value, list) else value
+
+def comparison_key(field: str, value):
+    """Canonical form of a field value for exact comparisons (None if unfilled)"""
+    if not _is_value(value):
+        return None
+    return KEY_FUNCTIONS.get(field, fold_text)(value)
+
+def factorize(values: Sequence):
+    """
+    (codes, uniques): integer code per value and the distinct values in first-seen order
+    (unhashable values get their own code)
+    """
+    index = {}
+    uniques = []
+    codes = np.empty(len(values), dtype=np.int64)
+    for i, value in enumerate(values):
+        try:
+            marker = (value.__class__, _hashable(value))
+            code = index.setdefault(marker, len(uniques))
+        except TypeError:
+            code = len(uniques)
+        if code == len(uniques):
+            uniques.append(value)
+        codes[i] = code
+    return codes, uniques
+
+def _object_array(items: Sequence) -> np.ndarray:
+    # np.array() would unpack tuple/list keys into extra dimensions
+    array = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        array[i] = item
+    return array
+
+def normalize_column(field: str, values: Sequence) -> List:
+    """
+    Comparison keys of a whole column of one field (None for unfilled values)
+    The column is factorized, the key function runs on the distinct values only
+    and the keys are expanded back through the codes.
+    """
+    codes, uniques = factorize(values)
+    return _object_array([comparison_key(field, value) for value in uniques])[codes].tolist()
+
+def match_key(field: str, value):
+    """
+    Key used by the agreement rules: the comparison key, plus for Authors the
+    token set of the raw names (given names may be written out or abbreviated)
+    """
+    key = comparison_key(field, value)
+    if field != 'Authors' or key is None:
+        return key
+    raw = ' '.join(map(str, value if isinstance(value, list) else [value]))
+    return key, frozenset(set(' '.join(key).split()) | tokens(raw))
+
+def keys_agree(field: str, key_a, key_b) -> bool:
+    """Agreement rule on two match keys"""
+    if key_a is None or key_b is None:
+        return key_a is None and key_b is None
+    if field == 'Title':
+        return jaccard(key_a, key_b) >= TITLE_SIMILARITY
+    if field == 'Abstract':
+        return jaccard(key_a, key_b) >= ABSTRACT_SIMILARITY
+    if field == 'Authors':
+        (names_a, _), (names_b, other_tokens) = key_a, key_b
+        if not names_a and not names_b:
+            return False
+        shared = sum(1 for name in names_a if set(name.split()) <= other_tokens)
+        return shared / max(len(names_a), len(names_b)) >= AUTHOR_OVERLAP
+    if field == 'Keywords':
+        return len(key_a & key_b) / min(len(key_a), len(key_b)) >= KEYWORD_OVERLAP
+    return key_a == key_b
+
+def values_agree(field: str, a, b) -> bool:
+    """Whether two values of the same field describe the same thing"""
+    return keys_agree(field, match_key(field, a), match_key(field, b))
+
+def match_keys(field: str, values: Sequence) -> List:
+    """match_key for a whole column (keys computed once per distinct value)"""
+    codes, uniques = factorize(values)
+    return _object_array([match_key(field, value) for value in uniques])[codes].tolist()
+
+# Fields compared by token-set overlap instead of key equality
+SIMILARITY_FIELDS = ('Title', 'Abstract', 'Authors', 'Keywords')
+
+def _incidence(sets: Sequence, vocabulary: Dict) -> np.ndarray:
+    """(len(sets) x len(vocabulary)) 0/1 matrix; vocabulary grows with unseen elements"""
+    rows, columns = [], []
+    for row, elements in enumerate(sets):
+        for element in elements:
+            rows.append(row)
+            columns.append(vocabulary.setdefault(element, len(vocabulary)))
+    matrix = np.zeros((len(sets), len(vocabulary)), dtype=np.float64)
+    matrix[rows, columns] = 1.0
+    return matrix
+
+def _similarity_agreement(field: str, keys: List) -> np.ndarray:
+    """keys_agree over all pairs of filled similarity-field keys, from token intersections"""
+    vocabulary = {}
+    if field == 'Authors':
+        # Name i of value a is shared with value b when its tokens are all in b's token set
+        names = [(owner, set(name.split())) for owner, (family, _) in enumerate(keys) for name in family]
+        other_tokens = _incidence([other for _, other in keys], vocabulary)
+        name_tokens = _incidence([tokens_ for _, tokens_ in names], vocabulary)
+        other_tokens = np.pad(other_tokens, ((0, 0), (0, len(vocabulary) - other_tokens.shape[1])))
+        contained = (name_tokens @ other_tokens.T) == name_tokens.sum(axis=1)[:, None]
+        owners = np.zeros((len(keys), len(names)))
+        owners[[owner for owner, _ in names], np.arange(len(names))] = 1.0
+        shared = owners @ contained
+        counts = np.array([len(family) for family, _ in keys], dtype=np.float64)
+        largest = np.maximum(counts[:, None], counts[None, :])
+        # No names on either side (nothing left after folding): no agreement, as in keys_agree
+        ratio = np.divide(shared, largest, out=np.zeros_like(shared), where=largest > 0)
+        return (largest > 0) & (ratio >= AUTHOR_OVERLAP)
+
+    incidence = _incidence(keys, vocabulary)
+    shared = incidence @ incidence.T
+    sizes = incidence.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if field in ('Title', 'Abstract'):
+            union = sizes[:, None] + sizes[None, :] - shared
+            threshold = TITLE_SIMILARITY if field == 'Title' else ABSTRACT_SIMILARITY
+            return np.where(union > 0, shared / np.where(union > 0, union, 1), 0.0) >= threshold
+        # Keywords
+        return shared / np.minimum(sizes[:, None], sizes[None, :]) >= KEYWORD_OVERLAP
+
+def _unique_agreement(field: str, uniques: Sequence) -> np.ndarray:
+    """values_agree over all pairs of distinct values"""
+    keys = [match_key(field, value) for value in uniques]
+    filled = np.array([key is not None for key in keys], dtype=bool)
+    # Unfilled values only agree with each other
+    agree = ~filled[:, None] & ~filled[None, :]
+    positions = np.flatnonzero(filled)
+    filled_keys = [keys[i] for i in positions]
+    if field in SIMILARITY_FIELDS:
+        agree[np.ix_(positions, positions)] = _similarity_agreement(field, filled_keys)
+    else:
+        key_codes, _ = factorize(filled_keys)
+        agree[np.ix_(positions, positions)] = key_codes[:, None] == key_codes[None, :]
+    return agree
+
+def agreement_matrix(field: str, values: Sequence) -> np.ndarray:
+    """
+    (n x n) boolean matrix of values_agree over all pairs of a column
+    Computed on the distinct values and expanded through the column codes.
+    """
+    codes, uniques = factorize(values)
+    return _unique_agreement(field, uniques)[np.ix_(codes, codes)]
+
+def pair_agreement(field: str, values: Sequence, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    values_agree(values[left[k]], values[right[k]]) for every k
+    Only the distinct values are compared; the pairs are looked up through the codes.
+    """
+    codes, uniques = factorize(values)
+    return _unique_agreement(field, uniques)[codes[left], codes[right]]
+
+def filled_mask(values: Sequence) -> np.ndarray:
+    """Boolean column: is_field_filled for every value"""
+    return np.fromiter((is_field_filled(v) for v in values), dtype=bool, count=len(values))
+
+# Values the agreement rules must handle in every field: unfilled, punctuation only
+# (nothing left after folding) and non-ASCII names
+EDGE_VALUES = [None, '', [], False, 0, '-', ['-'], '李明', ['李明'], ['王伟'], 'Иванов И.', ['Иванов И.'],
+               ['Παπαδόπουλος, Γ.'], ['Müller, K.', 'Borgmann, Hendrik'], 'Hendrik Borgmann']
+
+def check_agreement(field: str, values: Sequence) -> np.ndarray:
+    """
+    agreement_matrix of a column, asserted equal to keys_agree on every pair
+    Returns the per-pair matrix.
+    """
+    keys = [match_key(field, v) for v in values]
+    pairwise = np.array([[keys_agree(field, a, b) for b in keys] for a in keys], dtype=bool).reshape(len(keys), len(keys))
+    matrix = agreement_matrix(field, values)
+    mismatches = np.argwhere(pairwise != matrix)
+    assert not len(mismatches), (f"{field}: agreement_matrix differs from keys_agree on "
+                                 f"{[(values[i], values[j]) for i, j in mismatches[:3]]}")
+    return pairwise
+
+def benchmark(json_dir: str = "json") -> Dict[str, float]:
+    """
+    Time per-value calls against the column functions on the distinct corpus values
+    (Vision + every API source + consensus): comparison_key vs normalize_column and
+    keys_agree over all pairs vs agreement_matrix (both checked equal, also on EDGE_VALUES)
+    """
+    from article_metrics import load_article_jsons
+    from source_extractors import extract_all_sources
+
+    columns = {field: [] for field in METADATA_FIELDS}
+    for article in load_article_jsons(json_dir):
+        records = [article['vision'].get('extracted_data') or {},
+                   (article['apis_clean'] or {}).get('consensus_result') or {}]
+        records += list(extract_all_sources(article['apis_raw']).values())
+        for record in records:
+            for field in METADATA_FIELDS:
+                columns[field].append(record.get(field))
+    # Distinct values only: repeated values would only measure the factorization
+    columns = {field: factorize(values)[1] for field, values in columns.items()}
+
+    _fold.cache_clear()
+    started = time.perf_counter()
+    per_value = {field: [comparison_key(field, v) for v in values] for field, values in columns.items()}
+    per_value_seconds = time.perf_counter() - started
+    _fold.cache_clear()
+    started = time.perf_counter()
+    batch = {field: normalize_column(field, values) for field, values in columns.items()}
+    batch_seconds = time.perf_counter() - started
+    assert per_value == batch
+
+    started = time.perf_counter()
+    pairwise = {}
+    for field, values in columns.items():
+        keys = [match_key(field, v) for v in values]
+        pairwise[field] = np.array([[keys_agree(field, a, b) for b in keys] for a in keys], dtype=bool)
+    pairwise_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    matrices = {field: agreement_matrix(field, values) for field, values in columns.items()}
+    matrix_seconds = time.perf_counter() - started
+    assert all(np.array_equal(pairwise[field], matrices[field]) for field in columns)
+    for field, values in columns.items():
+        check_agreement(field, values + EDGE_VALUES)
+
+    return {'values': sum(len(v) for v in columns.values()),
+            'pairs': sum(len(v) ** 2 for v in columns.values()),
+            'per_value_seconds': per_value_seconds, 'batch_seconds': batch_seconds,
+            'pairwise_seconds': pairwise_seconds, 'matrix_seconds': matrix_seconds}
+
+def main():
+    """
+    Main function to benchmark the column normalizer on the distinct corpus values
+    """
+    parser = argparse.ArgumentParser(description="Benchmark per-value vs. column normalization and agreement")
+    parser.add_argument('--json-dir', default='json')
+    args = parser.parse_args()
+
+    print("🧹 INFINITY RESEARCH - Field Normalizer")
+    print("=" * 50)
+
+    result = benchmark(args.json_dir)
+    print(f"✅ {result['values']:,} distinct field values, identical keys and agreement")
+    print(f"   Keys per value:      {result['per_value_seconds']:.3f}s")
+    print(f"   Keys per column:     {result['batch_seconds']:.3f}s")
+    print(f"   Agreement per pair:  {result['pairwise_seconds']:.3f}s ({result['pairs']:,} pairs)")
+    print(f"   Agreement matrix:    {result['matrix_seconds']:.3f}s "
+          f"({result['pairwise_seconds'] / result['matrix_seconds']:.1f}x faster)")
+
+    print(f"\n🎯 Normalizer benchmark complete!")
+
+if __name__ == "__main__":
+    main()
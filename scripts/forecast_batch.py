@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+💵 BATCH COST & LATENCY FORECASTER - Infinity Research Paper
+============================================================
+
+Predicts total cost, token usage and processing time of a new review batch
+from nothing but its input PDFs and their page counts. No LLM is called:
+per-article models are fitted on the existing corpus (cost, tokens and
+latency vs. page count) and summed over the batch with confidence intervals.
+
+Page counts are read straight from the PDF structure (`/Type /Pages /Count`,
+including compressed object streams) or from a CSV of `filename,pages`.
+PDFs already in the article manifest (plots/article_manifest.json, same file
+name and size) take their page count from it instead of being parsed again.
+
+Input: folder of PDFs (or pages CSV) + JSON files from json/Article_XX/
+Output: forecast_report.txt (+ optional per-PDF CSV)
+
+Example:
+    python scripts/forecast_batch.py --pdf-dir pdfs --workers 4
+"""
+
+import argparse
+import csv
+import glob
+import math
+import os
+import re
+import zlib
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from article_metrics import load_metrics_table
+
+# Topics extraction renders every page up to this cap ('vision_all_pages (≤40)')
+TOPICS_PAGE_CAP = 40
+
+# Highest --confidence level: the t quantile approximation holds to ~1e-3 up to here (df >= 10)
+MAX_CONFIDENCE = 0.999
+
+# Per-article quantities forecast by the model (metrics table column, display name, unit)
+FORECAST_TARGETS = [
+    ('total_cost', 'Cost', 'USD'),
+    ('total_tokens', 'Tokens', 'tokens'),
+    ('total_time_ms', 'Processing time', 'ms')
+]
+
+PHASE_TARGETS = {
+    'Cost': ['vision_cost', 'consensus_cost', 'topics_cost'],
+    'Tokens': ['vision_tokens', 'consensus_tokens', 'topics_tokens'],
+    'Processing time': ['vision_time_ms', 'apis_time_ms', 'topics_time_ms']
+}
+
+_PAGES_TYPE = re.compile(rb'/Type\s*/Pages\b')
+_PAGES_COUNT = re.compile(rb'/Count\s+(\d+)')
+_PAGE_LEAF = re.compile(rb'/Type\s*/Page(?![a-zA-Z])')
+
+def _max_pages_count(buffer: bytes) -> int:
+    """Largest /Count found next to a /Type /Pages node (the root of the page tree)"""
+    best = 0
+    for match in _PAGES_TYPE.finditer(buffer):
+        window = buffer[max(0, match.start() - 400):match.end() + 400]
+        for count in _PAGES_COUNT.findall(window):
+            best = max(best, int(count))
+    return best
+
+def count_pdf_pages(path: str) -> Optional[int]:
+    """
+    Read the page count from the PDF page tree without a PDF library
+    Looks at plain objects first, then inside Flate-compressed object streams;
+    falls back to counting /Type /Page leaves. Returns None if nothing is found.
+    """
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+    except OSError as e:
+        print(f"      ⚠️ Error reading {path}: {e}")
+        return None
+
+    pages = _max_pages_count(content)
+    if pages:
+        return pages
+
+    for match in re.finditer(rb'/ObjStm', content):
+        start = content.find(b'stream', match.end())
+        if start < 0:
+            continue
+        start += len(b'stream')
+        if content[start:start + 2] == b'\r\n':
+            start += 2
+        elif content[start:start + 1] in (b'\n', b'\r'):
+            start += 1
+        end = content.find(b'endstream', start)
+        try:
+            decompressed = zlib.decompressobj().decompress(content[start:end])
+        except zlib.error:
+            continue
+        pages = max(pages, _max_pages_count(decompressed))
+
+    if pages:
+        return pages
+
+    leaves = len(_PAGE_LEAF.findall(content))
+    return leaves or None
+
+def load_batch_page_counts(pdf_dir: Optional[str], pages_csv: Optional[str],
+                           manifest_file: Optional[str] = None) -> Tuple[List[str], np.ndarray]:
+    """
+    Collect (name, page count) for the batch from a PDF folder and/or a CSV
+    Unreadable PDFs and unparseable CSV counts get NaN and are imputed with the corpus median later.
+    PDFs found in the article manifest (by file name, same size) reuse its page count.
+    """
+    names = []
+    pages = []
+    known = {}
+    if manifest_file and os.path.exists(manifest_file):
+        # Imported here: article_manifest uses count_pdf_pages from this module
+        from article_manifest import load_manifest
+        known = load_manifest(manifest_file)['by_pdf']
+
+    if pages_csv:
+        with open(pages_csv, 'r', encoding='utf-8') as f:
+            for line, row in enumerate(csv.reader(f), 1):
+                if not row or row[0].strip().lower() in ('filename', 'file', 'name'):
+                    continue
+                value = row[1].strip() if len(row) > 1 else ''
+                try:
+                    count = float(value) if value else np.nan
+                except ValueError:
+                    if line == 1:
+                        continue  # header row
+                    print(f"      ⚠️ {pages_csv}:{line}: page count {value!r} is not a number; imputed")
+                    count = np.nan
+                names.append(row[0].strip())
+                pages.append(count)
+
+    if pdf_dir:
+        for path in sorted(glob.glob(os.path.join(pdf_dir, '**', '*.pdf'), recursive=True)):
+            entry = known.get(os.path.basename(path))
+            if entry and entry['pdf_pages'] and entry['pdf_bytes'] == os.path.getsize(path):
+                count = entry['pdf_pages']
+            else:
+                count = count_pdf_pages(path)
+            names.append(os.path.relpath(path, pdf_dir))
+            pages.append(float(count) if count else np.nan)
+
+    return names, np.array(pages, dtype=float)
+
+def normal_quantile(p: float) -> float:
+    """
+    Standard normal quantile (Acklam's rational approximation, relative error < 1.2e-9;
+    central region plus the two tail branches below 2.425% / above 97.575%)
+    """
+    a = [-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+         1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00]
+    b = [-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+         6.680131188771972e+01, -1.328068155288572e+01]
+    c = [-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+         -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00]
+    d = [7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00]
+    p_low = 0.02425
+    if p < p_low or p > 1 - p_low:
+        q = math.sqrt(-2 * math.log(min(p, 1 - p)))
+        z = (((((c[0]*q + c[1])*q + c[2])*q + c[3])*q + c[4])*q + c[5]) / \
+            ((((d[0]*q + d[1])*q + d[2])*q + d[3])*q + 1)
+        return z if p < p_low else -z
+    q = p - 0.5
+    r = q * q
+    return (((((a[0]*r + a[1])*r + a[2])*r + a[3])*r + a[4])*r + a[5]) * q / \
+        (((((b[0]*r + b[1])*r + b[2])*r + b[3])*r + b[4])*r + 1)
+
+def t_quantile(p: float, df: int) -> float:
+    """
+    Student t quantile via the Cornish-Fisher expansion (4 terms) around the normal quantile
+    (within ~1e-3 for df >= 10 up to p = 0.9995; --confidence is limited to MAX_CONFIDENCE)
+    """
+    z = normal_quantile(p)
+    if df <= 0:
+        return z
+    g1 = (z**3 + z) / 4
+    g2 = (5*z**5 + 16*z**3 + 3*z) / 96
+    g3 = (3*z**7 + 19*z**5 + 17*z**3 - 15*z) / 384
+    g4 = (79*z**9 + 776*z**7 + 1482*z**5 - 1920*z**3 - 945*z) / 92160
+    return z + g1/df + g2/df**2 + g3/df**3 + g4/df**4
+
+def confidence_level(text: str) -> float:
+    """argparse type: interval confidence between 0.5 and MAX_CONFIDENCE"""
+    value = float(text)
+    if not 0.5 <= value <= MAX_CONFIDENCE:
+        raise argparse.ArgumentTypeError(f"must be between 0.5 and {MAX_CONFIDENCE}, got {value}")
+    return value
+
+def fit_linear_model(x: np.ndarray, y: np.ndarray) -> Dict:
+    """
+    Ordinary least squares y = b0 + b1*x with the pieces needed for intervals
+    """
+    design = np.column_stack([np.ones(len(x)), x])
+    coef, _, rank, _ = np.linalg.lstsq(design, y, rcond=None)
+    residuals = y - design @ coef
+    df = max(1, len(y) - rank)
+    sigma2 = float(residuals @ residuals) / df
+    xtx_inv = np.linalg.pinv(design.T @ design)
+    total_ss = float(((y - y.mean()) ** 2).sum())
+    r2 = 1 - float(residuals @ residuals) / total_ss if total_ss > 0 else 0.0
+
+    return {
+        'coef': coef,
+        'sigma2': sigma2,
+        'cov': sigma2 * xtx_inv,
+        'df': df,
+        'r2': r2,
+        'n': len(y)
+    }
+
+def predict_batch(model: Dict, x: np.ndarray, confidence: float) -> Dict:
+    """
+    Per-article predictions plus the batch total with its interval
+
+    Total variance = parameter uncertainty (shared by every article) +
+    independent per-article residual variance.
+    """
+    design = np.column_stack([np.ones(len(x)), x])
+    per_article = design @ model['coef']
+    per_article_var = np.einsum('ij,jk,ik->i', design, model['cov'], design) + model['sigma2']
+
+    design_sum = design.sum(axis=0)
+    total = float(per_article.sum())
+    total_var = float(design_sum @ model['cov'] @ design_sum) + len(x) * model['sigma2']
+
+    t = t_quantile(0.5 + confidence / 2, model['df'])
+    half_width = t * math.sqrt(max(total_var, 0.0))
+    per_article_half = t * np.sqrt(np.clip(per_article_var, 0, None))
+
+    return {
+        'per_article': per_article,
+        'per_article_low': np.clip(per_article - per_article_half, 0, None),
+        'per_article_high': per_article + per_article_half,
+        'total': total,
+        'low': max(0.0, total - half_width),
+        'high': total + half_width
+    }
+
+def fit_forecast_models(json_dir: str = "json") -> Dict:
+    """
+    Fit one model per forecast target (and per phase) on the processed corpus
+    """
+    table = load_metrics_table(json_dir)
+    pages = np.minimum(table['topics_total_pages'], TOPICS_PAGE_CAP).astype(float)
+    valid = (pages > 0) & (table['total_cost'] > 0)
+
+    models = {}
+    for column, _, _ in FORECAST_TARGETS:
+        models[column] = fit_linear_model(pages[valid], table[column][valid].astype(float))
+    for columns in PHASE_TARGETS.values():
+        for column in columns:
+            models[column] = fit_linear_model(pages[valid], table[column][valid].astype(float))
+
+    return {
+        'models': models,
+        'corpus_size': int(valid.sum()),
+        'median_pages': float(np.median(pages[valid])) if valid.any() else 0.0,
+        'page_range': (int(pages[valid].min()), int(pages[valid].max())) if valid.any() else (0, 0)
+    }
+
+def format_value(value: float, unit: str) -> str:
+    if unit == 'USD':
+        return f"${value:,.4f}"
+    if unit == 'ms':
+        hours = value / 3_600_000
+        return f"{hours:,.2f} h" if hours >= 1 else f"{value / 60_000:,.1f} min"
+    return f"{value:,.0f}"
+
+def generate_forecast_report(fit: Dict, names: List[str], pages: np.ndarray, imputed: int,
+                             predictions: Dict, confidence: float, workers: int) -> str:
+    """
+    Generate the forecast report
+    """
+    capped = np.minimum(pages, TOPICS_PAGE_CAP)
+    lines = ["Batch Cost and Latency Forecast", ""]
+    lines.append(f"Batch: {len(names)} PDFs, {int(pages.sum())} pages "
+                 f"(median {np.median(pages):.0f}, range {int(pages.min())}-{int(pages.max())}; "
+                 f"{imputed} page counts imputed with the corpus median).")
+    lines.append(f"Model: per-article OLS on min(pages, {TOPICS_PAGE_CAP}) fitted on {fit['corpus_size']} "
+                 f"processed articles (pages {fit['page_range'][0]}-{fit['page_range'][1]}); "
+                 f"{confidence*100:.0f}% intervals.")
+    if capped.max() > fit['page_range'][1] or capped.min() < fit['page_range'][0]:
+        lines.append("⚠️ Some PDFs fall outside the fitted page range; their forecasts are extrapolated.")
+    lines.append("")
+
+    lines.append("| Quantity          | Forecast total       | Lower bound          | Upper bound          | Per article | R²    |")
+    lines.append("|-------------------|----------------------|----------------------|----------------------|-------------|-------|")
+    for column, label, unit in FORECAST_TARGETS:
+        pred = predictions[column]
+        per_article = pred['total'] / len(names) if names else 0
+        lines.append(f"| {label:<17} | {format_value(pred['total'], unit):>20} | "
+                     f"{format_value(pred['low'], unit):>20} | {format_value(pred['high'], unit):>20} | "
+                     f"{format_value(per_article, unit):>11} | {fit['models'][column]['r2']:5.2f} |")
+    lines.append("")
+
+    lines.append("Phase breakdown (point forecasts):")
+    for label, columns in PHASE_TARGETS.items():
+        unit = next(u for c, l, u in FORECAST_TARGETS if l == label)
+        parts = [f"{column.split('_')[0].title()}: {format_value(predictions[column]['total'], unit)}"
+                 for column in columns]
+        lines.append(f"   {label}: {', '.join(parts)}")
+    lines.append("")
+
+    time_pred = predictions['total_time_ms']
+    lines.append(
+        f"Wall time with {workers} parallel article worker(s), assuming no shared bottleneck: "
+        f"{format_value(time_pred['total'] / workers, 'ms')} "
+        f"({format_value(time_pred['low'] / workers, 'ms')} - {format_value(time_pred['high'] / workers, 'ms')}). "
+        f"Use simulate_pipeline.py to account for per-stage and per-API limits."
+    )
+
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to forecast a new review batch
+    """
+    parser = argparse.ArgumentParser(description="Forecast cost, tokens and time of a new review batch")
+    parser.add_argument('--pdf-dir', default=None, help="folder of input PDFs (searched recursively)")
+    parser.add_argument('--pages-csv', default=None, help="CSV of filename,pages (skips reading PDFs)")
+    parser.add_argument('--confidence', type=confidence_level, default=0.95)
+    parser.add_argument('--workers', type=int, default=1, help="articles processed in parallel")
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--manifest', default='plots/article_manifest.json',
+                        help="article manifest whose page counts are reused for known PDFs")
+    parser.add_argument('--output', default='plots/forecast_report.txt')
+    parser.add_argument('--per-pdf-csv', default=None, help="optional per-PDF forecast CSV")
+    args = parser.parse_args()
+
+    print("💵 INFINITY RESEARCH - Batch Forecaster")
+    print("=" * 50)
+
+    if not args.pdf_dir and not args.pages_csv:
+        args.pdf_dir = 'pdfs'
+
+    print("📊 Fitting forecast models on the processed corpus...")
+    fit = fit_forecast_models(args.json_dir)
+    if fit['corpus_size'] < 3:
+        print("❌ Not enough processed articles to fit the forecast models!")
+        return
+    for column, label, _ in FORECAST_TARGETS:
+        model = fit['models'][column]
+        print(f"   {label}: intercept {model['coef'][0]:.6g}, per page {model['coef'][1]:.6g}, R² {model['r2']:.2f}")
+
+    print("\n📁 Reading batch page counts...")
+    names, pages = load_batch_page_counts(args.pdf_dir, args.pages_csv, args.manifest)
+    if len(names) == 0:
+        print("❌ No PDFs or page counts found!")
+        return
+    missing = np.isnan(pages)
+    pages[missing] = fit['median_pages']
+    print(f"   PDFs: {len(names)}, pages: {int(pages.sum())}, unreadable: {int(missing.sum())}")
+
+    x = np.minimum(pages, TOPICS_PAGE_CAP)
+    predictions = {column: predict_batch(model, x, args.confidence)
+                   for column, model in fit['models'].items()}
+
+    print(f"\n📝 Generating forecast report...")
+    report = generate_forecast_report(fit, names, pages, int(missing.sum()), predictions,
+                                      args.confidence, max(1, args.workers))
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(report)
+    print(f"   ✅ Report saved: {args.output}")
+
+    if args.per_pdf_csv:
+        with open(args.per_pdf_csv, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            header = ['filename', 'pages']
+            for column, _, _ in FORECAST_TARGETS:
+                header += [column, f'{column}_low', f'{column}_high']
+            writer.writerow(header)
+            for i, name in enumerate(names):
+                row = [name, int(pages[i])]
+                for column, _, _ in FORECAST_TARGETS:
+                    pred = predictions[column]
+                    row += [f"{pred['per_article'][i]:.6f}", f"{pred['per_article_low'][i]:.6f}",
+                            f"{pred['per_article_high'][i]:.6f}"]
+                writer.writerow(row)
+        print(f"   ✅ Per-PDF forecast saved: {args.per_pdf_csv}")
+
+    print(f"\n🎯 Batch forecast complete!")
+    print(f"   📊 Report: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -5,312 +5,13 @@
 
 Generates the Infinity Research Real Accuracy Performance table (Section 4.8)
 calculating actual accuracy directly from analysis_claude.json and analysis_deepseek.json
+joined with the conflict resolutions (see accuracy_engine.py).
 
-Input: analysis_claude.json + analysis_deepseek.json + conflicts.json
+Input: analysis_claude.json + analysis_deepseek.json + conflicts.txt
 Output: accuracy_table.txt with real calculated accuracy metrics
 """
 
-import json
-import os
-from collections import defaultdict
-
-def extract_accuracy_from_analysis(claude_file: str, deepseek_file: str, conflicts_file: str) -> dict:
-    """
-    Extract real accuracy data from analysis files and conflicts resolution
-    """
-    
-    # Load analysis files
-    with open(claude_file, 'r', encoding='utf-8') as f:
-        claude_data = json.load(f)
-    
-    with open(deepseek_file, 'r', encoding='utf-8') as f:
-        deepseek_data = json.load(f)
-    
-    # Load conflicts file 
-    with open(conflicts_file, 'r', encoding='utf-8') as f:
-        conflicts_content = f.read()
-    
-    print(f"📊 Real Accuracy Analysis:")
-    print(f"   Claude articles: {len(claude_data)}")
-    print(f"   DeepSeek articles: {len(deepseek_data)}")
-    
-    # Parse conflicts resolutions
-    conflicts_resolutions = parse_conflicts_resolutions(conflicts_content)
-    
-    # Count total field comparisons
-    total_comparisons = 0
-    concordant_fields = 0
-    
-    # Count conflicts by source
-    claude_only_total = 0
-    claude_only_infinity = 0  
-    claude_only_manual = 0
-    claude_only_both = 0
-    
-    deepseek_only_total = 0
-    deepseek_only_infinity = 0
-    deepseek_only_manual = 0  
-    deepseek_only_both = 0
-    
-    both_models_total = 0
-    both_models_infinity = 0
-    both_models_manual = 0
-    both_models_both = 0
-    
-    # Process each article's fields to count total comparisons
-    for article_idx in range(min(len(claude_data), len(deepseek_data))):
-        claude_article = claude_data[article_idx]
-        deepseek_article = deepseek_data[article_idx]
-        
-        claude_fields = claude_article['fields']
-        deepseek_fields = deepseek_article['fields']
-        
-        # Process each field
-        for field_name in claude_fields:
-            if field_name not in deepseek_fields:
-                continue
-                
-            claude_field = claude_fields[field_name]
-            deepseek_field = deepseek_fields[field_name]
-            
-            # Handle multi-part fields (Author, Year, Study Type)
-            if field_name == "Author, Year, Study Type":
-                # Process sub-fields
-                for sub_field in ['author', 'year', 'study_type']:
-                    if f'{sub_field}_classification' in claude_field['analysis'] and f'{sub_field}_classification' in deepseek_field['analysis']:
-                        total_comparisons += 1
-                        
-                        claude_class = claude_field['analysis'][f'{sub_field}_classification']
-                        deepseek_class = deepseek_field['analysis'][f'{sub_field}_classification']
-                        
-                        # Check if concordant (both A, B, or C)
-                        if claude_class in ['A', 'B', 'C'] and deepseek_class in ['A', 'B', 'C']:
-                            concordant_fields += 1
-            else:
-                # Single field
-                if 'classification' in claude_field['analysis'] and 'classification' in deepseek_field['analysis']:
-                    total_comparisons += 1
-                    
-                    claude_class = claude_field['analysis']['classification']
-                    deepseek_class = deepseek_field['analysis']['classification']
-                    
-                    # Check if concordant
-                    if claude_class in ['A', 'B', 'C'] and deepseek_class in ['A', 'B', 'C']:
-                        concordant_fields += 1
-    
-    # Apply conflicts resolutions from conflicts.json
-    claude_only_total = conflicts_resolutions['claude_only']['total']
-    claude_only_infinity = conflicts_resolutions['claude_only']['infinity_correct']
-    claude_only_manual = conflicts_resolutions['claude_only']['manual_correct']
-    claude_only_both = conflicts_resolutions['claude_only']['both_correct']
-    
-    deepseek_only_total = conflicts_resolutions['deepseek_only']['total']
-    deepseek_only_infinity = conflicts_resolutions['deepseek_only']['infinity_correct']
-    deepseek_only_manual = conflicts_resolutions['deepseek_only']['manual_correct']
-    deepseek_only_both = conflicts_resolutions['deepseek_only']['both_correct']
-    
-    both_models_total = conflicts_resolutions['both_models']['total']
-    both_models_infinity = conflicts_resolutions['both_models']['infinity_correct']
-    both_models_manual = conflicts_resolutions['both_models']['manual_correct']
-    both_models_both = conflicts_resolutions['both_models']['both_correct']
-    
-    # Calculate totals
-    total_conflicts = claude_only_total + deepseek_only_total + both_models_total
-    total_infinity_correct = concordant_fields + claude_only_infinity + deepseek_only_infinity + both_models_infinity
-    total_manual_correct = concordant_fields + claude_only_manual + deepseek_only_manual + both_models_manual
-    total_both_correct = concordant_fields + claude_only_both + deepseek_only_both + both_models_both
-    
-    print(f"\n📈 REAL ACCURACY RESULTS:")
-    print(f"   Total comparisons: {total_comparisons}")
-    print(f"   Concordant fields: {concordant_fields}")
-    print(f"   Total conflicts: {total_conflicts}")
-    print(f"   Infinity total correct: {total_infinity_correct}")
-    print(f"   Manual total correct: {total_manual_correct}")
-    print(f"   Both total correct: {total_both_correct}")
-    
-    return {
-        'total_comparisons': total_comparisons,
-        'concordant': {
-            'count': concordant_fields,
-            'infinity_correct': concordant_fields,
-            'manual_correct': concordant_fields,
-            'both_correct': concordant_fields
-        },
-        'claude_only': {
-            'count': claude_only_total,
-            'infinity_correct': claude_only_infinity,
-            'manual_correct': claude_only_manual,
-            'both_correct': claude_only_both
-        },
-        'deepseek_only': {
-            'count': deepseek_only_total,
-            'infinity_correct': deepseek_only_infinity,
-            'manual_correct': deepseek_only_manual,
-            'both_correct': deepseek_only_both
-        },
-        'both_models': {
-            'count': both_models_total,
-            'infinity_correct': both_models_infinity,
-            'manual_correct': both_models_manual,
-            'both_correct': both_models_both
-        },
-        'totals': {
-            'infinity_correct': total_infinity_correct,
-            'manual_correct': total_manual_correct,
-            'both_correct': total_both_correct,
-            'total_conflicts': total_conflicts
-        }
-    }
-
-def parse_conflicts_resolutions(conflicts_content: str) -> dict:
-    """
-    Parse conflicts.json content to extract resolution outcomes
-    """
-    import re
-    
-    # From conflicts analysis, extract the exact numbers used in Table 4.7
-    # These come from manual resolution analysis in conflicts.json
-    
-    # Claude-only conflicts: 14 total
-    # From Table 4.7: 5 infinity correct, 3 manual correct, 6 both correct  
-    claude_only = {
-        'total': 14,
-        'infinity_correct': 5,
-        'manual_correct': 3,
-        'both_correct': 6
-    }
-    
-    # DeepSeek-only conflicts: 2 total
-    # From Table 4.7: 0 infinity, 0 manual, 2 both correct
-    deepseek_only = {
-        'total': 2,
-        'infinity_correct': 0,
-        'manual_correct': 0,
-        'both_correct': 2
-    }
-    
-    # Both models conflicts: 11 total  
-    # From Table 4.7: 6 infinity correct, 5 manual correct, 0 both correct
-    both_models = {
-        'total': 11,
-        'infinity_correct': 6,
-        'manual_correct': 5,
-        'both_correct': 0
-    }
-    
-    return {
-        'claude_only': claude_only,
-        'deepseek_only': deepseek_only,
-        'both_models': both_models
-    }
-
-def generate_real_accuracy_table(data: dict) -> str:
-    """
-    Generate the real accuracy performance table
-    """
-    table = ["4.8 Infinity Research Real Accuracy Performance", ""]
-    table.append("| Category                 | Cases | Infinity    | Manual      | Both        | Infinity                  |")
-    table.append("|                          |       | Correct     | Correct     | Correct     | Accuracy                  |")
-    table.append("|--------------------------|-------|-------------|-------------|-------------|---------------------------|")
-    
-    total_comparisons = data['total_comparisons']
-    
-    # Automatic Concordance
-    concordant = data['concordant']
-    table.append(f"| Automatic Concordance    | {concordant['count']:3d}   | {concordant['infinity_correct']:3d}         | {concordant['manual_correct']:3d}         | {concordant['both_correct']:3d}         | {concordant['infinity_correct']}/{concordant['count']} (100%)        |")
-    
-    # Conflicts - Claude Only
-    claude = data['claude_only']
-    if claude['count'] > 0:
-        infinity_pct = f"({claude['infinity_correct']/claude['count']*100:.1f}%)"
-        manual_pct = f"({claude['manual_correct']/claude['count']*100:.1f}%)"
-        both_pct = f"({claude['both_correct']/claude['count']*100:.1f}%)"
-        accuracy_pct = f"({claude['infinity_correct']/claude['count']*100:.1f}%)"
-        table.append(f"| Conflicts - Claude Only  | {claude['count']:3d}   | {claude['infinity_correct']} {infinity_pct:<7} | {claude['manual_correct']} {manual_pct:<7} | {claude['both_correct']} {both_pct:<7} | {claude['infinity_correct']}/{claude['count']} {accuracy_pct:<8}        |")
-    
-    # Conflicts - DeepSeek Only
-    deepseek = data['deepseek_only']
-    if deepseek['count'] > 0:
-        infinity_pct = f"({deepseek['infinity_correct']/deepseek['count']*100:.1f}%)"
-        manual_pct = f"({deepseek['manual_correct']/deepseek['count']*100:.1f}%)"
-        both_pct = f"({deepseek['both_correct']/deepseek['count']*100:.1f}%)"
-        accuracy_pct = f"({deepseek['infinity_correct']/deepseek['count']*100:.1f}%)"
-        table.append(f"| Conflicts - DeepSeek Only| {deepseek['count']:3d}   | {deepseek['infinity_correct']} {infinity_pct:<9} | {deepseek['manual_correct']} {manual_pct:<9} | {deepseek['both_correct']} {both_pct:<7} | {deepseek['infinity_correct']}/{deepseek['count']} {accuracy_pct:<8}         |")
-    
-    # Conflicts - Both Models
-    both = data['both_models']
-    if both['count'] > 0:
-        infinity_pct = f"({both['infinity_correct']/both['count']*100:.1f}%)"
-        manual_pct = f"({both['manual_correct']/both['count']*100:.1f}%)"
-        both_pct = f"({both['both_correct']/both['count']*100:.1f}%)"
-        accuracy_pct = f"({both['infinity_correct']/both['count']*100:.1f}%)"
-        table.append(f"| Conflicts - Both Models  | {both['count']:3d}   | {both['infinity_correct']} {infinity_pct:<7} | {both['manual_correct']} {manual_pct:<7} | {both['both_correct']} {both_pct:<9} | {both['infinity_correct']}/{both['count']} {accuracy_pct:<8}        |")
-    
-    # Total Conflicts
-    totals = data['totals']
-    total_conflicts = totals['total_conflicts']
-    conflict_infinity = claude['infinity_correct'] + deepseek['infinity_correct'] + both['infinity_correct']
-    conflict_manual = claude['manual_correct'] + deepseek['manual_correct'] + both['manual_correct']
-    conflict_both = claude['both_correct'] + deepseek['both_correct'] + both['both_correct']
-    
-    if total_conflicts > 0:
-        conflict_inf_pct = f"({conflict_infinity/total_conflicts*100:.1f}%)"
-        conflict_man_pct = f"({conflict_manual/total_conflicts*100:.1f}%)"
-        conflict_both_pct = f"({conflict_both/total_conflicts*100:.1f}%)"
-        conflict_acc_pct = f"({conflict_infinity/total_conflicts*100:.1f}%)"
-        table.append(f"| Total Conflicts          | {total_conflicts:3d}   | {conflict_infinity:2d} {conflict_inf_pct:<7} | {conflict_manual:2d} {conflict_man_pct:<7} | {conflict_both:2d} {conflict_both_pct:<7} | {conflict_infinity}/{total_conflicts} {conflict_acc_pct:<8}        |")
-    
-    # Overall Performance
-    overall_infinity = totals['infinity_correct']
-    overall_manual = totals['manual_correct']
-    overall_both = totals['both_correct']
-    overall_inf_pct = f"({overall_infinity/total_comparisons*100:.1f}%)"
-    table.append(f"| **OVERALL PERFORMANCE**  | **{total_comparisons:3d}** | **{overall_infinity:3d}**       | **{overall_manual:3d}**       | **{overall_both:3d}**       | **{overall_infinity}/{total_comparisons} {overall_inf_pct:<8}** |")
-    
-    return "\n".join(table)
-
-def main():
-    """
-    Main function to generate real accuracy performance table
-    """
-    print("📊 INFINITY RESEARCH - Real Accuracy Performance Table Generator")
-    print("=" * 75)
-    
-    # File paths
-    claude_file = "analysis/analysis_claude.json"
-    deepseek_file = "analysis/analysis_deepseek.json"
-    conflicts_file = "analysis/conflicts.json"
-    
-    if not os.path.exists(claude_file):
-        print(f"❌ Error: {claude_file} not found!")
-        return
-        
-    if not os.path.exists(deepseek_file):
-        print(f"❌ Error: {deepseek_file} not found!")
-        return
-        
-    if not os.path.exists(conflicts_file):
-        print(f"❌ Error: {conflicts_file} not found!")
-        return
-    
-    print("📊 Calculating real accuracy from analysis JSONs and conflicts...")
-    
-    # Extract real accuracy data
-    data = extract_accuracy_from_analysis(claude_file, deepseek_file, conflicts_file)
-    
-    # Generate table
-    print(f"\n📝 Generating real accuracy performance table...")
-    table_content = generate_real_accuracy_table(data)
-    
-    # Save table
-    output_file = "plots/accuracy_table.txt"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(table_content)
-    
-    print(f"   ✅ Table saved: {output_file}")
-    
-    print(f"\n🎯 Real accuracy performance table generation complete!")
-    print(f"   📊 Table: {output_file}")
+from accuracy_engine import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(description="Table 3.8: Infinity Research Real Accuracy Performance")
@@ -3,191 +3,143 @@
 🔍 CONCORDANCE TABLE GENERATOR - Infinity Research Paper
 ========================================================
 
-Generates the Concordance Performance table comparing Claude 3.5 Sonnet vs DeepSeek V3
-analysis results against manual gold-standard across 152 field comparisons.
+Generates the Concordance Performance table comparing the evaluator models
+(Claude 3.5 Sonnet vs DeepSeek V3 in the paper, one column per
+analysis/analysis_<model>.json) against manual gold-standard across 152 field comparisons.
 
-Input: analysis_claude.json + analysis_deepseek.json
+Input: analysis/analysis_<model>.json (claude, deepseek, ...)
 Output: concordance_table.txt + summary statistics
 """
 
-import json
-import os
-from collections import defaultdict, Counter
-from typing import Dict, List, Tuple
+import argparse
+import textwrap
+from typing import Dict
 
-def extract_classifications_from_analysis(file_path: str) -> List[str]:
-    """
-    Extract all classification codes from analysis file
-    Returns list of classification codes (A, B, C, D, E, F)
-    """
-    classifications = []
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    for article in data:
-        for field_name, field_data in article['fields'].items():
-            analysis = field_data.get('analysis', {})
-            
-            # Handle multi-part fields (like Author, Year, Study Type)
-            if 'author_classification' in analysis:
-                # Multi-part field
-                for key in analysis:
-                    if key.endswith('_classification'):
-                        classifications.append(analysis[key])
-            elif 'classification' in analysis:
-                # Single classification field
-                classifications.append(analysis['classification'])
-    
-    return classifications
-
-def count_concordance_categories(classifications: List[str]) -> Dict[str, int]:
-    """
-    Count occurrences of each concordance category
-    """
-    counter = Counter(classifications)
-    
-    # Ensure all categories are present with 0 if missing
-    categories = ['A', 'B', 'C', 'D', 'E', 'F']
-    result = {}
-    for cat in categories:
-        result[cat] = counter.get(cat, 0)
-    
-    return result
-
-def calculate_percentages(counts: Dict[str, int], total: int) -> Dict[str, float]:
+import numpy as np
+
+from classification_table import (CATEGORIES, concordance_summary, discover_analysis_files, evaluator_name,
+                                  load_classification_table)
+
+CATEGORY_LABELS = [
+    'Category A (Equivalent)',
+    'Category B (Concordant with Detail)',
+    'Category C (Concordant with gaps in non-critical)',
+    'Category D (Factually Divergent)',
+    'Category E (Conceptually Different)',
+    'Category F (Incomparable)'
+]
+
+def calculate_percentages(counts: np.ndarray, totals: np.ndarray) -> np.ndarray:
     """
-    Calculate percentages for each category
+    Calculate percentages of counts over their (broadcast) totals
     """
-    percentages = {}
-    for category, count in counts.items():
-        percentages[category] = (count / total * 100) if total > 0 else 0
-    return percentages
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(totals > 0, counts / np.maximum(totals, 1) * 100, 0.0)
 
-def generate_concordance_table(claude_counts: Dict[str, int], deepseek_counts: Dict[str, int]) -> str:
+def generate_concordance_table(summary: Dict) -> str:
     """
-    Generate the concordance performance table
+    Generate the concordance performance table (one column per evaluator)
     """
-    claude_total = sum(claude_counts.values())
-    deepseek_total = sum(deepseek_counts.values())
-    
-    claude_pct = calculate_percentages(claude_counts, claude_total)
-    deepseek_pct = calculate_percentages(deepseek_counts, deepseek_total)
-    
-    # Calculate concordance groups
-    claude_strong = claude_counts['A'] + claude_counts['B']
-    claude_general = claude_counts['A'] + claude_counts['B'] + claude_counts['C']
-    
-    deepseek_strong = deepseek_counts['A'] + deepseek_counts['B']
-    deepseek_general = deepseek_counts['A'] + deepseek_counts['B'] + deepseek_counts['C']
-    
-    claude_strong_pct = (claude_strong / claude_total * 100) if claude_total > 0 else 0
-    claude_general_pct = (claude_general / claude_total * 100) if claude_total > 0 else 0
-    
-    deepseek_strong_pct = (deepseek_strong / deepseek_total * 100) if deepseek_total > 0 else 0
-    deepseek_general_pct = (deepseek_general / deepseek_total * 100) if deepseek_total > 0 else 0
-    
-    # Generate table
-    table = f"""4.5 Concordance Performance
-
-| Concordance Category                        | Claude 3.5 Sonnet     | DeepSeek V3           |
-|---------------------------------------------|------------------------|-----------------------|
-| Category A (Equivalent)                     | {claude_counts['A']:2d} ({claude_pct['A']:4.1f}%)        | {deepseek_counts['A']:2d} ({deepseek_pct['A']:4.1f}%)       |
-| Category B (Concordant with Detail)        | {claude_counts['B']:2d} ({claude_pct['B']:4.1f}%)        | {deepseek_counts['B']:2d} ({deepseek_pct['B']:4.1f}%)       |
-| Category C (Concordant with gaps in non-critical) | {claude_counts['C']:2d} ({claude_pct['C']:4.1f}%)        | {deepseek_counts['C']:2d} ({deepseek_pct['C']:4.1f}%)        |
-| Category D (Factually Divergent)           | {claude_counts['D']:2d} ({claude_pct['D']:4.1f}%)         | {deepseek_counts['D']:2d} ({deepseek_pct['D']:4.1f}%)        |
-| Category E (Conceptually Different)        | {claude_counts['E']:2d} ({claude_pct['E']:4.1f}%)         | {deepseek_counts['E']:2d} ({deepseek_pct['E']:4.1f}%)        |
-| Category F (Incomparable)                  | {claude_counts['F']:2d} ({claude_pct['F']:4.1f}%)         | {deepseek_counts['F']:2d} ({deepseek_pct['F']:4.1f}%)        |
-| **Strong Concordance (A+B)**               | **{claude_strong:3d} ({claude_strong_pct:4.1f}%)**    | **{deepseek_strong:3d} ({deepseek_strong_pct:4.1f}%)**   |
-| **General Concordance (A+B+C)**            | **{claude_general:3d} ({claude_general_pct:4.1f}%)**    | **{deepseek_general:3d} ({deepseek_general_pct:4.1f}%)**   |
-
-Automated extraction accuracy was evaluated through a structured comparison between
-machine-generated outputs and manually curated gold-standard data across cross
-comparisons ({claude_total} articles × 8 scientific fields). Each extraction was assessed using a six-level
-concordance classification, revealing nuanced patterns of agreement and conflict. Strong
-Concordance (Categories A + B) was observed in {claude_strong} cases ({claude_strong_pct:.1f}%) for Claude and {deepseek_strong}
-cases ({deepseek_strong_pct:.1f}%) for DeepSeek, where automated outputs either matched or preserved or
-preserved all core content while adding beneficial details. General Concordance (A + B + C),
-which also includes core manual information present with gaps in non-critical details"""
-    
-    return table
+    names = [evaluator_name(e) for e in summary['evaluators']]
+    counts = summary['counts']
+    totals = counts.sum(axis=1)
+    strong, general = summary['strong'].sum(axis=1), summary['general'].sum(axis=1)
+
+    category_pct = calculate_percentages(counts, totals[:, None])
+    strong_pct = calculate_percentages(strong, totals)
+    general_pct = calculate_percentages(general, totals)
+
+    rows = [(label, [f"{counts[e, c]:3d} ({category_pct[e, c]:4.1f}%)" for e in range(len(names))])
+            for c, label in enumerate(CATEGORY_LABELS)]
+    rows.append(('**Strong Concordance (A+B)**',
+                 [f"**{strong[e]:3d} ({strong_pct[e]:4.1f}%)**" for e in range(len(names))]))
+    rows.append(('**General Concordance (A+B+C)**',
+                 [f"**{general[e]:3d} ({general_pct[e]:4.1f}%)**" for e in range(len(names))]))
+
+    label_width = max(len('Concordance Category'), *(len(label) for label, _ in rows))
+    widths = [max(len(name), *(len(cells[e]) for _, cells in rows)) for e, name in enumerate(names)]
+
+    table = ["4.5 Concordance Performance", ""]
+    table.append(f"| {'Concordance Category':<{label_width}} | " +
+                 " | ".join(f"{name:<{w}}" for name, w in zip(names, widths)) + " |")
+    table.append(f"|{'-' * (label_width + 2)}|" + "|".join('-' * (w + 2) for w in widths) + "|")
+    for label, cells in rows:
+        table.append(f"| {label:<{label_width}} | " + " | ".join(f"{c:<{w}}" for c, w in zip(cells, widths)) + " |")
+
+    def per_evaluator(values, pct):
+        parts = [f"{values[e]} cases ({pct[e]:.1f}%) for {name}" for e, name in enumerate(names)]
+        return parts[0] if len(parts) == 1 else ", ".join(parts[:-1]) + " and " + parts[-1]
+
+    text = (f"Automated extraction accuracy was evaluated through a structured comparison between "
+            f"machine-generated outputs and manually curated gold-standard data across {totals[0]} "
+            f"comparisons ({summary['articles']} articles × 8 scientific fields). "
+            f"Each extraction was assessed using a six-level concordance classification, revealing nuanced "
+            f"patterns of agreement and conflict. Strong Concordance (Categories A + B) was observed in "
+            f"{per_evaluator(strong, strong_pct)}, where automated outputs either matched or preserved all "
+            f"core content while adding beneficial details. General Concordance (A + B + C), which also "
+            f"includes core manual information present with gaps in non-critical details, was observed in "
+            f"{per_evaluator(general, general_pct)}.")
+    table.append("")
+    table.append(textwrap.fill(text, width=92, break_on_hyphens=False))
+    return "\n".join(table)
 
 def main():
     """
     Main function to generate concordance table
     """
+    parser = argparse.ArgumentParser(description="Concordance performance table for every evaluator")
+    parser.add_argument('--analysis-dir', default='analysis', help="Directory of analysis_<model>.json files")
+    parser.add_argument('--output', default='plots/concordance_table.txt')
+    args = parser.parse_args()
+
     print("🔍 INFINITY RESEARCH - Concordance Table Generator")
     print("=" * 60)
-    
-    # File paths
-    claude_file = "analysis/analysis_claude.json"
-    deepseek_file = "analysis/analysis_deepseek.json"
-    
-    if not os.path.exists(claude_file):
-        print(f"❌ Error: {claude_file} not found!")
-        return
-        
-    if not os.path.exists(deepseek_file):
-        print(f"❌ Error: {deepseek_file} not found!")
+
+    files = discover_analysis_files(args.analysis_dir)
+    if not files:
+        print(f"❌ Error: no analysis_*.json files found in {args.analysis_dir}!")
         return
-    
-    print("📊 Extracting classification data...")
-    
-    # Extract classifications
-    claude_classifications = extract_classifications_from_analysis(claude_file)
-    deepseek_classifications = extract_classifications_from_analysis(deepseek_file)
-    
-    print(f"   Claude classifications: {len(claude_classifications)} fields")
-    print(f"   DeepSeek classifications: {len(deepseek_classifications)} fields")
-    
-    # Count categories
-    claude_counts = count_concordance_categories(claude_classifications)
-    deepseek_counts = count_concordance_categories(deepseek_classifications)
-    
+
+    print(f"📊 Extracting classification data ({len(files)} evaluators)...")
+
+    # Distributions and concordance groups of all evaluators (one group-by over the classification table)
+    summary = concordance_summary(load_classification_table(files))
+    totals = summary['counts'].sum(axis=1)
+
+    for evaluator, total in zip(summary['evaluators'], totals):
+        print(f"   {evaluator_name(evaluator)} classifications: {total} fields")
+
     print(f"\n📈 CONCORDANCE ANALYSIS RESULTS:")
     print("=" * 50)
-    
+
     # Display detailed counts
-    print("🎯 Claude 3.5 Sonnet:")
-    for category, count in claude_counts.items():
-        total = sum(claude_counts.values())
-        pct = (count / total * 100) if total > 0 else 0
-        print(f"   Category {category}: {count:2d} ({pct:4.1f}%)")
-    
-    print("\n🎯 DeepSeek V3:")
-    for category, count in deepseek_counts.items():
-        total = sum(deepseek_counts.values())
-        pct = (count / total * 100) if total > 0 else 0
-        print(f"   Category {category}: {count:2d} ({pct:4.1f}%)")
-    
+    pct = calculate_percentages(summary['counts'], totals[:, None])
+    for e, evaluator in enumerate(summary['evaluators']):
+        print(f"🎯 {evaluator_name(evaluator)}:")
+        for c, category in enumerate(CATEGORIES):
+            print(f"   Category {category}: {summary['counts'][e, c]:2d} ({pct[e, c]:4.1f}%)")
+        print()
+
     # Generate table
-    print(f"\n📝 Generating concordance table...")
-    table_content = generate_concordance_table(claude_counts, deepseek_counts)
-    
+    print(f"📝 Generating concordance table...")
+    table_content = generate_concordance_table(summary)
+
     # Save table
-    output_file = "plots/concordance_table.txt"
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with open(args.output, 'w', encoding='utf-8') as f:
         f.write(table_content)
-    
-    print(f"   ✅ Table saved: {output_file}")
-    
+
+    print(f"   ✅ Table saved: {args.output}")
+
     # Display summary
-    claude_total = sum(claude_counts.values())
-    deepseek_total = sum(deepseek_counts.values())
-    
-    claude_strong = claude_counts['A'] + claude_counts['B']
-    deepseek_strong = deepseek_counts['A'] + deepseek_counts['B']
-    
-    claude_general = claude_counts['A'] + claude_counts['B'] + claude_counts['C']
-    deepseek_general = deepseek_counts['A'] + deepseek_counts['B'] + deepseek_counts['C']
-    
+    strong, general = summary['strong'].sum(axis=1), summary['general'].sum(axis=1)
     print(f"\n🎯 KEY METRICS:")
-    print(f"   Total field comparisons: {claude_total} (Claude), {deepseek_total} (DeepSeek)")
-    print(f"   Strong Concordance (A+B): {claude_strong}/{claude_total} ({claude_strong/claude_total*100:.1f}%) vs {deepseek_strong}/{deepseek_total} ({deepseek_strong/deepseek_total*100:.1f}%)")
-    print(f"   General Concordance (A+B+C): {claude_general}/{claude_total} ({claude_general/claude_total*100:.1f}%) vs {deepseek_general}/{deepseek_total} ({deepseek_general/deepseek_total*100:.1f}%)")
-    
+    for e, evaluator in enumerate(summary['evaluators']):
+        print(f"   {evaluator_name(evaluator)}: {totals[e]} field comparisons, "
+              f"Strong (A+B) {strong[e]}/{totals[e]} ({strong[e] / totals[e] * 100:.1f}%), "
+              f"General (A+B+C) {general[e]}/{totals[e]} ({general[e] / totals[e] * 100:.1f}%)")
+
     print(f"\n🎯 Concordance table generation complete!")
-    print(f"   📊 Table: {output_file}")
+    print(f"   📊 Table: {args.output}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
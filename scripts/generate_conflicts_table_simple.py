@@ -4,247 +4,211 @@
 ================================================================
 
 Generates the Manual Resolution of Conflicts table (Section 4.7)
-directly from the conflicts.json text report.
+directly from the structured records of the conflicts report (conflicts_parser).
+Rows are built from the (scope, category) pairs present in the report, in
+the paper's layout: field groups under a category (Years/Method/Type,
+Sample Size, ...) and the reviewers' Key Insights. With --detailed, a
+second table lists every field of a category, the conflicts without a
+reviewer verdict (Unresolved) and the articles of each row.
 
-Input: conflicts.json (text format)
-Output: conflicts_table.txt with detailed conflict resolution analysis
+Input: analysis/conflicts.txt
+Output: conflicts_table.txt (+ conflicts_table_detailed.txt with --detailed)
 """
 
-import re
+import argparse
 import os
+import textwrap
+from typing import Dict, List
+
+from conflicts_parser import CATEGORY_LABELS, DEFAULT_CONFLICTS_FILE, SCOPE_HEADERS, SCOPES, parse_conflicts_report, \
+    resolution_counts
+
+VERDICT_COLUMNS = ['infinity', 'manual', 'both', 'unresolved']
+SCOPE_LABELS = {scope: header for header, scope in SCOPE_HEADERS.items()}
+# Articles listed per row before the rest is summarized as "+N"
+MAX_ARTICLES = 8
+
+# Paper layout: scope labels of the first and subtotal rows, field groups shown under a category
+PAPER_SCOPE_LABELS = {
+    'claude_only': ('Claude-only', 'Claude Subtotal'),
+    'deepseek_only': ('DeepSeek-only', 'DeepSeek Subtotal'),
+    'both_models': ('Both models agree', 'Both Subtotal')
+}
+PAPER_GROUPS = {
+    ('claude_only', 'D'): [('Years/Method/Type', ['Year', 'Methodology', 'Study Type']),
+                           ('Sample Size', ['Sample Size'])],
+    ('both_models', 'D'): [('Years', ['Year']), ('Study Type', ['Study Type'])]
+}
+# Reviewers' reading of each row, keyed by (scope, row label); rows without one are left blank
+# (text is wrapped to the column, tuples are lines already broken as in the paper)
+KEY_INSIGHTS = {
+    ('claude_only', 'D (Factual)'): "Balanced performance in factual domains",
+    ('claude_only', 'Years/Method/Type'): "Infinity precise: correct year 2024, proper technology used and "
+                                          "cross-sectional study definition",
+    ('claude_only', 'Sample Size'): "Manual captured additional subgroup information as students and experts; "
+                                    "infinity presented analytic final sample",
+    ('claude_only', 'E (Conceptual)'): "Infinity identified correct telepresence focus. Different valid "
+                                       "perspectives on same phenomena",
+    ('claude_only', 'F (Incomparable)'): "Protocol limitation approaches both defensible",
+    ('claude_only', 'subtotal'): "High complementarity with balanced factual performance",
+    ('deepseek_only', 'E (Conceptual)'): "Perfect complementarity in specialized domains",
+    ('deepseek_only', 'subtotal'): "Perfect complementarity in specialized domains",
+    ('both_models', 'D (Factual)'): "Infinity dominates temporal and technical precision",
+    ('both_models', 'Years'): "Infinity: 2023, 2022, 2024, 2025, 2019. Manual: one 2024 case",
+    ('both_models', 'Study Type'): "Infinity provided more precise study type description vs Manual's "
+                                   "simplified categorization",
+    ('both_models', 'F (Incomparable)'): "Manual correctly conservative on study protocols lack findings; "
+                                         "Infinity presented planned outcomes in studies protocol",
+    ('both_models', 'subtotal'): "Manual correctly recognized study protocols lack findings; Infinity presented "
+                                 "planned outcomes in studies protocol",
+    ('total', 'total'): ("**Infinity: temporal/technical.**", "**Manual: numerical/protocol**", "**awareness**")
+}
+SOURCE_WIDTH = 14
+INSIGHT_WIDTH = 38
+
+def field_label(record: Dict) -> str:
+    """'Sample_Size' -> 'Sample Size'; subfield of composite fields ('Year', 'Study Type')"""
+    return (record['subfield'] or record['field']).replace('_', ' ')
 
 def parse_conflicts_file(file_path: str) -> dict:
     """
-    Parse the conflicts.json text file and extract conflict data
+    Parse the conflicts report and count the resolutions per scope, category and field
+    Returns {'rows': {scope: [(category label, counts, [(field, counts), ...], [(group, counts), ...]), ...]},
+    'totals': {...}} (scopes, categories and groups without conflicts are left out).
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Extract summary statistics
-    claude_only = int(re.search(r'Claude-only conflicts: (\d+)', content).group(1))
-    deepseek_only = int(re.search(r'DeepSeek-only conflicts: (\d+)', content).group(1))
-    both_models = int(re.search(r'Both models \(same category\): (\d+)', content).group(1))
-    total_conflicts = int(re.search(r'Total unique conflicts: (\d+)', content).group(1))
-    
-    print(f"📊 Summary from conflicts.json:")
-    print(f"   Claude-only: {claude_only}")
-    print(f"   DeepSeek-only: {deepseek_only}")
-    print(f"   Both models: {both_models}")
-    print(f"   Total: {total_conflicts}")
-    
-    # Count resolution patterns by analyzing "Correct" statements
-    
-    # Claude-only D (Factual) - 7 instances
-    claude_d_factual = {
-        'total': 7,
-        'infinity': 3,  # Articles 4, 1, 16 (2 infinity + 1 both)
-        'manual': 3,    # Articles 7, 2, 5 (3 manual)
-        'both': 1       # Article 14 (both correct)
-    }
-    
-    # Claude-only E (Conceptual) - 6 instances
-    claude_e_conceptual = {
-        'total': 6,
-        'infinity': 2,  # Articles 14, 11 (infinity correct)
-        'manual': 0,    # None manual only
-        'both': 4       # Articles 18, 2, 3, 17 (both correct)
-    }
-    
-    # Claude-only F (Incomparable) - 1 instance
-    claude_f_incomparable = {
-        'total': 1,
-        'infinity': 0,  # None infinity only
-        'manual': 0,    # None manual only
-        'both': 1       # Article 10 (both defensible)
-    }
-    
-    # DeepSeek-only E (Conceptual) - 2 instances
-    deepseek_e_conceptual = {
-        'total': 2,
-        'infinity': 0,  # None infinity only
-        'manual': 0,    # None manual only
-        'both': 2       # Articles 19, 8 (both correct)
-    }
-    
-    # Both models agree D (Factual) - 7 instances (years)
-    both_d_factual = {
-        'total': 7,
-        'infinity': 6,  # 6 cases where infinity was correct
-        'manual': 1,    # 1 case where manual was correct (Article 18)
-        'both': 0       # No cases where both were correct
-    }
-    
-    # Both models agree F (Incomparable) - 4 instances
-    both_f_incomparable = {
-        'total': 4,
-        'infinity': 0,  # Manual was correct on protocols
-        'manual': 4,    # Articles 9, 10, 17 - manual conservative correct
-        'both': 0       # No both correct
-    }
-    
-    return {
-        'claude_only': {
-            'D (Factual)': claude_d_factual,
-            'E (Conceptual)': claude_e_conceptual,
-            'F (Incomparable)': claude_f_incomparable
-        },
-        'deepseek_only': {
-            'E (Conceptual)': deepseek_e_conceptual
-        },
-        'both_models': {
-            'D (Factual)': both_d_factual,
-            'F (Incomparable)': both_f_incomparable
-        },
-        'totals': {
-            'claude_only': claude_only,
-            'deepseek_only': deepseek_only,
-            'both_models': both_models,
-            'total': total_conflicts
-        }
-    }
+    records = parse_conflicts_report(file_path)['records']
+    totals = {scope: resolution_counts(records, scope=scope) for scope in SCOPES}
+    totals['total'] = resolution_counts(records)
+    
+    print(f"📊 Summary from {file_path}:")
+    for scope in SCOPES:
+        print(f"   {SCOPE_LABELS[scope]}: {totals[scope]['total']}")
+    print(f"   Total: {totals['total']['total']} ({totals['total']['unresolved']} unresolved)")
+    
+    rows = {}
+    for scope in SCOPES:
+        for category, label in CATEGORY_LABELS.items():
+            selected = [r for r in records if r['scope'] == scope and r['category'] == category]
+            if not selected:
+                continue
+            fields = list(dict.fromkeys(field_label(r) for r in selected))
+            breakdown = [(field, _counts([r for r in selected if field_label(r) == field])) for field in fields]
+            groups = [(group, _counts([r for r in selected if field_label(r) in members]))
+                      for group, members in PAPER_GROUPS.get((scope, category), [])]
+            rows.setdefault(scope, []).append((label, _counts(selected), breakdown,
+                                               [(group, counts) for group, counts in groups if counts['total']]))
+    return {'rows': rows, 'totals': totals}
+
+def _counts(records: List[Dict]) -> Dict:
+    """resolution_counts of a record subset, plus the (sorted, unique) article numbers"""
+    counts = resolution_counts(records)
+    counts['articles'] = sorted({r['article'] for r in records})
+    return counts
+
+def _cells(counts: Dict) -> List[str]:
+    """N, one 'n (p%)' cell per verdict and the article list of a row"""
+    total = counts['total']
+    cells = [str(total)] + [f"{counts[key]} ({counts[key] / total * 100 if total else 0:.0f}%)"
+                            for key in VERDICT_COLUMNS]
+    articles = counts.get('articles', [])
+    listed = ", ".join(map(str, articles[:MAX_ARTICLES]))
+    if len(articles) > MAX_ARTICLES:
+        listed += f" +{len(articles) - MAX_ARTICLES}"
+    return cells + [listed]
+
+def _render(headers: List, body: List[List[str]]) -> str:
+    """Aligned table; cells may hold several lines (lists), rows grow to the tallest cell"""
+    body = [[c if isinstance(c, list) else [c] for c in cells] for cells in body]
+    widths = [max(len(headers[c][0]), len(headers[c][1]), *(len(line) for r in body for line in r[c]))
+              for c in range(len(headers))]
+    table = ["4.7 Manual Resolution of Conflicts", ""]
+    for line in range(2):
+        table.append("| " + " | ".join(f"{h[line]:<{w}}" for h, w in zip(headers, widths)) + " |")
+    table.append("|" + "|".join('-' * (w + 2) for w in widths) + "|")
+    for cells in body:
+        for line in range(max(len(c) for c in cells)):
+            table.append("| " + " | ".join(f"{(c[line] if line < len(c) else ''):<{w}}"
+                                           for c, w in zip(cells, widths)) + " |")
+    return "\n".join(table)
+
+def _insight(scope: str, label: str) -> List[str]:
+    insight = KEY_INSIGHTS.get((scope, label), '')
+    if isinstance(insight, tuple):
+        return list(insight)
+    return textwrap.wrap(insight, INSIGHT_WIDTH, break_on_hyphens=False) or ['']
 
 def generate_conflicts_table(data: dict) -> str:
     """
-    Generate the conflicts resolution table exactly as shown in the image
+    Generate the conflicts resolution table in the paper's layout: one section per scope,
+    one row per conflict category followed by its field groups, and the Key Insights
     """
-    table = ["4.7 Manual Resolution of Conflicts", ""]
-    table.append("| Classification | Category / Field        | N  | Infinity     | Manual      | Both        | Key Insights                           |")
-    table.append("| Source         |                         |    |              |             |             |                                        |")
-    table.append("|----------------|-------------------------|----|--------------| ------------|-------------|----------------------------------------|")
-    
-    # Claude-only section
-    claude_data = data['claude_only']
-    
-    # D (Factual) - 7 instances
-    d_fact = claude_data['D (Factual)']
-    infinity_pct = f"({d_fact['infinity']/d_fact['total']*100:.0f}%)"
-    manual_pct = f"({d_fact['manual']/d_fact['total']*100:.0f}%)"
-    both_pct = f"({d_fact['both']/d_fact['total']*100:.0f}%)"
-    table.append(f"| Claude-only    | D (Factual)             | {d_fact['total']:2d} | {d_fact['infinity']} {infinity_pct:<6} | {d_fact['manual']} {manual_pct:<6} | {d_fact['both']} {both_pct:<6} | Balanced performance in factual        |")
-    table.append(f"|                |                         |    |              |             |             | domains                                |")
-    
-    # Years/Method/Type - 3 instances (subset of D factual)
-    table.append(f"|                | Years/Method/Type       |  3 | 3 (100%) | 0 (0%)   | 0 (0%)   | Infinity precise: correct year 2024,   |")
-    table.append(f"|                |                         |    |              |             |             | proper technology used and             |")
-    table.append(f"|                |                         |    |              |             |             | cross-sectional study definition       |")
-    
-    # Sample Size - 4 instances (subset of D factual)  
-    table.append(f"|                | Sample Size             |  4 | 0 (0%)   | 3 (75%) | 1 (25%) | Manual captured additional             |")
-    table.append(f"|                |                         |    |              |             |             | subgroup information as students       |")
-    table.append(f"|                |                         |    |              |             |             | and experts; infinity presented        |")
-    table.append(f"|                |                         |    |              |             |             | analytic final sample                  |")
-    
-    # E (Conceptual) - 6 instances
-    e_conc = claude_data['E (Conceptual)']
-    infinity_pct = f"({e_conc['infinity']/e_conc['total']*100:.0f}%)"
-    manual_pct = f"({e_conc['manual']/e_conc['total']*100:.0f}%)"
-    both_pct = f"({e_conc['both']/e_conc['total']*100:.0f}%)"
-    table.append(f"|                | E (Conceptual)          | {e_conc['total']:2d} | {e_conc['infinity']} {infinity_pct:<6} | {e_conc['manual']} {manual_pct:<6} | {e_conc['both']} {both_pct:<6} | Infinity identified correct           |")
-    table.append(f"|                |                         |    |              |             |             | telepresence focus. Different valid    |")
-    table.append(f"|                |                         |    |              |             |             | perspectives on same phenomena         |")
-    
-    # F (Incomparable) - 1 instance
-    f_incomp = claude_data['F (Incomparable)']
-    table.append(f"|                | F (Incomparable)        | {f_incomp['total']:2d} | {f_incomp['infinity']} (0%)   | {f_incomp['manual']} (100%) | {f_incomp['both']} (100%) | Protocol limitation approaches         |")
-    table.append(f"|                |                         |    |              |             |             | both defensible                        |")
-    
-    # Claude Subtotal
-    claude_total = data['totals']['claude_only']
-    claude_infinity = d_fact['infinity'] + e_conc['infinity'] + f_incomp['infinity'] 
-    claude_manual = d_fact['manual'] + e_conc['manual'] + f_incomp['manual']
-    claude_both = d_fact['both'] + e_conc['both'] + f_incomp['both']
-    
-    claude_inf_pct = f"({claude_infinity/claude_total*100:.0f}%)"
-    claude_man_pct = f"({claude_manual/claude_total*100:.0f}%)"
-    claude_both_pct = f"({claude_both/claude_total*100:.0f}%)"
-    table.append(f"| Claude         |                         | {claude_total:2d} | {claude_infinity} {claude_inf_pct:<6} | {claude_manual} {claude_man_pct:<6} | {claude_both} {claude_both_pct:<6} | High complementarity with             |")
-    table.append(f"| Subtotal       |                         |    |              |             |             | balanced factual performance           |")
-    
-    # DeepSeek-only section
-    deepseek_data = data['deepseek_only']
-    e_conc_ds = deepseek_data['E (Conceptual)']
-    table.append(f"| DeepSeek-only  | E (Conceptual)          | {e_conc_ds['total']:2d} | {e_conc_ds['infinity']} (0%)       | {e_conc_ds['manual']} (0%)      | {e_conc_ds['both']} (100%) | Perfect complementarity in             |")
-    table.append(f"|                |                         |    |              |             |             | specialized domains                    |")
-    
-    # DeepSeek Subtotal
-    deepseek_total = data['totals']['deepseek_only']
-    table.append(f"| DeepSeek       |                         | {deepseek_total:2d} | 0 (0%)       | 0 (0%)      | {e_conc_ds['both']} (100%) | Perfect complementarity in             |")
-    table.append(f"| Subtotal       |                         |    |              |             |             | specialized domains                    |")
-    
-    # Both models agree section
-    both_data = data['both_models']
-    
-    # D (Factual) - 7 instances
-    both_d = both_data['D (Factual)']
-    infinity_pct = f"({both_d['infinity']/both_d['total']*100:.0f}%)"
-    manual_pct = f"({both_d['manual']/both_d['total']*100:.0f}%)"
-    both_pct = f"({both_d['both']/both_d['total']*100:.0f}%)"
-    table.append(f"| Both models    | D (Factual)             | {both_d['total']:2d} | {both_d['infinity']} {infinity_pct:<6} | {both_d['manual']} {manual_pct:<6} | {both_d['both']} {both_pct:<6} | Infinity dominates temporal and        |")
-    table.append(f"| agree          |                         |    |              |             |             | technical precision                    |")
-    
-    # Years - 6 instances (subset of D factual)
-    table.append(f"|                | Years                   |  6 | 5 (83%)  | 1 (17%)  | 0 (0%)   | Infinity: 2023, 2022, 2024, 2025,     |")
-    table.append(f"|                |                         |    |              |             |             | 2019. Manual: one 2024 case           |")
-    
-    # Study Type - 1 instance (subset of D factual)
-    table.append(f"|                | Study Type              |  1 | 1 (100%) | 0 (0%)   | 0 (0%)   | Infinity provided more precise         |")
-    table.append(f"|                |                         |    |              |             |             | study type description vs Manual's     |")
-    table.append(f"|                |                         |    |              |             |             | simplified categorization              |")
-    
-    # F (Incomparable) - 4 instances
-    both_f = both_data['F (Incomparable)']
-    infinity_pct = f"({both_f['infinity']/both_f['total']*100:.0f}%)"
-    manual_pct = f"({both_f['manual']/both_f['total']*100:.0f}%)"
-    both_pct = f"({both_f['both']/both_f['total']*100:.0f}%)"
-    table.append(f"|                | F (Incomparable)        | {both_f['total']:2d} | {both_f['infinity']} {infinity_pct:<6} | {both_f['manual']} {manual_pct:<6} | {both_f['both']} {both_pct:<6} | Manual correctly conservative on       |")
-    table.append(f"|                |                         |    |              |             |             | study protocols lack findings;         |")
-    table.append(f"|                |                         |    |              |             |             | Infinity presented planned outcomes    |")
-    table.append(f"|                |                         |    |              |             |             | in studies protocol                    |")
-    
-    # Both Subtotal
-    both_total = data['totals']['both_models']
-    both_infinity = both_d['infinity'] + both_f['infinity']
-    both_manual = both_d['manual'] + both_f['manual']
-    both_both_total = both_d['both'] + both_f['both']
-    
-    both_inf_pct = f"({both_infinity/both_total*100:.0f}%)"
-    both_man_pct = f"({both_manual/both_total*100:.0f}%)"
-    both_both_pct = f"({both_both_total/both_total*100:.0f}%)"
-    table.append(f"| Both Subtotal  |                         | {both_total:2d} | {both_infinity} {both_inf_pct:<6} | {both_manual} {both_man_pct:<6} | {both_both_total} {both_both_pct:<6} | Manual correctly recognized study      |")
-    table.append(f"|                |                         |    |              |             |             | protocols lack findings; Infinity     |")
-    table.append(f"|                |                         |    |              |             |             | presented planned outcomes in          |")
-    table.append(f"|                |                         |    |              |             |             | studies protocol                       |")
-    
-    # Grand Total
-    grand_total = data['totals']['total']
-    grand_infinity = claude_infinity + 0 + both_infinity  # DeepSeek had 0 infinity
-    grand_manual = claude_manual + 0 + both_manual  # DeepSeek had 0 manual
-    grand_both = claude_both + e_conc_ds['both'] + both_both_total
-    
-    grand_inf_pct = f"({grand_infinity/grand_total*100:.0f}%)"
-    grand_man_pct = f"({grand_manual/grand_total*100:.0f}%)"
-    grand_both_pct = f"({grand_both/grand_total*100:.0f}%)"
-    table.append(f"| **TOTAL**      |                         | **{grand_total:2d}** | **{grand_infinity} {grand_inf_pct}** | **{grand_manual} {grand_man_pct}** | **{grand_both} {grand_both_pct}** | **Infinity: temporal/technical.**      |")
-    table.append(f"|                |                         |    |              |             |             | **Manual: numerical/protocol**        |")
-    table.append(f"|                |                         |    |              |             |             | **awareness**                          |")
-    
-    return "\n".join(table)
+    body = []
+    for scope in SCOPES:
+        if scope not in data['rows']:
+            continue
+        first, subtotal = PAPER_SCOPE_LABELS.get(scope, (SCOPE_LABELS[scope], f"{SCOPE_LABELS[scope]} Subtotal"))
+        source = textwrap.wrap(first, SOURCE_WIDTH)
+        for label, counts, _, groups in data['rows'][scope]:
+            body.append([source, label] + _cells(counts)[:4] + [_insight(scope, label)])
+            source = ''
+            body += [['', group] + _cells(group_counts)[:4] + [_insight(scope, group)] for group, group_counts in groups]
+        body.append([textwrap.wrap(subtotal, SOURCE_WIDTH), ''] + _cells(data['totals'][scope])[:4] +
+                    [_insight(scope, 'subtotal')])
+    body.append(['**TOTAL**', ''] + [f"**{c}**" for c in _cells(data['totals']['total'])[:4]] +
+                [_insight('total', 'total')])
+
+    headers = [('Classification', 'Source'), ('Category / Field', ''), ('N', ''), ('Infinity', 'Correct'),
+               ('Manual', 'Correct'), ('Both', 'Correct'), ('Key Insights', '')]
+    table = _render(headers, body)
+    unresolved = data['totals']['total']['unresolved']
+    if unresolved:
+        table += (f"\n\n{unresolved} conflicts have no reviewer verdict yet and are not counted as Infinity, "
+                  f"Manual or Both correct (see --detailed).")
+    return table
+
+def generate_detailed_table(data: dict) -> str:
+    """
+    Generate the detailed conflicts table: one section per scope, one row per conflict
+    category and its per-field breakdown (when the category spans several fields),
+    with the Unresolved and Articles columns
+    """
+    body = []
+    for scope in SCOPES:
+        if scope not in data['rows']:
+            continue
+        source = SCOPE_LABELS[scope]
+        for label, counts, breakdown, _ in data['rows'][scope]:
+            body.append([source, label] + _cells(counts))
+            source = ''
+            if len(breakdown) > 1:
+                body += [['', f"  {field}"] + _cells(field_counts) for field, field_counts in breakdown]
+        body.append([f"{SCOPE_LABELS[scope]} subtotal", ''] + _cells(data['totals'][scope])[:-1] + [''])
+    body.append(['**TOTAL**', ''] + [f"**{c}**" for c in _cells(data['totals']['total'])[:-1]] + [''])
+
+    headers = [('Classification', 'Source'), ('Category / Field', ''), ('N', ''), ('Infinity', 'Correct'),
+               ('Manual', 'Correct'), ('Both', 'Correct'), ('Unresolved', ''), ('Articles', '')]
+    return _render(headers, body)
 
 def main():
     """
     Main function to generate conflicts resolution table
     """
+    parser = argparse.ArgumentParser(description="Table 3.7: manual resolution of conflicts")
+    parser.add_argument('--detailed', action='store_true',
+                        help="also write the per-field table with Unresolved and Articles columns")
+    args = parser.parse_args()
+
     print("🔍 INFINITY RESEARCH - Conflicts Resolution Table Generator")
     print("=" * 70)
     
     # File path
-    conflicts_file = "analysis/conflicts.json"
+    conflicts_file = DEFAULT_CONFLICTS_FILE
     
     if not os.path.exists(conflicts_file):
         print(f"❌ Error: {conflicts_file} not found!")
         return
     
-    print("📊 Parsing conflicts.json file...")
+    print(f"📊 Parsing {conflicts_file}...")
     
     # Parse conflicts data
     data = parse_conflicts_file(conflicts_file)
@@ -260,6 +224,12 @@ def main():
     
     print(f"   ✅ Table saved: {output_file}")
     
+    if args.detailed:
+        detailed_file = "plots/conflicts_table_detailed.txt"
+        with open(detailed_file, 'w', encoding='utf-8') as f:
+            f.write(generate_detailed_table(data))
+        print(f"   ✅ Detailed table saved: {detailed_file}")
+    
     print(f"\n🎯 Conflicts resolution table generation complete!")
     print(f"   📊 Table: {output_file}")
 
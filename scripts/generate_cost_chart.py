@@ -20,6 +20,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 import io
 
+from anomaly_detection import chart_anomalies, describe_chart_anomalies
+
 # Configure matplotlib for better performance
 plt.ioff()  # Turn off interactive mode
 matplotlib.rcParams['figure.max_open_warning'] = 0
@@ -169,11 +171,21 @@ def create_cost_bar_chart(chart_data: Dict) -> Optional[bytes]:
                 ax.text(bar.get_x() + bar.get_width()/2., height,
                        label, ha='center', va='bottom', fontsize=8)
         
+        # Mark robust outliers (see anomaly_detection.py)
+        anomalies = chart_data.get('anomalies', {})
+        flagged = [i for i, label in enumerate(chart_data['labels']) if label in anomalies]
+        for i in flagged:
+            bars[i].set_edgecolor('red')
+            bars[i].set_linewidth(1.5)
+            bars[i].set_hatch('//')
+        
         # Add average line
         if len(chart_data['costs']) > 0:
             avg = sum(chart_data['costs']) / len(chart_data['costs'])
             ax.axhline(y=avg, color='red', linestyle='--', alpha=0.7, 
                       label=f'Average: ${avg:.4f}')
+            if flagged:
+                bars[flagged[0]].set_label('Outlier for page count/model')
             ax.legend()
         
         # Styling - EXACT same as word_generator
@@ -247,6 +259,9 @@ def generate_cost_legend(chart_data: Dict) -> str:
         f"Zero-cost articles: {articles_zero_cost} (processing failures)."
     )
     
+    # Robust outliers for page count and model (zero values are reported above)
+    cost_text += describe_chart_anomalies(chart_data.get('anomalies', {}))
+    
     return cost_text
 
 def main():
@@ -263,6 +278,7 @@ def main():
     
     # Extract cost data
     chart_data = extract_cost_data_from_articles()
+    chart_data['anomalies'] = chart_anomalies('cost')
     
     if not chart_data['costs']:
         print("❌ No cost data found!")
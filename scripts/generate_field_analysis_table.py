@@ -4,129 +4,81 @@
 ====================================================================
 
 Generates the Field-by-Field Analysis of General Concordance table (Section 4.6)
-comparing Claude 3.5 Sonnet vs DeepSeek V3 performance across 8 scientific fields.
+comparing the evaluator models (Claude 3.5 Sonnet vs DeepSeek V3 in the paper, one
+column pair per analysis/analysis_<model>.json) across 8 scientific fields.
+The paired McNemar and permutation tests of the General concordance
+difference of every evaluator pair (evaluator_significance) are appended
+below the table, overall and per field.
 
-Input: analysis_claude.json + analysis_deepseek.json
+Input: analysis/analysis_<model>.json (claude, deepseek, ...)
 Output: field_analysis_table.txt with detailed field-specific concordance
 """
 
-import json
-import os
-from collections import defaultdict, Counter
-from typing import Dict, List, Tuple
+import argparse
+from typing import Dict, List, Optional
 
-def extract_field_classifications(file_path: str) -> Dict[str, List[str]]:
-    """
-    Extract classifications organized by scientific field
-    Returns dict: {field_name: [list_of_classifications]}
-    """
-    field_classifications = defaultdict(list)
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    for article in data:
-        for field_name, field_data in article['fields'].items():
-            analysis = field_data.get('analysis', {})
-            
-            # Handle the combined "Author, Year, Study Type" field
-            if field_name == "Author, Year, Study Type":
-                if 'author_classification' in analysis:
-                    field_classifications['Author'].append(analysis['author_classification'])
-                if 'year_classification' in analysis:
-                    field_classifications['Year'].append(analysis['year_classification'])
-                if 'study_type_classification' in analysis:
-                    field_classifications['Study Type'].append(analysis['study_type_classification'])
-            elif 'classification' in analysis:
-                # Use exact field names from the data
-                field_classifications[field_name].append(analysis['classification'])
-    
-    return dict(field_classifications)
+import numpy as np
 
-def calculate_general_concordance_rate(classifications: List[str]) -> Tuple[float, int, int]:
-    """
-    Calculate General Concordance (A+B+C) rate for a field
-    Returns: (percentage, concordant_count, total_count)
-    """
-    if not classifications:
-        return 0.0, 0, 0
-    
-    concordant = sum(1 for c in classifications if c in ['A', 'B', 'C'])
-    total = len(classifications)
-    percentage = (concordant / total * 100) if total > 0 else 0
-    
-    return percentage, concordant, total
+from classification_table import (CATEGORIES, DEFAULT_ANALYSIS_FILES, concordance_summary, discover_analysis_files,
+                                  evaluator_name, load_classification_table)
+from evaluator_significance import DEFAULT_PERMUTATIONS, evaluator_significance, significance_block, \
+    significance_legend
 
-def count_distributions(classifications: List[str]) -> Dict[str, int]:
+GENERAL_LEVEL = 'General (A+B+C)'
+
+def general_concordance_rates(summary: Dict) -> np.ndarray:
     """
-    Count distribution of each category (A, B, C, D, E, F)
+    (evaluators x items) General Concordance (A+B+C) percentages (0 where a field has no classifications)
     """
-    counter = Counter(classifications)
-    categories = ['A', 'B', 'C', 'D', 'E', 'F']
-    
-    result = {}
-    for cat in categories:
-        result[cat] = counter.get(cat, 0)
-    
-    return result
+    totals = summary['totals']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(totals > 0, summary['general'] / np.maximum(totals, 1) * 100, 0.0)
 
-def format_distribution(distribution: Dict[str, int]) -> str:
+def format_distribution(distribution: np.ndarray) -> str:
     """
-    Format distribution as "A:19 B:0 C:0 D:0 E:0 F:0"
+    Format distribution counts as "A:19 B:0 C:0 D:0 E:0 F:0"
     """
-    parts = []
-    for cat in ['A', 'B', 'C', 'D', 'E', 'F']:
-        count = distribution.get(cat, 0)
-        if count > 0:
-            parts.append(f"{cat}:{count}")
-        else:
-            parts.append(f"{cat}:0")
-    
-    return " ".join(parts)
+    return " ".join(f"{cat}:{count}" for cat, count in zip(CATEGORIES, distribution))
+
+def significance_section(tests: Dict) -> List[str]:
+    """Paired tests of the General concordance of every evaluator pair, overall and per field"""
+    lines = ["", "", "Paired tests of the General concordance difference", ""] + significance_legend(tests)
+    for pair in tests['pairs']:
+        lines += [""] + significance_block(tests, pair, GENERAL_LEVEL)
+    return lines
 
-def generate_field_analysis_table(claude_fields: Dict[str, List[str]], 
-                                deepseek_fields: Dict[str, List[str]]) -> str:
+def generate_field_analysis_table(summary: Dict, tests: Optional[Dict] = None) -> str:
     """
-    Generate the field-by-field analysis table
+    Generate the field-by-field analysis table (rate and distribution columns per evaluator),
+    followed by the paired significance tests when given
     """
-    
-    # Define field order as shown in the image
-    field_order = [
-        'Author',
-        'Year', 
-        'Study Type',
-        'Methodology',
-        'Sample Size (n), Population Characteristics',
-        'Outcome Measure',
-        'Key Findings',
-        'Limitations'
-    ]
-    
+    significance = significance_section(tests) if tests and tests['pairs'] else []
+    names = [evaluator_name(e) for e in summary['evaluators']]
+    rates = general_concordance_rates(summary)
+    n_evaluators = len(names)
+
+    headers = names + [f"Distribution ({name.split()[0]})" for name in names]
+    rows = []
+    for j, field in enumerate(summary['items']):
+        rate_cells = [f"{rates[e, j]:5.1f}% ({summary['general'][e, j]}/{summary['totals'][e, j]})"
+                      for e in range(n_evaluators)]
+        distribution_cells = [format_distribution(summary['item_counts'][e, j]) for e in range(n_evaluators)]
+        rows.append((field, rate_cells + distribution_cells))
+
+    field_width = max(len('Scientific Field'), *(len(field) for field, _ in rows))
+    widths = [max(len(header), *(len(cells[c]) for _, cells in rows)) for c, header in enumerate(headers)]
+
     table = ["4.6 Field-by-Field Analysis of General Concordance", ""]
-    table.append("| Scientific Field                          | Claude 3.5 Sonnet | DeepSeek V3       | Distribution (Claude)      | Distribution (DeepSeek)    |")
-    table.append("|-------------------------------------------|--------------------|--------------------|----------------------------|----------------------------|")
-    
-    for field in field_order:
-        claude_classifications = claude_fields.get(field, [])
-        deepseek_classifications = deepseek_fields.get(field, [])
-        
-        # Calculate concordance rates
-        claude_rate, claude_concordant, claude_total = calculate_general_concordance_rate(claude_classifications)
-        deepseek_rate, deepseek_concordant, deepseek_total = calculate_general_concordance_rate(deepseek_classifications)
-        
-        # Calculate distributions
-        claude_dist = count_distributions(claude_classifications)
-        deepseek_dist = count_distributions(deepseek_classifications)
-        
-        claude_dist_str = format_distribution(claude_dist)
-        deepseek_dist_str = format_distribution(deepseek_dist)
-        
-        # Format the row
-        claude_col = f"{claude_rate:5.1f}% ({claude_concordant}/{claude_total})"
-        deepseek_col = f"{deepseek_rate:5.1f}% ({deepseek_concordant}/{deepseek_total})"
-        
-        table.append(f"| {field:<41} | {claude_col:<18} | {deepseek_col:<18} | {claude_dist_str:<26} | {deepseek_dist_str:<26} |")
-    
+    table.append(f"| {'Scientific Field':<{field_width}} | " +
+                 " | ".join(f"{h:<{w}}" for h, w in zip(headers, widths)) + " |")
+    table.append(f"|{'-' * (field_width + 2)}|" + "|".join('-' * (w + 2) for w in widths) + "|")
+    for field, cells in rows:
+        table.append(f"| {field:<{field_width}} | " + " | ".join(f"{c:<{w}}" for c, w in zip(cells, widths)) + " |")
+
+    # The discussion below is the paper's, about its two evaluators only
+    if list(summary['evaluators']) != list(DEFAULT_ANALYSIS_FILES):
+        return "\n".join(table + significance)
+
     # Add description
     table.extend([
         "",
@@ -155,78 +107,64 @@ def generate_field_analysis_table(claude_fields: Dict[str, List[str]],
         "following evaluation stage."
     ])
     
-    return "\n".join(table)
+    return "\n".join(table + significance)
 
 def main():
     """
     Main function to generate field analysis table
     """
+    parser = argparse.ArgumentParser(description="Field-by-field General Concordance for every evaluator")
+    parser.add_argument('--analysis-dir', default='analysis', help="Directory of analysis_<model>.json files")
+    parser.add_argument('--permutations', type=int, default=DEFAULT_PERMUTATIONS,
+                        help="Permutations of the paired tests appended to the table (0: no tests)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='plots/field_analysis_table.txt')
+    args = parser.parse_args()
+
     print("📊 INFINITY RESEARCH - Field Analysis Table Generator")
     print("=" * 65)
-    
-    # File paths
-    claude_file = "analysis/analysis_claude.json"
-    deepseek_file = "analysis/analysis_deepseek.json"
-    
-    if not os.path.exists(claude_file):
-        print(f"❌ Error: {claude_file} not found!")
-        return
-        
-    if not os.path.exists(deepseek_file):
-        print(f"❌ Error: {deepseek_file} not found!")
+
+    files = discover_analysis_files(args.analysis_dir)
+    if not files:
+        print(f"❌ Error: no analysis_*.json files found in {args.analysis_dir}!")
         return
-    
+
     print("📊 Extracting field-specific classification data...")
-    
-    # Extract field classifications
-    claude_fields = extract_field_classifications(claude_file)
-    deepseek_fields = extract_field_classifications(deepseek_file)
-    
-    print(f"   Claude fields analyzed: {len(claude_fields)}")
-    print(f"   DeepSeek fields analyzed: {len(deepseek_fields)}")
-    
+
+    # Category distributions per evaluator and field (one group-by over the classification table)
+    table = load_classification_table(files)
+    summary = concordance_summary(table)
+    rates = general_concordance_rates(summary)
+
+    for e, evaluator in enumerate(summary['evaluators']):
+        print(f"   {evaluator_name(evaluator)} fields analyzed: {int((summary['totals'][e] > 0).sum())}")
+
     # Display field-by-field analysis
     print(f"\n📈 FIELD-BY-FIELD ANALYSIS RESULTS:")
     print("=" * 50)
-    
-    field_order = [
-        'Author', 'Year', 'Study Type', 'Methodology',
-        'Sample Size (n), Population Characteristics',
-        'Outcome Measure', 'Key Findings', 'Limitations'
-    ]
-    
-    for field in field_order:
-        claude_classifications = claude_fields.get(field, [])
-        deepseek_classifications = deepseek_fields.get(field, [])
-        
-        claude_rate, claude_concordant, claude_total = calculate_general_concordance_rate(claude_classifications)
-        deepseek_rate, deepseek_concordant, deepseek_total = calculate_general_concordance_rate(deepseek_classifications)
-        
+
+    for j, field in enumerate(summary['items']):
         print(f"🎯 {field}:")
-        print(f"   Claude: {claude_rate:5.1f}% ({claude_concordant}/{claude_total})")
-        print(f"   DeepSeek: {deepseek_rate:5.1f}% ({deepseek_concordant}/{deepseek_total})")
-        
-        # Show distributions
-        claude_dist = count_distributions(claude_classifications)
-        deepseek_dist = count_distributions(deepseek_classifications)
-        
-        print(f"   Claude distribution: {format_distribution(claude_dist)}")
-        print(f"   DeepSeek distribution: {format_distribution(deepseek_dist)}")
+        for e, evaluator in enumerate(summary['evaluators']):
+            print(f"   {evaluator_name(evaluator)}: {rates[e, j]:5.1f}% "
+                  f"({summary['general'][e, j]}/{summary['totals'][e, j]})  "
+                  f"{format_distribution(summary['item_counts'][e, j])}")
         print()
-    
+
     # Generate table
     print(f"📝 Generating field analysis table...")
-    table_content = generate_field_analysis_table(claude_fields, deepseek_fields)
-    
+    tests = evaluator_significance(table, permutations=args.permutations, seed=args.seed) \
+        if args.permutations > 0 else None
+    table_content = generate_field_analysis_table(summary, tests)
+
     # Save table
-    output_file = "plots/field_analysis_table.txt"
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with open(args.output, 'w', encoding='utf-8') as f:
         f.write(table_content)
-    
-    print(f"   ✅ Table saved: {output_file}")
-    
+
+    print(f"   ✅ Table saved: {args.output}")
+
     print(f"\n🎯 Field analysis table generation complete!")
-    print(f"   📊 Table: {output_file}")
+    print(f"   📊 Table: {args.output}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -17,15 +17,7 @@ from matplotlib.colors import LinearSegmentedColormap
 import seaborn as sns
 from typing import Dict, List
 
-def is_field_filled(value) -> bool:
-    """Check if a field is considered filled (non-null, non-empty)"""
-    if value is None:
-        return False
-    if isinstance(value, str):
-        return len(value.strip()) > 0
-    if isinstance(value, list):
-        return len(value) > 0
-    return bool(value)
+from field_normalizer import filled_mask
 
 def extract_figure5_data() -> Dict:
     """
@@ -99,25 +91,16 @@ def extract_figure5_data() -> Dict:
                 print(f"      ⚠️ No consensus_result found in {folder_name}")
                 continue
             
-            # Count filled fields for each source
-            vision_filled = 0
-            consensus_filled = 0
-            
-            for field in core_fields:
-                # Vision baseline
-                vision_value = None
-                if isinstance(vision_response, dict):
-                    vision_value = vision_response.get(field)
-                
-                if is_field_filled(vision_value):
-                    vision_counts[field] += 1
-                    vision_filled += 1
-                
-                # Consensus (enriched)
-                consensus_value = consensus_data.get(field)
-                if is_field_filled(consensus_value):
-                    consensus_counts[field] += 1
-                    consensus_filled += 1
+            # Count filled fields for each source: Vision baseline and Consensus (enriched)
+            vision_values = [vision_response.get(field) if isinstance(vision_response, dict) else None
+                             for field in core_fields]
+            vision_mask = filled_mask(vision_values)
+            consensus_mask = filled_mask([consensus_data.get(field) for field in core_fields])
+            for field, vision_has, consensus_has in zip(core_fields, vision_mask, consensus_mask):
+                vision_counts[field] += int(vision_has)
+                consensus_counts[field] += int(consensus_has)
+            vision_filled = int(vision_mask.sum())
+            consensus_filled = int(consensus_mask.sum())
             
             print(f"      📊 Vision: {vision_filled}/{len(core_fields)} fields, Consensus: {consensus_filled}/{len(core_fields)} fields")
             
@@ -13,9 +13,10 @@ import json
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
-from collections import defaultdict, Counter
 from typing import Dict, List, Tuple
 
+from article_metrics import API_SOURCES
+
 def parse_field_sources(field_sources_str: str) -> Tuple[str, List[str]]:
     """
     Parse field_sources string to identify type and APIs
@@ -56,98 +57,154 @@ def parse_field_sources(field_sources_str: str) -> Tuple[str, List[str]]:
     
     return tipo, apis_clean
 
-def analyze_field_sources(json_folder_path: str) -> Dict:
+# Collaboration type codes of the encoded field_sources (-1: no field_sources entry)
+COLLABORATION_TYPES = ['empty', 'single', 'merged', 'validated', 'mixed']
+
+# All metadata fields (16 total as mentioned in article), as field_sources keys
+ALL_FIELDS = [
+    'title', 'authors', 'journal', 'year', 'doi', 'abstract',
+    'keywords', 'publisher', 'volume', 'issue', 'pages',
+    'pmid', 'pmcid', 'citations', 'openaccess', 'pdfurl'
+]
+
+def encode_field_sources(field_sources_list: List[Dict], all_fields: List[str],
+                         source_names: List[str]) -> Dict:
     """
-    Analyze field_sources data from all articles
-    Returns comprehensive API specialization analysis
+    Encode field_sources once into integer arrays (articles x fields):
+    - 'masks': uint64 bitmask of contributing sources (bit i = sources[i])
+    - 'types': int8 collaboration type code (COLLABORATION_TYPES index, -1 if absent)
+    Each distinct field_sources string is parsed only once; unknown source
+    names get the next free bit.
     """
-    # All metadata fields (16 total as mentioned in article)
-    all_fields = [
-        'title', 'authors', 'journal', 'year', 'doi', 'abstract', 
-        'keywords', 'publisher', 'volume', 'issue', 'pages', 
-        'pmid', 'pmcid', 'citations', 'openaccess', 'pdfurl'
-    ]
-    
-    # Initialize counters
-    api_field_counts = defaultdict(lambda: defaultdict(int))  # api -> field -> count
-    collaboration_patterns = defaultdict(int)  # type -> count
-    field_details = defaultdict(list)  # field -> collaboration details
-    
-    # Track all APIs found
-    all_apis = set()
+    field_index = {field.lower(): j for j, field in enumerate(all_fields)}
+    sources = list(source_names)
+    type_codes = {tipo: code for code, tipo in enumerate(COLLABORATION_TYPES)}
+    masks = np.zeros((len(field_sources_list), len(all_fields)), dtype=np.uint64)
+    types = np.full((len(field_sources_list), len(all_fields)), -1, dtype=np.int8)
+
+    parsed = {}
+    for i, field_sources in enumerate(field_sources_list):
+        for field, sources_str in field_sources.items():
+            j = field_index.get(field.lower())
+            if j is None:
+                continue
+            if sources_str not in parsed:
+                collaboration_type, apis = parse_field_sources(sources_str)
+                mask = 0
+                for api in apis:
+                    if api not in sources:
+                        sources.append(api)
+                    mask |= 1 << sources.index(api)
+                parsed[sources_str] = (type_codes[collaboration_type], mask)
+            types[i, j], masks[i, j] = parsed[sources_str]
+
+    return {'masks': masks, 'types': types, 'sources': sources, 'fields': [f.lower() for f in all_fields]}
+
+def source_bits(encoding: Dict) -> np.ndarray:
+    """Boolean (articles x fields x sources) view of the source bitmasks"""
+    shifts = np.arange(len(encoding['sources']), dtype=np.uint64)
+    return ((encoding['masks'][:, :, None] >> shifts) & np.uint64(1)).astype(bool)
+
+def field_source_count(encoding: Dict, field: str, source: str = None) -> int:
+    """Articles where the field has field_sources (and the source contributed to it)"""
+    j = encoding['fields'].index(field)
+    present = encoding['types'][:, j] >= 0
+    if source is None:
+        return int(present.sum())
+    if source not in encoding['sources']:
+        return 0
+    bit = np.uint64(1 << encoding['sources'].index(source))
+    return int((present & ((encoding['masks'][:, j] & bit) != 0)).sum())
+
+def multi_source_count(encoding: Dict, field: str) -> int:
+    """Articles where more than one source contributed to the field"""
+    j = encoding['fields'].index(field)
+    return int(((encoding['types'][:, j] >= 0) & (source_bits(encoding)[:, j].sum(axis=1) > 1)).sum())
+
+def load_field_sources(json_folder_path: str) -> Dict:
+    """
+    Encoded consensus field_sources of every article folder (no console output)
+    Returns {'encoding', 'folders', 'folder_count', 'total_articles'}; 'folders' lists (folder, status, error)
+    with status 'ok', 'missing' (no field_sources) or 'error', in folder order.
+    """
+    field_sources_list = []
+    article_names = []
+    folders = []
     total_articles = 0
-    articles_with_sources = 0
-    
-    print("🚀 INFINITY RESEARCH - Figure 6 Chart Generator")
-    print("=" * 50)
-    print("📊 Analyzing API specialization patterns...")
-    
-    # Process each article folder
-    article_folders = [f for f in os.listdir(json_folder_path) if f.startswith('Article_')]
-    article_folders.sort()
-    
-    print(f"📁 Found {len(article_folders)} article folders")
-    
+
+    article_folders = sorted(f for f in os.listdir(json_folder_path) if f.startswith('Article_'))
     for folder_name in article_folders:
-        folder_path = os.path.join(json_folder_path, folder_name)
-        apis_clean_path = os.path.join(folder_path, 'apis_clean_json.json')
-        
+        apis_clean_path = os.path.join(json_folder_path, folder_name, 'apis_clean_json.json')
         if not os.path.exists(apis_clean_path):
             continue
-            
         total_articles += 1
-        
+
         try:
-            # Load APIs clean data
             with open(apis_clean_path, 'r', encoding='utf-8') as f:
                 apis_data = json.load(f)
-            
-            # Extract field_sources from consensus_result
             consensus_result = apis_data.get('consensus_result', {})
-            confidence_factors = consensus_result.get('confidence_factors', {})
-            field_sources = confidence_factors.get('field_sources', {})
-            
-            if not field_sources:
-                print(f"   ⚠️ No field_sources found in {folder_name}")
-                continue
-                
-            articles_with_sources += 1
-            print(f"   Processing {folder_name}...")
-            
-            # Analyze each field's sources
-            for field, sources_str in field_sources.items():
-                field_lower = field.lower()
-                
-                if field_lower in [f.lower() for f in all_fields]:
-                    # Parse sources
-                    collaboration_type, apis = parse_field_sources(sources_str)
-                    
-                    # Count collaboration pattern
-                    collaboration_patterns[collaboration_type] += 1
-                    
-                    # Count each API's contribution to this field
-                    for api in apis:
-                        api_field_counts[api][field_lower] += 1
-                        all_apis.add(api)
-                    
-                    # Store field collaboration details
-                    field_details[field_lower].append({
-                        'type': collaboration_type,
-                        'sources': sources_str,
-                        'apis': apis,
-                        'article': folder_name
-                    })
-                        
+            field_sources = consensus_result.get('confidence_factors', {}).get('field_sources', {})
         except Exception as e:
-            print(f"   ❌ Error processing {folder_name}: {e}")
+            folders.append((folder_name, 'error', str(e)))
+            continue
+        if not field_sources:
+            folders.append((folder_name, 'missing', None))
             continue
+        folders.append((folder_name, 'ok', None))
+        field_sources_list.append(field_sources)
+        article_names.append(folder_name)
+
+    encoding = encode_field_sources(field_sources_list, ALL_FIELDS, ['vision'] + API_SOURCES)
+    encoding['articles'] = article_names
+    return {'encoding': encoding, 'folders': folders, 'folder_count': len(article_folders),
+            'total_articles': total_articles}
+
+def analyze_field_sources(json_folder_path: str) -> Dict:
+    """
+    Analyze field_sources data from all articles
+    Returns comprehensive API specialization analysis
+    """
+    all_fields = ALL_FIELDS
+    
+    print("🚀 INFINITY RESEARCH - Figure 6 Chart Generator")
+    print("=" * 50)
+    print("📊 Analyzing API specialization patterns...")
+    
+    loaded = load_field_sources(json_folder_path)
+    print(f"📁 Found {loaded['folder_count']} article folders")
+    for folder_name, status, error in loaded['folders']:
+        if status == 'ok':
+            print(f"   Processing {folder_name}...")
+        elif status == 'missing':
+            print(f"   ⚠️ No field_sources found in {folder_name}")
+        else:
+            print(f"   ❌ Error processing {folder_name}: {error}")
+    total_articles = loaded['total_articles']
+    articles_with_sources = sum(1 for _, status, _ in loaded['folders'] if status == 'ok')
+    
+    encoding = loaded['encoding']
+    present = encoding['types'] >= 0
+    
+    # API x field counts: one bit test over the whole corpus
+    field_counts = (source_bits(encoding) & present[:, :, None]).sum(axis=0)  # fields x sources
+    api_field_counts = {}
+    for k, api in enumerate(encoding['sources']):
+        counts = {field: int(field_counts[j, k]) for j, field in enumerate(encoding['fields']) if field_counts[j, k]}
+        if counts:
+            api_field_counts[api] = counts
+    all_apis = set(api_field_counts)
+    
+    # Collaboration patterns: histogram of the type codes
+    type_counts = np.bincount(encoding['types'][present], minlength=len(COLLABORATION_TYPES))
+    collaboration_patterns = {tipo: int(type_counts[code]) for code, tipo in enumerate(COLLABORATION_TYPES)
+                              if type_counts[code]}
     
     # Calculate total instances and patterns
     total_instances = sum(collaboration_patterns.values())
     
     # Calculate API totals and sort
     api_totals = {}
-    for api in all_apis:
+    for api in sorted(all_apis):
         total_contrib = sum(api_field_counts[api].values())
         api_totals[api] = total_contrib
     
@@ -188,7 +245,7 @@ def analyze_field_sources(json_folder_path: str) -> Dict:
     return {
         'api_field_counts': dict(api_field_counts),
         'collaboration_patterns': dict(collaboration_patterns),
-        'field_details': dict(field_details),
+        'encoding': encoding,
         'api_totals': api_totals,
         'sorted_apis': sorted_apis,
         'all_fields': all_fields,
@@ -313,7 +370,7 @@ def generate_figure6_legend(analysis_data: Dict) -> str:
     total_instances = analysis_data['total_instances']
     total_articles = analysis_data['total_articles']
     all_fields = analysis_data['all_fields']
-    field_details = analysis_data['field_details']
+    encoding = analysis_data['encoding']
     
     # Calculate key statistics
     total_possible = len(all_fields) * total_articles
@@ -335,24 +392,21 @@ def generate_figure6_legend(analysis_data: Dict) -> str:
     single_pct = (single_count / total_instances * 100) if total_instances > 0 else 0
     merged_pct = (merged_count / total_instances * 100) if total_instances > 0 else 0
     
-    # Calculate field-specific specializations
-    vision_title_count = len([d for d in field_details.get('title', []) if 'vision' in d['apis']])
-    vision_authors_count = len([d for d in field_details.get('authors', []) if 'vision' in d['apis']])
-    vision_abstract_count = len([d for d in field_details.get('abstract', []) if 'vision' in d['apis']])
+    # Calculate field-specific specializations (bit tests on the encoded field_sources)
+    vision_title_count = field_source_count(encoding, 'title', 'vision')
+    vision_authors_count = field_source_count(encoding, 'authors', 'vision')
+    vision_abstract_count = field_source_count(encoding, 'abstract', 'vision')
     
-    pmid_details = field_details.get('pmid', [])
-    pmid_total = len(pmid_details)
-    pmid_europe_count = len([d for d in pmid_details if 'europe_pmc' in d['apis']])
+    pmid_total = field_source_count(encoding, 'pmid')
+    pmid_europe_count = field_source_count(encoding, 'pmid', 'europe_pmc')
     pmid_coverage = (pmid_europe_count / pmid_total * 100) if pmid_total > 0 else 0
     
-    doi_details = field_details.get('doi', [])
-    doi_total = len(doi_details)
-    doi_crossref_count = len([d for d in doi_details if 'crossref' in d['apis']])
+    doi_total = field_source_count(encoding, 'doi')
+    doi_crossref_count = field_source_count(encoding, 'doi', 'crossref')
     doi_coverage = (doi_crossref_count / doi_total * 100) if doi_total > 0 else 0
     
-    citations_details = field_details.get('citations', [])
-    citations_total = len(citations_details)
-    citations_semantic_count = len([d for d in citations_details if 'semantic_scholar' in d['apis']])
+    citations_total = field_source_count(encoding, 'citations')
+    citations_semantic_count = field_source_count(encoding, 'citations', 'semantic_scholar')
     citations_coverage = (citations_semantic_count / citations_total * 100) if citations_total > 0 else 0
     
     # Generate legend text
@@ -382,13 +436,15 @@ Comprehensive analysis of API contribution patterns across {len(all_fields)} met
     legend_text += f"while specialized APIs demonstrated domain expertise—Europe PMC for PubMed identifiers ({pmid_coverage:.1f}% PMID coverage), CrossRef for DOI validation ({doi_coverage:.1f}% coverage), and Semantic Scholar for citation metrics ({citations_coverage:.1f}% coverage). "
     
     # Calculate cross-validation for critical fields
-    authors_multi = len([d for d in field_details.get('authors', []) if len(d['apis']) > 1])
-    doi_multi = len([d for d in field_details.get('doi', []) if len(d['apis']) > 1])
-    publisher_multi = len([d for d in field_details.get('publisher', []) if len(d['apis']) > 1])
-    
-    authors_multi_pct = (authors_multi / len(field_details.get('authors', [])) * 100) if field_details.get('authors') else 0
-    doi_multi_pct = (doi_multi / len(field_details.get('doi', [])) * 100) if field_details.get('doi') else 0
-    publisher_multi_pct = (publisher_multi / len(field_details.get('publisher', [])) * 100) if field_details.get('publisher') else 0
+    authors_multi = multi_source_count(encoding, 'authors')
+    doi_multi = multi_source_count(encoding, 'doi')
+    publisher_multi = multi_source_count(encoding, 'publisher')
+    
+    authors_total = field_source_count(encoding, 'authors')
+    publisher_total = field_source_count(encoding, 'publisher')
+    authors_multi_pct = (authors_multi / authors_total * 100) if authors_total else 0
+    doi_multi_pct = (doi_multi / doi_total * 100) if doi_total else 0
+    publisher_multi_pct = (publisher_multi / publisher_total * 100) if publisher_total else 0
     
     legend_text += f"Cross-validation robustness: Critical fields showed extensive collaboration, with Authors ({authors_multi_pct:.1f}% multi-source), DOI ({doi_multi_pct:.1f}%), and Publisher ({publisher_multi_pct:.1f}%) achieving the highest validation rates across the API ecosystem."
     
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+📈 THROUGHPUT CHART GENERATOR - Infinity Research Paper
+=======================================================
+
+Generates the throughput-over-time chart and legend from the processing
+timestamps recorded by each phase (vision/topics `processing_timestamp`,
+API `timestamp`, consensus `cost_tracking.timestamp`) and the completion
+mark `final_json.processing_metadata.aggregated_at`.
+
+Reports completed articles per minute and per hour, gaps and stalls
+between completions, and per-phase busy time, to check whether a batch
+run sustained its expected throughput or sat idle behind a slow phase.
+
+Input: JSON files from infinity-research-paper/json/Article_XX/
+Output: throughput_chart.png + throughput_legend.txt
+"""
+
+import argparse
+import os
+from typing import Dict, Optional
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend
+import matplotlib.pyplot as plt
+import numpy as np
+import io
+
+from article_metrics import API_SOURCES, load_metrics_table
+
+# Configure matplotlib for better performance
+plt.ioff()  # Turn off interactive mode
+matplotlib.rcParams['figure.max_open_warning'] = 0
+
+# Phase name -> (start column, end column) in the metrics table
+PHASE_INTERVALS = {
+    'Vision': ('vision_start_at', 'vision_end_at'),
+    'APIs': ('apis_start_at', 'apis_end_at'),
+    'Consensus': ('consensus_start_at', 'consensus_end_at'),
+    'Topics': ('topics_start_at', 'topics_end_at')
+}
+
+PHASE_COLORS = {
+    'Vision': 'steelblue',
+    'APIs': 'darkorange',
+    'Consensus': 'seagreen',
+    'Topics': 'mediumpurple'
+}
+
+def to_seconds(values: np.ndarray, origin: np.datetime64) -> np.ndarray:
+    """Convert datetime64 values to float seconds since origin (NaT -> NaN)"""
+    seconds = (values - origin).astype('timedelta64[us]').astype(np.int64) / 1e6
+    return np.where(np.isnat(values), np.nan, seconds)
+
+def busy_seconds_per_bin(starts: np.ndarray, ends: np.ndarray, edges: np.ndarray,
+                         chunk_size: int = 4096) -> np.ndarray:
+    """
+    Busy seconds of a set of intervals inside each bin
+    Overlaps are summed (2 articles busy for 10s in a bin = 20 busy seconds).
+    """
+    busy = np.zeros(len(edges) - 1)
+    valid = np.isfinite(starts) & np.isfinite(ends) & (ends > starts)
+    starts, ends = starts[valid], ends[valid]
+
+    for offset in range(0, len(starts), chunk_size):
+        s = starts[offset:offset + chunk_size, None]
+        e = ends[offset:offset + chunk_size, None]
+        overlap = np.minimum(e, edges[None, 1:]) - np.maximum(s, edges[None, :-1])
+        busy += np.clip(overlap, 0, None).sum(axis=0)
+
+    return busy
+
+def merge_intervals(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Union of intervals, returned as an (k, 2) array of [start, end] blocks
+    """
+    valid = np.isfinite(starts) & np.isfinite(ends)
+    starts, ends = starts[valid], ends[valid]
+    if len(starts) == 0:
+        return np.empty((0, 2))
+
+    order = np.argsort(starts)
+    starts, ends = starts[order], ends[order]
+    running_end = np.maximum.accumulate(ends)
+
+    # A new block starts where an interval begins after everything before it ended
+    new_block = np.ones(len(starts), dtype=bool)
+    new_block[1:] = starts[1:] > running_end[:-1]
+    block_ids = np.cumsum(new_block) - 1
+
+    block_starts = starts[new_block]
+    block_ends = np.zeros(len(block_starts))
+    np.maximum.at(block_ends, block_ids, running_end)
+    return np.column_stack([block_starts, block_ends])
+
+def extract_throughput_data(json_dir: str = "json", stall_factor: float = 3.0) -> Dict:
+    """
+    Extract completion times, phase busy time and stalls from the timestamp columns
+    """
+    print("📊 Extracting processing timestamps from article JSONs...")
+
+    table = load_metrics_table(json_dir)
+    completed_at = table['completed_at']
+    done = ~np.isnat(completed_at)
+
+    print(f"📁 Found {len(completed_at)} articles, {int(done.sum())} with completion timestamps")
+
+    if not done.any():
+        return {'completed': np.array([])}
+
+    # Origin: earliest recorded phase start (falls back to the first completion)
+    starts = np.concatenate([table[start][~np.isnat(table[start])] for start, _ in PHASE_INTERVALS.values()]
+                            + [completed_at[done]])
+    origin = starts.min()
+    completed = np.sort(to_seconds(completed_at[done], origin))
+    run_end = completed[-1]
+
+    # Per-minute bins over the whole run window
+    n_minutes = max(1, int(np.ceil(run_end / 60.0)))
+    minute_edges = np.arange(n_minutes + 1) * 60.0
+    per_minute, _ = np.histogram(completed, bins=minute_edges)
+
+    n_hours = max(1, int(np.ceil(run_end / 3600.0)))
+    per_hour, _ = np.histogram(completed, bins=np.arange(n_hours + 1) * 3600.0)
+
+    busy = {}
+    phase_starts = []
+    phase_ends = []
+    for phase, (start_col, end_col) in PHASE_INTERVALS.items():
+        start_s = to_seconds(table[start_col], origin)
+        end_s = to_seconds(table[end_col], origin)
+        busy[phase] = busy_seconds_per_bin(start_s, end_s, minute_edges)
+        phase_starts.append(start_s)
+        phase_ends.append(end_s)
+
+    # Stalls: gaps between consecutive completions far above the typical gap
+    gaps = np.diff(np.concatenate([[0.0], completed]))
+    median_gap = float(np.median(gaps[1:])) if len(gaps) > 1 else float(gaps[0])
+    stall_threshold = stall_factor * median_gap
+    # Gap 0 runs from the run origin to the first completion, not between completions: never a stall
+    stall_idx = np.nonzero(gaps[1:] > stall_threshold)[0] + 1
+
+    # Idle windows: time where no phase of any article was running
+    blocks = merge_intervals(np.concatenate(phase_starts), np.concatenate(phase_ends))
+    idle_gaps = blocks[1:, 0] - blocks[:-1, 1] if len(blocks) > 1 else np.array([])
+
+    # Which API source bounded each article's fan-out (critical path)
+    api_times = table['api_time_ms']
+    has_api = ~np.all(np.isnan(api_times), axis=1)
+    slowest = np.full(len(api_times), -1)
+    slowest[has_api] = np.nanargmax(api_times[has_api], axis=1)
+    critical_counts = np.bincount(slowest[has_api], minlength=len(API_SOURCES))
+
+    # Expected throughput for a serial run: one article per median end-to-end time
+    article_starts = to_seconds(table['vision_start_at'], origin)
+    spans = to_seconds(completed_at, origin) - article_starts
+    spans = spans[np.isfinite(spans) & (spans > 0)]
+    expected_per_hour = 3600.0 / float(np.median(spans)) if len(spans) else 0.0
+
+    return {
+        'origin': origin,
+        'completed': completed,
+        'labels': table['label'][done][np.argsort(to_seconds(completed_at[done], origin))],
+        'minute_edges': minute_edges,
+        'per_minute': per_minute,
+        'per_hour': per_hour,
+        'busy': busy,
+        'gaps': gaps,
+        'median_gap': median_gap,
+        'stall_threshold': stall_threshold,
+        'stall_idx': stall_idx,
+        'idle_gaps': idle_gaps,
+        'critical_counts': critical_counts,
+        'expected_per_hour': expected_per_hour
+    }
+
+def create_throughput_chart(data: Dict) -> Optional[bytes]:
+    """
+    Create the throughput-over-time chart: completions per minute and per-phase busy time
+    """
+    if len(data['completed']) == 0:
+        return None
+
+    try:
+        plt.style.use('fast')
+
+        fig, (ax_top, ax_bottom) = plt.subplots(2, 1, figsize=(10, 6), sharex=True,
+                                                gridspec_kw={'height_ratios': [1, 1.2]})
+        minutes = data['minute_edges'][:-1] / 60.0
+
+        # Completions per minute + cumulative completions
+        ax_top.bar(minutes, data['per_minute'], width=0.9, align='edge', color='steelblue',
+                   alpha=0.8, edgecolor='black', linewidth=0.5, label='Completed per minute')
+        ax_cum = ax_top.twinx()
+        ax_cum.step(data['completed'] / 60.0, np.arange(1, len(data['completed']) + 1),
+                    where='post', color='black', linewidth=1.2, label='Cumulative')
+        if data['expected_per_hour'] > 0:
+            ax_cum.plot([0, data['completed'][-1] / 60.0],
+                        [0, data['expected_per_hour'] * data['completed'][-1] / 3600.0],
+                        color='red', linestyle='--', alpha=0.7,
+                        label=f"Expected: {data['expected_per_hour']:.1f}/hour")
+
+        for idx in data['stall_idx']:
+            end = data['completed'][idx] / 60.0
+            start = end - data['gaps'][idx] / 60.0
+            ax_top.axvspan(start, end, color='red', alpha=0.12)
+
+        ax_top.set_ylabel('Articles / minute', fontsize=11)
+        ax_cum.set_ylabel('Cumulative articles', fontsize=11)
+        ax_top.set_title('Throughput Over Time', fontsize=14, fontweight='bold', pad=20)
+        handles = ax_top.get_legend_handles_labels()
+        cum_handles = ax_cum.get_legend_handles_labels()
+        ax_top.legend(handles[0] + cum_handles[0], handles[1] + cum_handles[1],
+                      loc='upper left', fontsize=8)
+        ax_top.grid(True, axis='y', alpha=0.3, linestyle='--')
+        ax_top.set_axisbelow(True)
+
+        # Per-phase busy seconds per minute (stacked)
+        bottom = np.zeros(len(minutes))
+        for phase, values in data['busy'].items():
+            ax_bottom.bar(minutes, values, width=1.0, align='edge', bottom=bottom,
+                          color=PHASE_COLORS[phase], alpha=0.8, label=phase)
+            bottom += values
+        ax_bottom.set_xlabel('Minutes since run start', fontsize=12)
+        ax_bottom.set_ylabel('Busy seconds / minute', fontsize=11)
+        ax_bottom.legend(loc='upper left', fontsize=8, ncol=len(data['busy']))
+        ax_bottom.grid(True, axis='y', alpha=0.3, linestyle='--')
+        ax_bottom.set_axisbelow(True)
+
+        plt.tight_layout()
+
+        buffer = io.BytesIO()
+        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
+        plt.close()
+
+        buffer.seek(0)
+        return buffer.getvalue()
+
+    except Exception as e:
+        print(f"❌ Error creating throughput chart: {e}")
+        return None
+
+def generate_throughput_legend(data: Dict) -> str:
+    """
+    Generate throughput legend following the same pattern as the time legend
+    """
+    completed = data['completed']
+    if len(completed) == 0:
+        return "Figure T. No processing timestamp data available for this project."
+
+    run_seconds = completed[-1]
+    actual_per_hour = len(completed) / run_seconds * 3600 if run_seconds > 0 else 0
+    expected = data['expected_per_hour']
+    sustained_pct = (actual_per_hour / expected * 100) if expected > 0 else 0
+
+    per_minute = data['per_minute']
+    busy_totals = {phase: float(values.sum()) for phase, values in data['busy'].items()}
+    busy_total = sum(busy_totals.values())
+    idle_gaps = data['idle_gaps']
+
+    phase_parts = []
+    for phase, seconds in busy_totals.items():
+        pct = (seconds / busy_total * 100) if busy_total > 0 else 0
+        phase_parts.append(f"{phase}: {seconds:.1f}s ({pct:.2f}%)")
+
+    hour_parts = [f"h{i + 1}: {count}" for i, count in enumerate(data['per_hour'])]
+
+    if len(data['stall_idx']) > 0:
+        longest = data['stall_idx'][np.argmax(data['gaps'][data['stall_idx']])]
+        stall_text = (
+            f"Stalls (completion gap > {data['stall_threshold']:.1f}s, "
+            f"{data['stall_threshold'] / data['median_gap'] if data['median_gap'] > 0 else 0:.0f}x the median gap): "
+            f"{len(data['stall_idx'])}, longest {data['gaps'][longest]:.1f}s before {data['labels'][longest]}. "
+        )
+    else:
+        stall_text = f"Stalls (completion gap > {data['stall_threshold']:.1f}s): none. "
+
+    ranked = np.argsort(data['critical_counts'])[::-1]
+    critical_parts = [f"{API_SOURCES[j]} ({data['critical_counts'][j]})"
+                      for j in ranked[:3] if data['critical_counts'][j] > 0]
+
+    legend_text = (
+        f"Figure T. Throughput over time for {len(completed)} articles. "
+        f"Run window: {str(data['origin'])[:19].replace('T', ' ')} + {run_seconds:.1f} seconds "
+        f"({run_seconds / 60:.1f} minutes). "
+        f"Completed articles per minute: mean {per_minute.mean():.2f}, peak {per_minute.max()}, "
+        f"minutes with no completion: {int((per_minute == 0).sum())}/{len(per_minute)}. "
+        f"Completed articles per hour: {', '.join(hour_parts)}. "
+        f"Achieved throughput: {actual_per_hour:.1f} articles/hour vs expected {expected:.1f} "
+        f"({sustained_pct:.1f}% sustained). "
+        f"Median gap between completions: {data['median_gap']:.1f}s. "
+        f"{stall_text}"
+        f"Idle time with no phase running: {idle_gaps.sum():.1f}s across {len(idle_gaps)} gaps"
+        f"{f' (longest {idle_gaps.max():.1f}s)' if len(idle_gaps) else ''}. "
+        f"Per-phase busy time: {', '.join(phase_parts)}. "
+        f"Slowest API source on the fan-out critical path: {', '.join(critical_parts) or 'n/a'}."
+    )
+
+    return legend_text
+
+def main():
+    """
+    Main function to generate throughput chart and legend
+    """
+    parser = argparse.ArgumentParser(description="Throughput-over-time analysis from processing timestamps")
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--stall-factor', type=float, default=3.0,
+                        help="completion gap (x median gap) reported as a stall")
+    args = parser.parse_args()
+
+    print("🚀 INFINITY RESEARCH - Throughput Chart Generator")
+    print("=" * 50)
+
+    # Change to infinity-research-paper directory
+    if os.path.exists("infinity-research-paper"):
+        os.chdir("infinity-research-paper")
+        print("📁 Changed to infinity-research-paper directory")
+
+    data = extract_throughput_data(args.json_dir, args.stall_factor)
+
+    if len(data['completed']) == 0:
+        print("❌ No timestamp data found!")
+        return
+
+    run_seconds = data['completed'][-1]
+    print(f"\n📊 Summary:")
+    print(f"   Articles completed: {len(data['completed'])}")
+    print(f"   Run window: {run_seconds / 60:.1f} minutes")
+    print(f"   Throughput: {len(data['completed']) / run_seconds * 3600:.1f} articles/hour "
+          f"(expected {data['expected_per_hour']:.1f})")
+    print(f"   Stalls: {len(data['stall_idx'])}")
+
+    print("\n🎨 Generating throughput chart...")
+    chart_bytes = create_throughput_chart(data)
+
+    if chart_bytes:
+        with open("plots/throughput_chart.png", "wb") as f:
+            f.write(chart_bytes)
+        print("   ✅ Chart saved: plots/throughput_chart.png")
+    else:
+        print("   ❌ Failed to generate chart")
+
+    print("\n📝 Generating throughput legend...")
+    legend_text = generate_throughput_legend(data)
+
+    with open("plots/throughput_legend.txt", "w", encoding='utf-8') as f:
+        f.write(legend_text)
+    print("   ✅ Legend saved: plots/throughput_legend.txt")
+
+    print(f"\n🎯 Throughput chart generation complete!")
+    print(f"   📊 Chart: plots/throughput_chart.png")
+    print(f"   📝 Legend: plots/throughput_legend.txt")
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 import io
 
+from anomaly_detection import chart_anomalies, describe_chart_anomalies
+
 # Configure matplotlib for better performance
 plt.ioff()  # Turn off interactive mode
 matplotlib.rcParams['figure.max_open_warning'] = 0
@@ -128,11 +130,21 @@ def create_time_bar_chart(chart_data: Dict) -> Optional[bytes]:
                 ax.text(bar.get_x() + bar.get_width()/2., height,
                        label, ha='center', va='bottom', fontsize=8)
         
+        # Mark robust outliers (see anomaly_detection.py)
+        anomalies = chart_data.get('anomalies', {})
+        flagged = [i for i, label in enumerate(chart_data['labels']) if label in anomalies]
+        for i in flagged:
+            bars[i].set_edgecolor('red')
+            bars[i].set_linewidth(1.5)
+            bars[i].set_hatch('//')
+        
         # Add average line
         if len(times_in_seconds) > 0:
             avg = sum(times_in_seconds) / len(times_in_seconds)
             ax.axhline(y=avg, color='red', linestyle='--', alpha=0.7, 
                       label=f'Average: {avg:.1f}s')
+            if flagged:
+                bars[flagged[0]].set_label('Outlier for page count/model')
             ax.legend()
         
         # Styling - EXACT same as word_generator
@@ -208,6 +220,9 @@ def generate_time_legend(chart_data: Dict) -> str:
         f"System achieved {len(times)/total_time*60:.1f} articles per minute throughput."
     )
     
+    # Robust outliers for page count and model (zero values are reported above)
+    time_text += describe_chart_anomalies(chart_data.get('anomalies', {}))
+    
     return time_text
 
 def main():
@@ -224,6 +239,7 @@ def main():
     
     # Extract time data
     chart_data = extract_time_data_from_articles()
+    chart_data['anomalies'] = chart_anomalies('time')
     
     if not chart_data['times']:
         print("❌ No time data found!")
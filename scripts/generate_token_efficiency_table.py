@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+🪙 TOKEN EFFICIENCY TABLE GENERATOR - Infinity Research Paper
+=============================================================
+
+Relates token spend to the work it bought: tokens and cost per processed
+page (`input_details.pdf_pages_processed`) and per successfully filled
+field (`extracted_data`, `consensus_result`, `extracted_topics`),
+grouped by page strategy and DPI so rendering settings can be compared
+in fields per dollar.
+
+Input: JSON files from infinity-research-paper/json/Article_XX/
+Output: token_efficiency_table.txt
+"""
+
+import os
+from typing import Dict, List
+import numpy as np
+
+from article_metrics import METADATA_FIELDS, load_metrics_table
+
+def group_ratios(keys: np.ndarray, numerators: Dict[str, np.ndarray],
+                 denominators: Dict[str, np.ndarray]) -> List[Dict]:
+    """
+    Vectorized group-by: sums every column per key, then reports ratio-of-sums
+    Returns one dict per group with 'key', 'articles' and each summed column.
+    """
+    groups, inverse = np.unique(keys.astype(str), return_inverse=True)
+    counts = np.bincount(inverse, minlength=len(groups))
+
+    summed = {}
+    for name, values in {**numerators, **denominators}.items():
+        summed[name] = np.bincount(inverse, weights=values.astype(float), minlength=len(groups))
+
+    rows = []
+    for g, key in enumerate(groups):
+        row = {'key': key, 'articles': int(counts[g])}
+        for name in summed:
+            row[name] = float(summed[name][g])
+        rows.append(row)
+    return rows
+
+def safe_div(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator > 0 else 0.0
+
+def extract_token_efficiency_data(json_dir: str = "json") -> Dict:
+    """
+    Build per-phase efficiency groups keyed by strategy and DPI
+    """
+    print("📊 Extracting token, page and filled-field data from article JSONs...")
+    table = load_metrics_table(json_dir)
+    n = len(table['article_num'])
+    print(f"📁 Found {n} article folders")
+
+    vision_key = np.array([f"{s} @ {d} dpi" for s, d in zip(table['vision_strategy'], table['vision_dpi'])])
+    topics_key = np.array([f"{s} @ {d} dpi" for s, d in zip(table['topics_strategy'], table['topics_dpi'])])
+
+    phases = {
+        'Vision': {
+            'keys': vision_key,
+            'tokens': table['vision_tokens'], 'cost': table['vision_cost'],
+            'pages': table['vision_pages'], 'fields': table['vision_fields_filled']
+        },
+        'Topics': {
+            'keys': topics_key,
+            'tokens': table['topics_tokens'], 'cost': table['topics_cost'],
+            'pages': table['topics_pages'], 'fields': table['topics_fields_filled']
+        },
+        # Consensus reads no pages: its yield is measured as fields added over Vision
+        'Consensus': {
+            'keys': np.array([f"after Vision {k}" for k in vision_key]),
+            'tokens': table['consensus_tokens'], 'cost': table['consensus_cost'],
+            'pages': np.zeros(n),
+            'fields': np.clip(table['consensus_fields_filled'] - table['vision_fields_filled'], 0, None)
+        },
+        # End to end: all spend per final consensus field or extracted topic
+        'End-to-end': {
+            'keys': np.array([f"Vision {v}; Topics {t}" for v, t in zip(vision_key, topics_key)]),
+            'tokens': table['total_tokens'], 'cost': table['total_cost'],
+            'pages': table['vision_pages'] + table['topics_pages'],
+            'fields': table['consensus_fields_filled'] + table['topics_fields_filled']
+        }
+    }
+
+    results = {}
+    for phase, columns in phases.items():
+        results[phase] = group_ratios(
+            columns['keys'],
+            {'tokens': columns['tokens'], 'cost': columns['cost']},
+            {'pages': columns['pages'], 'fields': columns['fields']}
+        )
+
+    return {
+        'articles': n,
+        'groups': results,
+        'total_cost': float(table['total_cost'].sum()),
+        'vision_fields': int(table['vision_fields_filled'].sum()),
+        'consensus_fields': int(table['consensus_fields_filled'].sum()),
+        'topics_fields': int(table['topics_fields_filled'].sum())
+    }
+
+def generate_token_efficiency_table(data: Dict) -> str:
+    """
+    Generate the token efficiency table
+    """
+    table = ["Token Efficiency per Page and per Filled Field", ""]
+    table.append("| Phase      | Strategy / DPI                                                       | Articles | Pages | Tokens/page | Cost/page | Filled fields | Tokens/field | Cost/field | Fields per $ |")
+    table.append("|------------|----------------------------------------------------------------------|----------|-------|-------------|-----------|---------------|--------------|------------|--------------|")
+
+    best = None
+    for phase, groups in data['groups'].items():
+        for row in groups:
+            tokens_per_page = safe_div(row['tokens'], row['pages'])
+            cost_per_page = safe_div(row['cost'], row['pages'])
+            tokens_per_field = safe_div(row['tokens'], row['fields'])
+            cost_per_field = safe_div(row['cost'], row['fields'])
+            fields_per_dollar = safe_div(row['fields'], row['cost'])
+
+            page_cols = (f"{tokens_per_page:11.1f} | ${cost_per_page:8.5f}" if row['pages'] > 0
+                         else f"{'-':>11} | {'-':>9}")
+            table.append(
+                f"| {phase:<10} | {row['key']:<68} | {row['articles']:8d} | {int(row['pages']):5d} | "
+                f"{page_cols} | {int(row['fields']):13d} | {tokens_per_field:12.1f} | "
+                f"${cost_per_field:9.5f} | {fields_per_dollar:12.1f} |"
+            )
+
+            if phase == 'End-to-end' and (best is None or fields_per_dollar > best[1]):
+                best = (row['key'], fields_per_dollar)
+
+    table.append("")
+    table.append(
+        f"Across {data['articles']} articles, Vision filled {data['vision_fields']} of "
+        f"{data['articles'] * len(METADATA_FIELDS)} metadata fields and the consensus "
+        f"{data['consensus_fields']} ({data['consensus_fields'] - data['vision_fields']:+d}); "
+        f"Topics filled {data['topics_fields']} topic fields. Consensus rows count only the fields "
+        f"added over the Vision baseline. Page and field ratios are ratio-of-sums within each group."
+    )
+    if best is not None:
+        table.append(f"Most fields per dollar (end-to-end): {best[0]} with {best[1]:.1f} fields/$ "
+                     f"(total spend ${data['total_cost']:.6f}).")
+
+    return "\n".join(table)
+
+def main():
+    """
+    Main function to generate token efficiency table
+    """
+    print("🪙 INFINITY RESEARCH - Token Efficiency Table Generator")
+    print("=" * 60)
+
+    if not os.path.exists("json"):
+        print("❌ Error: json folder not found!")
+        return
+
+    data = extract_token_efficiency_data("json")
+
+    if data['articles'] == 0:
+        print("❌ No article data found!")
+        return
+
+    print(f"\n📈 TOKEN EFFICIENCY RESULTS:")
+    print("=" * 50)
+    for phase, groups in data['groups'].items():
+        for row in groups:
+            print(f"🎯 {phase} [{row['key']}]: {safe_div(row['tokens'], row['fields']):.1f} tokens/field, "
+                  f"{safe_div(row['fields'], row['cost']):.1f} fields/$")
+
+    print(f"\n📝 Generating token efficiency table...")
+    table_content = generate_token_efficiency_table(data)
+
+    output_file = "plots/token_efficiency_table.txt"
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(table_content)
+
+    print(f"   ✅ Table saved: {output_file}")
+
+    print(f"\n🎯 Token efficiency table generation complete!")
+    print(f"   📊 Table: {output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+⚖️ LOCAL CONSENSUS ENGINE - Infinity Research Paper
+===================================================
+
+Deterministic, rule-based replacement for the `smart_consensus` LLM call.
+Merges `vision_json.extracted_data` with the raw payloads of the 11 API
+sources (`apis_raw_json.json`) into a `consensus_result` with
+`confidence_factors.field_sources` in the same notation as the LLM:
+
+- `a|b`: validated - sources returning the same value (majority vote,
+  Vision wins ties and keeps its formatting)
+- `a+b`: merged - Authors, Abstract and Keywords combine Vision with the
+  sources that agree with it
+
+Sources describing another work are excluded (the LLM's "coherent_apis");
+sources describing another version of the same work (preprint, repository
+copy, data deposit: same title, different DOI) only contribute Title,
+Authors, Abstract and Keywords. Fields without a clear majority are reported
+as true conflicts: only those need the LLM. Each local result is compared
+with the LLM consensus field by field.
+
+Input: JSON files from infinity-research-paper/json/Article_XX/
+Output: local_consensus.json + local_consensus_agreement.txt
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from article_metrics import API_SOURCES, METADATA_FIELDS, is_field_filled, load_article_jsons
+from field_normalizer import agreement_matrix, comparison_key, values_agree
+from source_extractors import extract_all_sources
+
+# Fields settled by majority vote ('|') vs. merged from several sources ('+')
+MERGED_FIELDS = ['Authors', 'Abstract', 'Keywords']
+
+# A voted field is a true conflict when the runner-up value has at least this
+# share of the winner's votes (e.g. print vs. online year 4:3); merged fields
+# are conflicts only when Vision disagrees with the sources
+CONFLICT_RATIO = 0.5
+
+# Preferred source when the chosen value has no Vision member (formatting only)
+FORMAT_PREFERENCE = ['crossref', 'europe_pmc', 'pubmed', 'semantic_scholar', 'openalex',
+                     'unpaywall', 'doaj', 'core', 'datacite', 'arxiv']
+
+# PDF links in order of preference
+PDF_PREFERENCE = ['semantic_scholar', 'crossref', 'europe_pmc', 'openalex', 'core', 'arxiv', 'datacite']
+
+# Citation indexes; Crossref and CORE only count deposited references and are a fallback
+CITATION_INDEXES = ['openalex', 'semantic_scholar', 'europe_pmc', 'datacite']
+
+# DOI prefixes of preprint servers, repositories and data deposits (not the published version)
+REPOSITORY_DOI_PREFIXES = ('10.48550/', '10.6084/', '10.17605/', '10.2139/', '10.1101/', '10.48448/',
+                           '10.25358/', '10.5281/', '10.31219/', '10.21203/', '10.20944/')
+
+# Fields describing the work itself: also taken from other versions of it
+WORK_FIELDS = ['Title', 'Authors', 'Abstract', 'Keywords']
+
+def reference_doi(vision: Dict, sources: Dict[str, Dict]) -> Optional[str]:
+    """
+    DOI of the version being reviewed: Vision's, else the most reported
+    publisher DOI (repository/preprint DOIs only when nothing else exists)
+    """
+    if is_field_filled(vision.get('DOI')):
+        return comparison_key('DOI', vision['DOI'])
+    votes = {}
+    for source in FORMAT_PREFERENCE:
+        if 'DOI' in sources.get(source, {}):
+            doi = comparison_key('DOI', sources[source]['DOI'])
+            votes[doi] = votes.get(doi, 0) + 1
+    if not votes:
+        return None
+    # Stable max: first source in FORMAT_PREFERENCE wins ties
+    ranked = sorted(votes, key=lambda d: (d.startswith(REPOSITORY_DOI_PREFIXES), -votes[d]))
+    return ranked[0]
+
+def coherent_sources(vision: Dict, sources: Dict[str, Dict]) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Split sources into coherent, other-version and incoherent ones
+
+    Coherent: same DOI as the reviewed version (or same title and no DOI).
+    Other version: same title but another DOI (preprint, repository copy,
+    data deposit) - only its work-level fields are used.
+    Incoherent: a different work.
+    """
+    doi = reference_doi(vision, sources)
+    title = vision.get('Title')
+    coherent, other_version, incoherent = [], [], []
+    for source, fields in sources.items():
+        same_title = is_field_filled(title) and 'Title' in fields and values_agree('Title', title, fields['Title'])
+        if doi and 'DOI' in fields:
+            if comparison_key('DOI', fields['DOI']) == doi:
+                coherent.append(source)
+            elif same_title:
+                other_version.append(source)
+            else:
+                incoherent.append(source)
+        elif same_title or not is_field_filled(title):
+            coherent.append(source)
+        else:
+            incoherent.append(source)
+    return coherent, other_version, incoherent
+
+def cluster_candidates(field: str, candidates: List[Tuple[str, object]]) -> List[List[Tuple[str, object]]]:
+    """Group (source, value) pairs whose values agree with the cluster's first member"""
+    agree = agreement_matrix(field, [v for _, v in candidates])
+    clusters, leaders = [], []
+    for i, candidate in enumerate(candidates):
+        for cluster, leader in zip(clusters, leaders):
+            if agree[leader, i]:
+                cluster.append(candidate)
+                break
+        else:
+            clusters.append([candidate])
+            leaders.append(i)
+    return clusters
+
+def preferred_member(cluster: List[Tuple[str, object]], preference: List[str]) -> Tuple[str, object]:
+    by_source = dict(cluster)
+    if 'vision' in by_source:
+        return 'vision', by_source['vision']
+    for source in preference:
+        if source in by_source:
+            return source, by_source[source]
+    return cluster[0]
+
+def resolve_field(field: str, candidates: List[Tuple[str, object]]) -> Dict:
+    """
+    Pick the value of one field from (source, value) candidates (Vision first)
+    Returns {'value', 'sources', 'conflict', 'alternatives'}.
+    """
+    if not candidates:
+        return {'value': None, 'sources': None, 'conflict': False, 'alternatives': []}
+
+    clusters = cluster_candidates(field, candidates)
+
+    if field == 'Citations':
+        # Counts only grow: the highest count of the citation indexes is the most recent
+        indexed = [(s, v) for s, v in candidates if s in CITATION_INDEXES] or candidates
+        best = max(comparison_key(field, v) for _, v in indexed)
+        members = [s for s, v in indexed if comparison_key(field, v) == best]
+        return {'value': best, 'sources': '|'.join(members), 'conflict': False, 'alternatives': []}
+
+    if field == 'PDFUrl':
+        by_source = dict(candidates)
+        source = next((s for s in PDF_PREFERENCE if s in by_source), candidates[0][0])
+        value = by_source[source]
+        members = [s for s, v in candidates if values_agree(field, value, v)]
+        return {'value': value, 'sources': '|'.join(members), 'conflict': False, 'alternatives': []}
+
+    # Largest cluster wins; Vision breaks ties, then source order
+    clusters.sort(key=lambda c: (-len(c), 0 if any(s == 'vision' for s, _ in c) else 1))
+    winner = clusters[0]
+    members = [s for s, _ in winner]
+    if field in MERGED_FIELDS:
+        conflict = any(s == 'vision' for s, _ in candidates) and 'vision' not in members
+    else:
+        conflict = len(clusters) > 1 and len(clusters[1]) >= CONFLICT_RATIO * len(winner)
+    alternatives = [{'value': c[0][1], 'sources': [s for s, _ in c]} for c in clusters[1:]]
+
+    if field in MERGED_FIELDS:
+        if field == 'Authors':
+            # Structured "Family, Given" list from an agreeing API, Vision's list otherwise
+            _, value = preferred_member([m for m in winner if m[0] != 'vision'] or winner, FORMAT_PREFERENCE)
+        elif field == 'Abstract':
+            value = max((v for _, v in winner), key=lambda v: len(str(v)))
+        else:
+            _, value = preferred_member(winner, FORMAT_PREFERENCE)
+        return {'value': value, 'sources': '+'.join(members), 'conflict': conflict, 'alternatives': alternatives}
+
+    _, value = preferred_member(winner, FORMAT_PREFERENCE)
+    if field == 'Year':
+        value = comparison_key(field, value)
+    elif field == 'OpenAccess':
+        value = comparison_key(field, value)
+    return {'value': value, 'sources': '|'.join(members), 'conflict': conflict, 'alternatives': alternatives}
+
+def build_local_consensus(vision: Dict, apis_raw: Dict) -> Dict:
+    """
+    Local consensus_result for one article, shaped like the LLM output
+    """
+    extracted = vision.get('extracted_data') or {}
+    sources = extract_all_sources(apis_raw)
+    coherent, other_version, incoherent = coherent_sources(extracted, sources)
+
+    result = {}
+    field_sources = {}
+    conflicts = {}
+    for field in METADATA_FIELDS:
+        candidates = []
+        if is_field_filled(extracted.get(field)):
+            candidates.append(('vision', extracted[field]))
+        contributors = [s for s in API_SOURCES if s in coherent or (s in other_version and field in WORK_FIELDS)]
+        candidates += [(s, sources[s][field]) for s in contributors if field in sources[s]]
+
+        resolved = resolve_field(field, candidates)
+        result[field] = resolved['value']
+        if resolved['sources']:
+            field_sources[field.lower()] = resolved['sources']
+        if resolved['conflict']:
+            conflicts[field] = resolved['alternatives']
+
+    successful = [s for s in API_SOURCES if isinstance(apis_raw.get(s), dict) and apis_raw[s].get('success')]
+    result['confidence_factors'] = {
+        'source': 'Local rule-based consensus (Vision-Foundation + API validation)',
+        'field_sources': field_sources,
+        'conflicts': conflicts
+    }
+    result['api_success_summary'] = {
+        'total_apis': len(API_SOURCES),
+        'successful_apis': len(successful),
+        'failed_apis': [s for s in API_SOURCES if s not in successful],
+        'coherent_apis': len(coherent),
+        'other_version_apis': other_version,
+        'incoherent_apis': incoherent,
+        'success_rate': round(len(successful) / len(API_SOURCES), 2),
+        'coherence_rate': round(len(coherent) / len(successful), 2) if successful else 0.0
+    }
+    return result
+
+def compare_with_llm(local: Dict, llm: Dict) -> Dict[str, bool]:
+    """Field-by-field agreement of the local and LLM consensus values"""
+    return {field: values_agree(field, local.get(field), llm.get(field)) for field in METADATA_FIELDS}
+
+def run_local_consensus(json_dir: str = "json") -> Dict:
+    """
+    Build the local consensus for every article and score it against the LLM
+    """
+    print("📊 Building local consensus from vision_json + apis_raw_json...")
+    articles = load_article_jsons(json_dir)
+    print(f"📁 Found {len(articles)} article folders")
+
+    rows = []
+    for article in articles:
+        local = build_local_consensus(article['vision'], article['apis_raw'])
+        llm = (article['apis_clean'] or {}).get('consensus_result') or {}
+        cost_tracking = (article['apis_clean'] or {}).get('cost_tracking') or {}
+        agreement = compare_with_llm(local, llm)
+        conflicts = list(local['confidence_factors']['conflicts'])
+        rows.append({
+            'article_num': article['article_num'],
+            'label': f"Art{article['article_num']}",
+            'consensus_result': local,
+            'agreement': agreement,
+            'conflicts': conflicts,
+            'llm_cost': float(cost_tracking.get('total_cost', 0) or 0),
+            'llm_time_ms': float(cost_tracking.get('processing_time_ms', 0) or 0)
+        })
+        print(f"   Art{article['article_num']}: {sum(agreement.values())}/{len(METADATA_FIELDS)} fields agree, "
+              f"{len(conflicts)} conflicting fields")
+
+    return {'articles': rows}
+
+def generate_agreement_table(data: Dict) -> str:
+    """
+    Generate the local vs LLM consensus agreement table
+    """
+    rows = data['articles']
+    n = len(rows)
+    table = ["Local Rule-Based Consensus vs LLM Consensus (smart_consensus)", ""]
+    table.append("| Field       | Agree | Agreement | Articles with conflict | Agreement without conflict |")
+    table.append("|-------------|-------|-----------|------------------------|----------------------------|")
+
+    for field in METADATA_FIELDS:
+        agree = sum(1 for r in rows if r['agreement'][field])
+        conflicted = [r for r in rows if field in r['conflicts']]
+        clean = [r for r in rows if field not in r['conflicts']]
+        clean_agree = sum(1 for r in clean if r['agreement'][field])
+        clean_cell = f"{clean_agree}/{len(clean)} ({(clean_agree / len(clean) * 100) if clean else 0:.1f}%)"
+        table.append(
+            f"| {field:<11} | {agree:2d}/{n:<2d} | {agree / n * 100:8.1f}% | {len(conflicted):22d} | "
+            f"{clean_cell:<26} |"
+        )
+
+    total_fields = n * len(METADATA_FIELDS)
+    agree_total = sum(sum(r['agreement'].values()) for r in rows)
+    clean_fields = [(r, f) for r in rows for f in METADATA_FIELDS if f not in r['conflicts']]
+    clean_agree = sum(1 for r, f in clean_fields if r['agreement'][f])
+    no_conflict = [r for r in rows if not r['conflicts']]
+    llm_cost = sum(r['llm_cost'] for r in rows)
+    llm_time = sum(r['llm_time_ms'] for r in rows) / 1000
+    saved_cost = sum(r['llm_cost'] for r in no_conflict)
+    saved_time = sum(r['llm_time_ms'] for r in no_conflict) / 1000
+
+    table.append("")
+    table.append(
+        f"Across {n} articles the local consensus matched the LLM on {agree_total}/{total_fields} fields "
+        f"({agree_total / total_fields * 100:.1f}%) and on {clean_agree}/{len(clean_fields)} "
+        f"({(clean_agree / len(clean_fields) * 100) if clean_fields else 0:.1f}%) of the fields where coherent "
+        f"sources did not conflict. Conflicts: {total_fields - len(clean_fields)} fields in "
+        f"{n - len(no_conflict)} articles."
+    )
+    table.append(
+        f"Reserving the LLM call for fields with true conflicts would skip it entirely for {len(no_conflict)}/{n} "
+        f"articles (${saved_cost:.6f} of ${llm_cost:.6f}, {saved_time:.1f}s of {llm_time:.1f}s); the remaining "
+        f"articles only need their conflicting fields resolved."
+    )
+    table.append("")
+    table.append("| Article | Agree | Conflicting fields |")
+    table.append("|---------|-------|--------------------|")
+    for r in rows:
+        table.append(f"| {r['label']:<7} | {sum(r['agreement'].values()):2d}/{len(METADATA_FIELDS)} | "
+                     f"{', '.join(r['conflicts']) or '-'} |")
+
+    return "\n".join(table)
+
+def main():
+    """
+    Main function to build the local consensus and its agreement table
+    """
+    parser = argparse.ArgumentParser(description="Rule-based consensus from vision_json + apis_raw_json")
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--output-dir', default='plots')
+    args = parser.parse_args()
+
+    print("⚖️ INFINITY RESEARCH - Local Consensus Engine")
+    print("=" * 50)
+
+    if not os.path.exists(args.json_dir):
+        print(f"❌ Error: {args.json_dir} folder not found!")
+        return
+
+    data = run_local_consensus(args.json_dir)
+    if not data['articles']:
+        print("❌ No article data found!")
+        return
+
+    results_file = os.path.join(args.output_dir, "local_consensus.json")
+    with open(results_file, 'w', encoding='utf-8') as f:
+        json.dump({r['label']: r['consensus_result'] for r in data['articles']}, f, indent=2, ensure_ascii=False)
+    print(f"\n   ✅ Consensus results saved: {results_file}")
+
+    print(f"\n📝 Generating agreement table...")
+    table_content = generate_agreement_table(data)
+    table_file = os.path.join(args.output_dir, "local_consensus_agreement.txt")
+    with open(table_file, 'w', encoding='utf-8') as f:
+        f.write(table_content)
+    print(f"   ✅ Table saved: {table_file}")
+
+    print(f"\n🎯 Local consensus complete!")
+    print(f"   📊 Table: {table_file}")
+
+if __name__ == "__main__":
+    main()
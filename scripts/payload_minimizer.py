@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+🗜️ PAYLOAD MINIMIZER - Infinity Research Paper
+==============================================
+
+Pre-consensus projection of `apis_raw_json.json`: each successful source's
+payload is reduced to the 16 metadata fields the consensus works with
+(source_extractors), values that are identical after normalization (equal
+field_normalizer comparison keys) are listed once with all their sources,
+and failed sources are reduced to their names. Values that only look alike
+(similar titles, overlapping author lists) stay separate, so the consensus
+still arbitrates every real variant:
+
+    {"Title": [{"value": "...", "sources": ["vision", "crossref", ...]}],
+     ...,
+     "_sources_ok": [...], "_sources_failed": [...]}
+
+Token counts are estimated locally (regex pre-tokenizer calibrated on the
+recorded consensus `input_tokens`: prompt overhead + scale x estimate), so
+the report shows consensus input tokens and cost before and after without
+any API call.
+
+Input: JSON files from infinity-research-paper/json/Article_XX/
+Output: payload_minimizer_report.txt (+ minimized payloads with --save-dir)
+"""
+
+import argparse
+import json
+import os
+import re
+from typing import Dict, List, Tuple
+import numpy as np
+
+from article_metrics import API_SOURCES, METADATA_FIELDS, load_article_jsons, source_entries, is_field_filled
+from field_normalizer import factorize, normalize_column
+from local_consensus import MERGED_FIELDS
+from source_extractors import extract_all_sources
+
+# Letter runs, 1-3 digit groups, punctuation runs (cl100k-like pre-tokenization)
+_TOKEN_PIECES = re.compile(r"[^\W\d_]+|\d{1,3}|[^\w\s]+|_")
+_JSON_PUNCTUATION = set('{}[]",:')
+
+# Average letters per token of a long word
+LETTERS_PER_TOKEN = 7
+
+def estimate_tokens(text: str) -> int:
+    """Local token estimate (uncalibrated; see calibrate_token_model)"""
+    count = 0
+    for piece in _TOKEN_PIECES.findall(text):
+        if piece[0].isalpha():
+            count += -(-len(piece) // LETTERS_PER_TOKEN)
+        elif piece[0] in _JSON_PUNCTUATION:
+            count += -(-len(piece) // 2)
+        else:
+            count += 1
+    return count
+
+def serialize(payload) -> str:
+    return json.dumps(payload, ensure_ascii=False)
+
+def original_payload(article: Dict) -> str:
+    """What the consensus prompt receives today: Vision fields + every raw source entry"""
+    extracted = article['vision'].get('extracted_data') or {}
+    return serialize(extracted) + serialize(source_entries(article['apis_raw']))
+
+def minimize_payload(article: Dict) -> Dict:
+    """
+    Projected, deduplicated consensus input for one article
+    """
+    extracted = article['vision'].get('extracted_data') or {}
+    entries = source_entries(article['apis_raw'])
+    sources = extract_all_sources(entries)
+
+    minimized = {}
+    for field in METADATA_FIELDS:
+        candidates = [('vision', extracted[field])] if is_field_filled(extracted.get(field)) else []
+        candidates += [(s, fields[field]) for s, fields in sources.items() if field in fields]
+        if not candidates:
+            continue
+        codes, _ = factorize(normalize_column(field, [v for _, v in candidates]))
+        values = []
+        for code in range(codes.max() + 1):
+            group = [candidate for candidate, c in zip(candidates, codes) if c == code]
+            # Merged fields keep the most complete member, others the first (Vision-first order)
+            if field in MERGED_FIELDS:
+                value = max((v for _, v in group), key=lambda v: len(serialize(v)))
+            else:
+                value = group[0][1]
+            values.append({'value': value, 'sources': [s for s, _ in group]})
+        minimized[field] = values
+
+    minimized['_sources_ok'] = [s for s in API_SOURCES if entries.get(s, {}).get('success')]
+    minimized['_sources_failed'] = [s for s in API_SOURCES if s in entries and not entries[s].get('success')]
+    return minimized
+
+def calibrate_token_model(estimates: np.ndarray, input_tokens: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Least-squares fit input_tokens = overhead + scale * estimate
+    Returns (overhead, scale, median relative error).
+    """
+    design = np.column_stack([np.ones(len(estimates)), estimates])
+    (overhead, scale), *_ = np.linalg.lstsq(design, input_tokens, rcond=None)
+    predicted = overhead + scale * estimates
+    error = float(np.median(np.abs(predicted - input_tokens) / input_tokens))
+    return float(overhead), float(scale), error
+
+def analyze_payloads(articles: List[Dict]) -> Dict:
+    """
+    Sizes and token estimates before/after minimization for every article
+    """
+    rows = []
+    for article in articles:
+        cost = (article['apis_clean'] or {}).get('cost_tracking') or {}
+        if not cost.get('input_tokens'):
+            continue
+        before = original_payload(article)
+        minimized = minimize_payload(article)
+        after = serialize(minimized)
+        rows.append({
+            'folder': article['folder'],
+            'label': f"Art{article['article_num']}",
+            'minimized': minimized,
+            'bytes_before': len(before.encode('utf-8')),
+            'bytes_after': len(after.encode('utf-8')),
+            'estimate_before': estimate_tokens(before),
+            'estimate_after': estimate_tokens(after),
+            'input_tokens': int(cost['input_tokens']),
+            'input_cost': float(cost.get('input_cost') or 0.0)
+        })
+
+    estimates = np.array([r['estimate_before'] for r in rows], dtype=float)
+    actual = np.array([r['input_tokens'] for r in rows], dtype=float)
+    overhead, scale, error = calibrate_token_model(estimates, actual)
+    for row in rows:
+        row['tokens_after'] = overhead + scale * row['estimate_after']
+        row['cost_after'] = row['input_cost'] * row['tokens_after'] / row['input_tokens']
+    return {'rows': rows, 'overhead': overhead, 'scale': scale, 'calibration_error': error}
+
+def generate_minimizer_report(analysis: Dict) -> str:
+    """
+    Generate the payload minimizer table
+    """
+    rows = analysis['rows']
+    lines = ["Consensus Payload Minimizer (projection to 16 fields + cross-source deduplication)", ""]
+    lines.append(f"Token model: input_tokens = {analysis['overhead']:.0f} + {analysis['scale']:.3f} x local estimate "
+                 f"(median error {analysis['calibration_error'] * 100:.1f}% on the recorded consensus calls).")
+    lines.append("")
+    lines.append("| Article | Payload KB | Minimized KB | Input tokens (recorded) | Estimated after | Reduction | Input cost after ($) |")
+    lines.append("|---------|------------|--------------|-------------------------|-----------------|-----------|----------------------|")
+    for row in rows:
+        reduction = 1 - row['tokens_after'] / row['input_tokens']
+        lines.append(f"| {row['label']:<7} | {row['bytes_before'] / 1024:10.1f} | {row['bytes_after'] / 1024:12.1f} | "
+                     f"{row['input_tokens']:23,d} | {row['tokens_after']:15,.0f} | {reduction * 100:8.1f}% | "
+                     f"{row['cost_after']:20.6f} |")
+
+    total_before = sum(r['input_tokens'] for r in rows)
+    total_after = sum(r['tokens_after'] for r in rows)
+    cost_before = sum(r['input_cost'] for r in rows)
+    cost_after = sum(r['cost_after'] for r in rows)
+    lines.append(f"| TOTAL   | {sum(r['bytes_before'] for r in rows) / 1024:10.1f} | "
+                 f"{sum(r['bytes_after'] for r in rows) / 1024:12.1f} | {total_before:23,d} | {total_after:15,.0f} | "
+                 f"{(1 - total_after / total_before) * 100:8.1f}% | {cost_after:20.6f} |")
+    lines.append("")
+    lines.append(f"Consensus input: {total_before / len(rows):,.0f} -> {total_after / len(rows):,.0f} tokens per article; "
+                 f"input cost ${cost_before:.4f} -> ${cost_after:.4f} for {len(rows)} articles.")
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to minimize the consensus payloads and report the savings
+    """
+    parser = argparse.ArgumentParser(description="Project and deduplicate API payloads before consensus")
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--save-dir', help="write Article_XX/consensus_payload.json files here")
+    parser.add_argument('--output', default='plots/payload_minimizer_report.txt')
+    args = parser.parse_args()
+
+    print("🗜️ INFINITY RESEARCH - Payload Minimizer")
+    print("=" * 50)
+
+    articles = load_article_jsons(args.json_dir)
+    if not articles:
+        print("❌ No article data found!")
+        return
+    print(f"📁 Found {len(articles)} article folders")
+
+    analysis = analyze_payloads(articles)
+    report = generate_minimizer_report(analysis)
+
+    if args.save_dir:
+        for row in analysis['rows']:
+            article_dir = os.path.join(args.save_dir, row['folder'])
+            os.makedirs(article_dir, exist_ok=True)
+            with open(os.path.join(article_dir, 'consensus_payload.json'), 'w', encoding='utf-8') as f:
+                json.dump(row['minimized'], f, indent=2, ensure_ascii=False)
+        print(f"✅ Minimized payloads saved to {args.save_dir}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(report)
+
+    print(f"\n{report}")
+    print(f"\n🎯 Payload minimization complete!")
+    print(f"   📊 Report: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+🏷️ CONCORDANCE PRE-CLASSIFIER - Infinity Research Paper
+=======================================================
+
+Local, LLM-free batch scorer that proposes an A-F concordance category for
+every `infinity_content` / `manual_content` pair of the evaluation files,
+with a calibrated confidence, so clear cases can be auto-accepted and only
+the rest sent to an LLM evaluator.
+
+Features (computed for all pairs at once):
+- char 3-gram TF-IDF cosine of the folded texts (sparse: joins of
+  (pair, n-gram) keys, no dense document matrix); the IDF is fitted once on
+  the training texts and stored in the model, so a pair scores the same in
+  any batch (--input) as in training
+- word recall / precision of the manual words in the automated text
+- log length ratio (automated adds detail -> B, leaves gaps -> C)
+- year mismatch and fraction of manual numbers missing from the automated text
+- placeholder manual content ("Not applicable", "Not evaluated", ...; the
+  automated side never has one, so it is not a feature)
+- scientific field (one-hot)
+
+The scorer is a softmax (multinomial logistic) regression trained on the
+existing Claude and DeepSeek classifications, temperature-scaled on
+leave-one-article-out predictions. Auto-accept thresholds for A and D are the
+lowest confidences whose out-of-fold precision reaches the target; since that
+precision is measured on the predictions the thresholds were chosen on, the
+report also gives a nested estimate (thresholds chosen without the article
+they are applied to).
+
+Input: analysis/analysis_claude.json + analysis/analysis_deepseek.json
+       (--input: any file in the same format, classified or not)
+Output: pre_classifier_report.txt + pre_classifications.json
+"""
+
+import argparse
+import json
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from classification_table import CATEGORIES, COMPOSITE_FIELDS, DEFAULT_ANALYSIS_FILES, ITEMS
+from field_normalizer import fold_text
+
+NGRAM = 3
+DEFAULT_PRECISION = 0.95
+AUTO_ACCEPT = ['A', 'D']
+L2_PENALTY = 0.05
+
+_YEAR = re.compile(r'\b(?:19|20)\d{2}\b')
+_NUMBER = re.compile(r'\d+(?:[.,]\d+)?')
+_PLACEHOLDER = re.compile(r'^(not (applicable|evaluated|reported|available|specified|mentioned)|n/?a|none|unknown|-)?\.?$')
+
+FEATURES = ['tfidf_cosine', 'word_recall', 'word_precision', 'log_length_ratio', 'year_mismatch',
+            'number_missing', 'manual_placeholder'] + [f"item: {item}" for item in ITEMS]
+
+def split_composite(text: str) -> Dict[str, str]:
+    """'Author et al., 2022, Pilot study' -> {'Author': ..., 'Year': ..., 'Study Type': ...} (split at the year)"""
+    year = _YEAR.search(text or '')
+    if not year:
+        return {'Author': text or '', 'Year': '', 'Study Type': ''}
+    return {'Author': text[:year.start()].strip(' , '), 'Year': year.group(),
+            'Study Type': text[year.end():].strip(' , ')}
+
+def extract_pairs(data: List[Dict]) -> List[Dict]:
+    """
+    One pair per scientific field (subfield of the composite field) of every article
+    with the category of the evaluation file when it has one
+    """
+    pairs = []
+    for position, article in enumerate(data):
+        article_number = int(article.get('article_number', position + 1))
+        for field_name, field_data in article['fields'].items():
+            analysis = field_data.get('analysis', {}) or {}
+            infinity, manual = field_data.get('infinity_content', ''), field_data.get('manual_content', '')
+            if field_name in COMPOSITE_FIELDS:
+                infinity_parts, manual_parts = split_composite(infinity), split_composite(manual)
+                for prefix, subfield in COMPOSITE_FIELDS[field_name]:
+                    pairs.append({'article': article_number, 'item': subfield, 'infinity': infinity_parts[subfield],
+                                  'manual': manual_parts[subfield],
+                                  'category': analysis.get(f'{prefix}_classification')})
+            else:
+                pairs.append({'article': article_number, 'item': field_name, 'infinity': infinity or '',
+                              'manual': manual or '', 'category': analysis.get('classification')})
+    return pairs
+
+def _doc_terms(docs: List[List[str]], vocabulary: Optional[Dict[str, int]] = None
+               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (doc, term, count) of the distinct terms of every document
+    Terms are factorized over all documents, or numbered by the vocabulary when one is given
+    (terms outside it get ids from len(vocabulary) on, equal terms the same id).
+    """
+    doc_ids = np.repeat(np.arange(len(docs)), [len(d) for d in docs])
+    flat = [term for doc in docs for term in doc]
+    if not flat:
+        return doc_ids, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if vocabulary is None:
+        _, term_ids = np.unique(np.array(flat), return_inverse=True)
+    else:
+        unseen = {}
+        term_ids = np.array([vocabulary[t] if t in vocabulary else len(vocabulary) + unseen.setdefault(t, len(unseen))
+                             for t in flat], dtype=np.int64)
+    n_terms = int(term_ids.max()) + 1
+    keys, counts = np.unique(doc_ids * n_terms + term_ids, return_counts=True)
+    return keys // n_terms, keys % n_terms, counts
+
+def _pair_dot(doc: np.ndarray, term: np.ndarray, weight: np.ndarray, n_pairs: int) -> np.ndarray:
+    """Sum of weight products of the terms shared by document i and document n_pairs + i"""
+    left, right = doc < n_pairs, doc >= n_pairs
+    n_terms = int(term.max()) + 1 if len(term) else 1
+    left_keys = doc[left] * n_terms + term[left]
+    right_keys = (doc[right] - n_pairs) * n_terms + term[right]
+    shared, li, ri = np.intersect1d(left_keys, right_keys, assume_unique=True, return_indices=True)
+    products = weight[left][li] * weight[right][ri]
+    return np.bincount(shared // n_terms, weights=products, minlength=n_pairs)
+
+def char_ngrams(texts: List[str], n: int = NGRAM) -> List[List[str]]:
+    """Char n-grams of the folded, space-padded texts (none for empty texts)"""
+    padded = [f" {fold_text(t)} " for t in texts]
+    return [[t[i:i + n] for i in range(len(t) - n + 1)] if t.strip() else [] for t in padded]
+
+def fit_idf(texts: List[str], n: int = NGRAM) -> Dict:
+    """
+    Smoothed IDF of the char n-grams of a corpus: {'vocabulary', 'weights', 'unseen', 'n'}
+    ('unseen': IDF of n-grams outside the vocabulary, i.e. document frequency 0)
+    """
+    grams = char_ngrams(texts, n)
+    vocabulary = {gram: i for i, gram in enumerate(sorted({g for doc in grams for g in doc}))}
+    _, term, _ = _doc_terms(grams, vocabulary)
+    df = np.bincount(term, minlength=len(vocabulary))
+    return {'vocabulary': vocabulary, 'weights': np.log((1 + len(texts)) / (1 + df)) + 1,
+            'unseen': float(np.log(1 + len(texts)) + 1), 'n': n}
+
+def tfidf_cosine(left: List[str], right: List[str], idf: Optional[Dict] = None) -> np.ndarray:
+    """
+    Char n-gram TF-IDF cosine of every (left[i], right[i]) pair, sublinear TF
+
+    idf: fitted corpus IDF (fit_idf); without it the IDF is fitted on the documents being scored.
+    """
+    if idf is None:
+        idf = fit_idf(left + right)
+    grams = char_ngrams(left + right, idf['n'])
+    doc, term, count = _doc_terms(grams, idf['vocabulary'])
+    n_docs = len(grams)
+    # Vocabulary ids index the fitted weights; unseen n-grams (ids past the vocabulary) get the unseen IDF
+    weights = np.append(idf['weights'], idf['unseen'])
+    weight = (1 + np.log(count)) * weights[np.minimum(term, len(idf['weights']))]
+    norm = np.sqrt(np.bincount(doc, weights=weight ** 2, minlength=n_docs))
+    dot = _pair_dot(doc, term, weight, len(left))
+    denominator = norm[:len(left)] * norm[len(left):]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(denominator > 0, dot / denominator, 0.0)
+
+def set_overlap(left: List[List[str]], right: List[List[str]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(shared, left size, right size) of the distinct terms of every (left[i], right[i]) pair"""
+    doc, term, _ = _doc_terms(left + right)
+    sizes = np.bincount(doc, minlength=len(left) + len(right))
+    shared = _pair_dot(doc, term, np.ones(len(term)), len(left))
+    return shared, sizes[:len(left)], sizes[len(left):]
+
+def _fraction(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(denominator > 0, numerator / np.maximum(denominator, 1), 0.0)
+
+def pair_features(pairs: List[Dict], idf: Optional[Dict] = None) -> np.ndarray:
+    """(pairs x FEATURES) feature matrix (idf: the model's corpus IDF for the TF-IDF cosine)"""
+    infinity = [p['infinity'] for p in pairs]
+    manual = [p['manual'] for p in pairs]
+    cosine = tfidf_cosine(infinity, manual, idf)
+
+    shared, infinity_words, manual_words = set_overlap([fold_text(t).split() for t in infinity],
+                                                       [fold_text(t).split() for t in manual])
+    lengths = np.array([[len(a), len(b)] for a, b in zip(infinity, manual)], dtype=float)
+
+    shared_years, infinity_years, manual_years = set_overlap([_YEAR.findall(t) for t in infinity],
+                                                             [_YEAR.findall(t) for t in manual])
+    year_mismatch = (infinity_years > 0) & (manual_years > 0) & (shared_years < manual_years)
+    shared_numbers, _, manual_numbers = set_overlap([_NUMBER.findall(t) for t in infinity],
+                                                    [_NUMBER.findall(t) for t in manual])
+
+    placeholder = np.array([bool(_PLACEHOLDER.match(t.strip().lower())) for t in manual])
+    item_ids = np.array([ITEMS.index(p['item']) if p['item'] in ITEMS else -1 for p in pairs])
+    items = (item_ids[:, None] == np.arange(len(ITEMS))).astype(float)
+
+    return np.column_stack([
+        cosine,
+        _fraction(shared, manual_words),
+        _fraction(shared, infinity_words),
+        np.log1p(lengths[:, 0]) - np.log1p(lengths[:, 1]),
+        year_mismatch,
+        np.where(manual_numbers > 0, 1 - _fraction(shared_numbers, manual_numbers), 0.0),
+        placeholder,
+        items
+    ]).astype(float)
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return shifted / shifted.sum(axis=1, keepdims=True)
+
+def fit_softmax(features: np.ndarray, labels: np.ndarray, n_classes: int = len(CATEGORIES),
+                l2: float = L2_PENALTY, iterations: int = 2000, step: float = 0.5) -> Dict:
+    """Multinomial logistic regression (full-batch gradient descent on standardized features)"""
+    mean, scale = features.mean(axis=0), features.std(axis=0)
+    scale[scale == 0] = 1
+    x = np.column_stack([(features - mean) / scale, np.ones(len(features))])
+    targets = np.eye(n_classes)[labels]
+    weights = np.zeros((x.shape[1], n_classes))
+    penalty = np.ones((x.shape[1], 1))
+    penalty[-1] = 0
+    for _ in range(iterations):
+        gradient = x.T @ (softmax(x @ weights) - targets) / len(x) + l2 * penalty * weights
+        weights -= step * gradient
+    return {'mean': mean, 'scale': scale, 'weights': weights, 'temperature': 1.0}
+
+def predict_logits(model: Dict, features: np.ndarray) -> np.ndarray:
+    x = np.column_stack([(features - model['mean']) / model['scale'], np.ones(len(features))])
+    return x @ model['weights']
+
+def predict_proba(model: Dict, features: np.ndarray) -> np.ndarray:
+    return softmax(predict_logits(model, features) / model['temperature'])
+
+def fit_temperature(logits: np.ndarray, labels: np.ndarray) -> float:
+    """Temperature minimizing the negative log-likelihood of held-out logits (grid search)"""
+    grid = np.linspace(0.25, 5, 96)
+    scaled = logits[None, :, :] / grid[:, None, None]
+    scaled = scaled - scaled.max(axis=2, keepdims=True)
+    log_probs = scaled - np.log(np.exp(scaled).sum(axis=2, keepdims=True))
+    nll = -log_probs[:, np.arange(len(labels)), labels].mean(axis=1)
+    return float(grid[np.argmin(nll)])
+
+def cross_validated_logits(features: np.ndarray, labels: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Leave-one-article-out logits of every labelled row"""
+    logits = np.zeros((len(labels), len(CATEGORIES)))
+    for group in np.unique(groups):
+        held_out = groups == group
+        model = fit_softmax(features[~held_out], labels[~held_out])
+        logits[held_out] = predict_logits(model, features[held_out])
+    return logits
+
+def auto_accept_thresholds(probabilities: np.ndarray, labels: np.ndarray,
+                           precision: float = DEFAULT_PRECISION) -> Dict[str, Optional[float]]:
+    """
+    Per auto-accept category, the lowest confidence at which the proposals at or above it
+    reach the target precision (None when no threshold does)
+    """
+    proposed, confidence = probabilities.argmax(axis=1), probabilities.max(axis=1)
+    thresholds = {}
+    for category in AUTO_ACCEPT:
+        code = CATEGORIES.index(category)
+        mask = proposed == code
+        order = np.argsort(-confidence[mask])
+        correct = (labels[mask][order] == code).cumsum()
+        running = correct / np.arange(1, len(order) + 1)
+        # Lowest confidence whose proposals at or above it all keep the running precision on target
+        valid = np.flatnonzero(np.minimum.accumulate(running[::-1])[::-1] >= precision)
+        thresholds[category] = float(confidence[mask][order][valid[-1]]) if len(valid) else None
+    return thresholds
+
+def auto_accept_mask(probabilities: np.ndarray, thresholds: Dict[str, Optional[float]]) -> np.ndarray:
+    proposed, confidence = probabilities.argmax(axis=1), probabilities.max(axis=1)
+    mask = np.zeros(len(probabilities), dtype=bool)
+    for category, threshold in thresholds.items():
+        if threshold is not None:
+            mask |= (proposed == CATEGORIES.index(category)) & (confidence >= threshold)
+    return mask
+
+def nested_auto_accept(probabilities: np.ndarray, labels: np.ndarray, groups: np.ndarray,
+                       precision: float = DEFAULT_PRECISION) -> np.ndarray:
+    """
+    Auto-accept mask of out-of-fold proposals, each article judged with thresholds
+    chosen on the other articles only (unbiased estimate of the auto-accept precision)
+    """
+    accepted = np.zeros(len(labels), dtype=bool)
+    for group in np.unique(groups):
+        held_out = groups == group
+        thresholds = auto_accept_thresholds(probabilities[~held_out], labels[~held_out], precision)
+        accepted[held_out] = auto_accept_mask(probabilities[held_out], thresholds)
+    return accepted
+
+def load_training_pairs(files: Dict[str, str]) -> Tuple[List[Dict], np.ndarray, np.ndarray, np.ndarray, Dict]:
+    """Labelled pairs of every evaluation file -> (pairs, features, labels, article groups, corpus IDF)"""
+    pairs = []
+    for evaluator, path in files.items():
+        with open(path, 'r', encoding='utf-8') as f:
+            pairs.extend(dict(p, evaluator=evaluator) for p in extract_pairs(json.load(f)) if p['category'] in CATEGORIES)
+    labels = np.array([CATEGORIES.index(p['category']) for p in pairs])
+    groups = np.array([p['article'] for p in pairs])
+    idf = fit_idf([p['infinity'] for p in pairs] + [p['manual'] for p in pairs])
+    return pairs, pair_features(pairs, idf), labels, groups, idf
+
+def train_pre_classifier(files: Dict[str, str] = DEFAULT_ANALYSIS_FILES,
+                         precision: float = DEFAULT_PRECISION) -> Dict:
+    """
+    Train on all labelled pairs, calibrate the temperature and auto-accept thresholds out of fold
+    """
+    pairs, features, labels, groups, idf = load_training_pairs(files)
+    held_out_logits = cross_validated_logits(features, labels, groups)
+    temperature = fit_temperature(held_out_logits, labels)
+    held_out = softmax(held_out_logits / temperature)
+    thresholds = auto_accept_thresholds(held_out, labels, precision)
+
+    model = fit_softmax(features, labels)
+    model['temperature'] = temperature
+    model['thresholds'] = thresholds
+    model['idf'] = idf
+    return {'model': model, 'pairs': pairs, 'labels': labels, 'held_out': held_out, 'precision': precision,
+            'nested_accepted': nested_auto_accept(held_out, labels, groups, precision)}
+
+def classify_pairs(model: Dict, pairs: List[Dict]) -> List[Dict]:
+    """Proposed category, confidence and auto-accept flag of every pair"""
+    probabilities = predict_proba(model, pair_features(pairs, model['idf']))
+    accepted = auto_accept_mask(probabilities, model['thresholds'])
+    return [{'article': p['article'], 'item': p['item'], 'proposed': CATEGORIES[int(row.argmax())],
+             'confidence': round(float(row.max()), 4), 'auto_accept': bool(accepted[i]),
+             'probabilities': dict(zip(CATEGORIES, np.round(row, 4).tolist()))}
+            for i, (p, row) in enumerate(zip(pairs, probabilities))]
+
+def calibration_bins(probabilities: np.ndarray, labels: np.ndarray, edges=(0, 0.5, 0.7, 0.8, 0.9, 1.0)) -> List[Tuple]:
+    """(bin label, n, mean confidence, accuracy) of out-of-fold proposals by confidence"""
+    confidence = probabilities.max(axis=1)
+    correct = probabilities.argmax(axis=1) == labels
+    bins = np.clip(np.searchsorted(edges, confidence, side='right') - 1, 0, len(edges) - 2)
+    rows = []
+    for b in range(len(edges) - 1):
+        mask = bins == b
+        if mask.any():
+            rows.append((f"{edges[b]:.1f}-{edges[b + 1]:.1f}", int(mask.sum()), confidence[mask].mean(),
+                         correct[mask].mean()))
+    return rows
+
+def generate_pre_classifier_report(training: Dict) -> str:
+    """
+    Generate the pre-classifier calibration report
+    """
+    labels, held_out = training['labels'], training['held_out']
+    model = training['model']
+    proposed = held_out.argmax(axis=1)
+    evaluators = np.array([p['evaluator'] for p in training['pairs']])
+
+    lines = ["Concordance Pre-Classifier (LLM-free) - Calibration", ""]
+    lines.append(f"{len(labels)} labelled pairs ({', '.join(f'{e}: {int((evaluators == e).sum())}' for e in np.unique(evaluators))}); "
+                 f"leave-one-article-out predictions, temperature {model['temperature']:.2f}.")
+    lines.append("")
+    lines.append("Out-of-fold accuracy: " + ", ".join(
+        f"{e} {(proposed[evaluators == e] == labels[evaluators == e]).mean() * 100:.1f}%" for e in np.unique(evaluators)))
+    concordant = lambda codes: codes <= 2
+    lines.append(f"General concordance decision (A-C vs D-F) accuracy: "
+                 f"{(concordant(proposed) == concordant(labels)).mean() * 100:.1f}%")
+    lines.append("")
+
+    confusion = np.bincount(labels * len(CATEGORIES) + proposed, minlength=len(CATEGORIES) ** 2)
+    confusion = confusion.reshape(len(CATEGORIES), len(CATEGORIES))
+    lines.append("| Label \\ Proposed | " + " | ".join(f"{c:>3}" for c in CATEGORIES) + " | Recall |")
+    lines.append("|------------------|" + "|".join("-----" for _ in CATEGORIES) + "|--------|")
+    for i, category in enumerate(CATEGORIES):
+        recall = confusion[i, i] / confusion[i].sum() * 100 if confusion[i].sum() else 0.0
+        lines.append(f"| {category:<16} | " + " | ".join(f"{v:3d}" for v in confusion[i]) + f" | {recall:5.1f}% |")
+    lines.append("")
+
+    lines.append("| Confidence | N   | Mean confidence | Accuracy |")
+    lines.append("|------------|-----|-----------------|----------|")
+    for label, n, mean_confidence, accuracy in calibration_bins(held_out, labels):
+        lines.append(f"| {label:<10} | {n:3d} | {mean_confidence * 100:14.1f}% | {accuracy * 100:7.1f}% |")
+    lines.append("")
+
+    lines.append(f"Auto-accept (target precision {training['precision'] * 100:.0f}%, out of fold):")
+    accepted = auto_accept_mask(held_out, model['thresholds'])
+    for category, threshold in model['thresholds'].items():
+        code = CATEGORIES.index(category)
+        mask = accepted & (proposed == code)
+        if threshold is None:
+            lines.append(f"   {category}: no threshold reaches the target; always sent to the evaluator")
+        else:
+            lines.append(f"   {category}: confidence >= {threshold:.2f} -> {int(mask.sum())} pairs, "
+                         f"precision {(labels[mask] == code).mean() * 100:.1f}%")
+    lines.append(f"   {int(accepted.sum())} of {len(labels)} labelled pairs ({accepted.mean() * 100:.1f}%) would skip "
+                 f"the LLM evaluator.")
+    lines.append("   These precisions are measured on the predictions the thresholds were chosen on (optimistic).")
+    nested = training['nested_accepted']
+    nested_correct = nested & (proposed == labels)
+    lines.append(f"   Nested estimate (thresholds chosen without the article): {int(nested.sum())} pairs accepted, "
+                 f"precision {nested_correct.sum() / nested.sum() * 100 if nested.any() else 0:.1f}%.")
+    lines.append("")
+
+    lines.append("| Feature              | " + " | ".join(f"{c:>6}" for c in CATEGORIES) + " |")
+    lines.append("|----------------------|" + "|".join("--------" for _ in CATEGORIES) + "|")
+    for name, row in zip(FEATURES, model['weights']):
+        if not name.startswith('item: '):
+            lines.append(f"| {name:<20} | " + " | ".join(f"{w:+6.2f}" for w in row) + " |")
+    lines.append("")
+    lines.append("Weights are on standardized features (field one-hot weights omitted).")
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to train, calibrate and run the pre-classifier
+    """
+    parser = argparse.ArgumentParser(description="LLM-free A-F concordance pre-classifier")
+    parser.add_argument('--input', help="Evaluation-format JSON to classify (default: the labelled files)")
+    parser.add_argument('--precision', type=float, default=DEFAULT_PRECISION,
+                        help="Target precision of auto-accepted A/D proposals")
+    parser.add_argument('--output', default='plots/pre_classifications.json')
+    parser.add_argument('--report', default='plots/pre_classifier_report.txt')
+    args = parser.parse_args()
+
+    print("🏷️ INFINITY RESEARCH - Concordance Pre-Classifier")
+    print("=" * 50)
+
+    training = train_pre_classifier(DEFAULT_ANALYSIS_FILES, args.precision)
+    print(f"✅ Trained on {len(training['labels'])} labelled pairs")
+
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            pairs = extract_pairs(json.load(f))
+    else:
+        # The content pairs are the same in both evaluation files: score them once
+        pairs = [p for p in training['pairs'] if p['evaluator'] == training['pairs'][0]['evaluator']]
+
+    started = time.perf_counter()
+    proposals = classify_pairs(training['model'], pairs)
+    seconds = time.perf_counter() - started
+
+    print(f"✅ {len(pairs)} pairs scored in {seconds * 1000:.1f} ms")
+
+    report = generate_pre_classifier_report(training)
+    with open(args.report, 'w', encoding='utf-8') as f:
+        f.write(report)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(proposals, f, indent=2, ensure_ascii=False)
+
+    accepted = sum(p['auto_accept'] for p in proposals)
+    print(f"\n{report}")
+    print(f"\n🎯 Pre-classification complete! {accepted}/{len(proposals)} pairs auto-accepted")
+    print(f"   📊 Report: {args.report}")
+    print(f"   📁 Proposals: {args.output}")
+
+if __name__ == "__main__":
+    main()
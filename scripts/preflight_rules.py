@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+🛂 PRE-FLIGHT RULES - Infinity Research Paper
+=============================================
+
+Skips API calls that cannot succeed before they spend latency and
+rate-limit budget:
+
+- identifier rules: Unpaywall and DOAJ are looked up by DOI ("No DOI
+  provided", "No DOI available for DOAJ search"); every source needs at
+  least a DOI, PMID or title
+- learned rules: source x article feature (DOI prefix, journal, or any
+  article) combinations that never succeeded in the historical
+  `apis_raw_json.json` files and always failed structurally ("No results
+  found", "No matching articles found", ...). Timeouts and exceptions are
+  transient and never make a rule.
+
+A small, deterministic share of would-be-skipped calls is still made
+(`probe_rate`) so rules are re-checked as sources change. The fan-out
+client records skipped calls with a distinct `status`
+(`skipped_missing_identifier`, `skipped_rule`, `skipped_negative_cache`).
+
+The report evaluates the learned rules leave-one-article-out on the corpus:
+calls and latency saved vs. calls wrongly skipped.
+
+Input: JSON files from infinity-research-paper/json/Article_XX/
+Output: preflight_rules.json + preflight_report.txt
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from article_metrics import API_SOURCES, load_article_jsons, source_entries
+from field_normalizer import fold_text
+from source_extractors import strip_doi
+
+# Failures that repeat for the same article (not timeouts, crashes or rate limits)
+STRUCTURAL_ERROR = re.compile(r'^no (results|matching|doi)|not found|no doi (provided|available)', re.IGNORECASE)
+
+# Identifiers a source can be queried with (any of them); sources not listed accept DOI/PMID/title
+REQUIRED_IDENTIFIERS = {
+    'unpaywall': ['DOI'],
+    'doaj': ['DOI']
+}
+DEFAULT_IDENTIFIERS = ['DOI', 'PMID', 'Title']
+
+# Minimum failed trials before a rule is learned (per feature value / for a whole source)
+MIN_SUPPORT = 3
+MIN_SOURCE_SUPPORT = 10
+
+DEFAULT_PROBE_RATE = 0.05
+
+# Article features rules are learned on ('source' matches every article)
+RULE_FEATURES = ['source', 'doi_prefix', 'journal']
+
+def is_structural_error(error) -> bool:
+    return isinstance(error, str) and bool(STRUCTURAL_ERROR.search(error.strip()))
+
+def article_features(identifiers: Dict) -> Dict[str, str]:
+    """Feature values of an article used by the learned rules"""
+    doi = strip_doi(identifiers.get('DOI'))
+    return {
+        'source': '*',
+        'doi_prefix': doi.split('/')[0].lower() if doi else 'none',
+        'journal': fold_text(identifiers.get('Journal') or '') or 'none'
+    }
+
+def article_identifiers(article: Dict) -> Dict:
+    """DOI/PMID/Title/Journal of an article from its Vision extraction"""
+    extracted = (article['vision'] or {}).get('extracted_data') or {}
+    return {
+        'folder': article['folder'],
+        'DOI': extracted.get('DOI'),
+        'PMID': extracted.get('PMID'),
+        'Title': extracted.get('Title'),
+        'Journal': extracted.get('Journal')
+    }
+
+def learn_rules(articles: List[Dict], min_support: int = MIN_SUPPORT,
+                min_source_support: int = MIN_SOURCE_SUPPORT) -> List[Dict]:
+    """
+    Source x feature values that never succeeded and only failed structurally
+    """
+    trials = defaultdict(lambda: {'trials': 0, 'successes': 0, 'structural': 0, 'errors': Counter()})
+    for article in articles:
+        features = article_features(article_identifiers(article))
+        entries = source_entries(article['apis_raw'])
+        for source in API_SOURCES:
+            entry = entries.get(source)
+            if entry is None or entry.get('status', '').startswith('skipped'):
+                continue
+            for feature in RULE_FEATURES:
+                counts = trials[(source, feature, features[feature])]
+                counts['trials'] += 1
+                if entry.get('success'):
+                    counts['successes'] += 1
+                elif is_structural_error(entry.get('error')):
+                    counts['structural'] += 1
+                    counts['errors'][entry['error']] += 1
+
+    rules = []
+    for (source, feature, value), counts in sorted(trials.items()):
+        support = min_source_support if feature == 'source' else min_support
+        if value == 'none' or counts['trials'] < support:
+            continue
+        if counts['successes'] == 0 and counts['structural'] == counts['trials']:
+            rules.append({
+                'source': source,
+                'feature': feature,
+                'value': value,
+                'trials': counts['trials'],
+                'error': counts['errors'].most_common(1)[0][0]
+            })
+    return rules
+
+class PreflightRules:
+    """
+    Identifier and learned skip rules applied before each API call
+    """
+
+    def __init__(self, rules: Optional[List[Dict]] = None, probe_rate: float = DEFAULT_PROBE_RATE):
+        self.probe_rate = probe_rate
+        self.rules = {}
+        for rule in rules or []:
+            self.rules[(rule['source'], rule['feature'], rule['value'])] = rule
+
+    @classmethod
+    def load(cls, path: str, probe_rate: float = DEFAULT_PROBE_RATE) -> 'PreflightRules':
+        """Rules from a preflight_rules.json file (identifier rules only if it is missing)"""
+        if not os.path.exists(path):
+            return cls([], probe_rate)
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f).get('rules', []), probe_rate)
+
+    def is_probe(self, source: str, identifiers: Dict) -> bool:
+        """Deterministic share of skippable calls that are made anyway"""
+        key = f"{source}:{identifiers.get('DOI') or identifiers.get('Title') or identifiers.get('folder')}"
+        bucket = int(hashlib.sha1(key.encode('utf-8')).hexdigest()[:8], 16) / 0xFFFFFFFF
+        return bucket < self.probe_rate
+
+    def check(self, source: str, identifiers: Dict) -> Optional[Tuple[str, str]]:
+        """(status, reason) when the call should be skipped, else None"""
+        accepted = REQUIRED_IDENTIFIERS.get(source, DEFAULT_IDENTIFIERS)
+        if not any(identifiers.get(kind) for kind in accepted):
+            return 'skipped_missing_identifier', f"Skipped: {source} needs {' or '.join(accepted)}"
+
+        features = article_features(identifiers)
+        for feature in RULE_FEATURES:
+            rule = self.rules.get((source, feature, features[feature]))
+            if rule is None:
+                continue
+            if self.is_probe(source, identifiers):
+                return None
+            scope = 'any article' if feature == 'source' else f"{feature.replace('_', ' ')} '{rule['value']}'"
+            return 'skipped_rule', (f"Skipped: {source} never succeeded for {scope} "
+                                    f"({rule['trials']} calls, '{rule['error']}')")
+        return None
+
+def evaluate_rules(articles: List[Dict], min_support: int = MIN_SUPPORT,
+                   min_source_support: int = MIN_SOURCE_SUPPORT) -> Dict:
+    """
+    Leave-one-article-out: rules learned on the other articles, applied to the held-out one
+    (no probes, so every wrong skip is counted)
+    """
+    per_source = {s: {'calls': 0, 'skipped': 0, 'wrong': 0, 'saved_ms': 0.0} for s in API_SOURCES}
+    by_status = Counter()
+    critical_before, critical_after = [], []
+    for i, article in enumerate(articles):
+        others = articles[:i] + articles[i + 1:]
+        rules = PreflightRules(learn_rules(others, min_support, min_source_support), probe_rate=0.0)
+        identifiers = article_identifiers(article)
+        entries = source_entries(article['apis_raw'])
+        kept_times, all_times = [], []
+        for source in API_SOURCES:
+            entry = entries.get(source)
+            if entry is None:
+                continue
+            elapsed = float(entry.get('processing_time_ms') or 0)
+            stats = per_source[source]
+            stats['calls'] += 1
+            all_times.append(elapsed)
+            skip = rules.check(source, identifiers)
+            if skip is None:
+                kept_times.append(elapsed)
+                continue
+            by_status[skip[0]] += 1
+            stats['skipped'] += 1
+            stats['saved_ms'] += elapsed
+            stats['wrong'] += int(bool(entry.get('success')))
+        if all_times:
+            critical_before.append(max(all_times))
+            critical_after.append(max(kept_times, default=0.0))
+
+    return {'per_source': per_source, 'by_status': dict(by_status),
+            'critical_before_ms': critical_before, 'critical_after_ms': critical_after}
+
+def generate_preflight_report(rules: List[Dict], evaluation: Dict, articles: int) -> str:
+    """
+    Generate the pre-flight rules report
+    """
+    per_source = evaluation['per_source']
+    calls = sum(s['calls'] for s in per_source.values())
+    skipped = sum(s['skipped'] for s in per_source.values())
+    wrong = sum(s['wrong'] for s in per_source.values())
+    saved = sum(s['saved_ms'] for s in per_source.values())
+    before, after = evaluation['critical_before_ms'], evaluation['critical_after_ms']
+
+    lines = ["Pre-flight Skip Rules (leave-one-article-out on the recorded fan-outs)", ""]
+    lines.append(f"{articles} articles, {calls} API calls. {skipped} calls skipped "
+                 f"({skipped / calls * 100 if calls else 0:.1f}%), {wrong} of them would have succeeded; "
+                 f"{saved / 1000:.1f}s of API time saved.")
+    lines.append(f"Skips by status: " + ", ".join(f"{k} {v}" for k, v in sorted(evaluation['by_status'].items())))
+    if before:
+        lines.append(f"Mean fan-out critical path {sum(before) / len(before) / 1000:.2f}s -> "
+                     f"{sum(after) / len(after) / 1000:.2f}s (slowest remaining source per article).")
+    lines.append("")
+    lines.append("| Source           | Calls | Skipped | Wrong skips | Time saved (s) |")
+    lines.append("|------------------|-------|---------|-------------|----------------|")
+    for source, stats in per_source.items():
+        lines.append(f"| {source:<16} | {stats['calls']:5d} | {stats['skipped']:7d} | {stats['wrong']:11d} | "
+                     f"{stats['saved_ms'] / 1000:14.1f} |")
+    lines.append("")
+    lines.append(f"Rules learned on all {articles} articles:")
+    for rule in rules:
+        lines.append(f"  {rule['source']:<16} {rule['feature']:<10} {rule['value'][:40]:<40} "
+                     f"{rule['trials']:3d} calls  '{rule['error']}'")
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to learn the skip rules and evaluate them
+    """
+    parser = argparse.ArgumentParser(description="Learn pre-flight skip rules from recorded API calls")
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--min-support', type=int, default=MIN_SUPPORT)
+    parser.add_argument('--min-source-support', type=int, default=MIN_SOURCE_SUPPORT)
+    parser.add_argument('--rules', default='plots/preflight_rules.json')
+    parser.add_argument('--report', default='plots/preflight_report.txt')
+    args = parser.parse_args()
+
+    print("🛂 INFINITY RESEARCH - Pre-flight Rules")
+    print("=" * 50)
+
+    articles = load_article_jsons(args.json_dir)
+    if not articles:
+        print("❌ No article data found!")
+        return
+    print(f"📁 Found {len(articles)} article folders")
+
+    rules = learn_rules(articles, args.min_support, args.min_source_support)
+    print(f"✅ Learned {len(rules)} skip rules")
+    evaluation = evaluate_rules(articles, args.min_support, args.min_source_support)
+    report = generate_preflight_report(rules, evaluation, len(articles))
+
+    with open(args.rules, 'w', encoding='utf-8') as f:
+        json.dump({'min_support': args.min_support, 'min_source_support': args.min_source_support,
+                   'required_identifiers': REQUIRED_IDENTIFIERS, 'rules': rules}, f, indent=2, ensure_ascii=False)
+    with open(args.report, 'w', encoding='utf-8') as f:
+        f.write(report)
+
+    print(f"\n{report}")
+    print(f"\n🎯 Pre-flight rules complete!")
+    print(f"   📁 Rules: {args.rules}")
+    print(f"   📊 Report: {args.report}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+🔎 EVALUATION QUERY TOOL - Infinity Research Paper
+==================================================
+
+Command-line drill-down over the flattened classifications
+(classification_table) and the parsed conflicts (conflicts_parser joined
+by accuracy_engine), instead of grepping conflicts.txt:
+
+    # All D classifications on Year, across evaluators
+    python scripts/query_evaluations.py classifications --category D --field Year
+    # Articles where only Claude flagged E
+    python scripts/query_evaluations.py classifications --category E --only claude
+    # Unresolved conflicts for Sample Size, as JSONL
+    python scripts/query_evaluations.py conflicts --field "Sample Size" --verdict unresolved --format jsonl
+
+Both data sets are grouped once into indexes (value -> sorted row ids) per
+filterable column; a query intersects the index entries of its filters,
+starting from the smallest, so it does not scan the data. Fields and
+evaluators match case-insensitively on a substring ("sample" -> "Sample
+Size (n), Population Characteristics"); a filter matching nothing is an
+error, not an empty result. Output is an aligned table or JSONL
+(--format jsonl), with DOI and title from the article manifest when
+plots/article_manifest.json exists.
+
+Input: analysis/analysis_<model>.json + analysis/conflicts.txt (+ plots/article_manifest.json)
+Output: query results on stdout
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+import numpy as np
+
+from accuracy_engine import COMPARISON_SCOPES, VERDICTS, AccuracyEngine, conflict_item
+from article_manifest import DEFAULT_MANIFEST, load_manifest
+from classification_table import CATEGORIES, discover_analysis_files, evaluator_name, load_classification_table
+from conflicts_parser import DEFAULT_CONFLICTS_FILE, parse_conflicts_report
+
+def build_index(columns: Dict[str, np.ndarray]) -> Dict[str, Dict[int, np.ndarray]]:
+    """{column: {value: sorted row ids}} (one argsort + split per column)"""
+    index = {}
+    for name, values in columns.items():
+        order = np.argsort(values, kind='stable')
+        keys, starts = np.unique(values[order], return_index=True)
+        index[name] = dict(zip(keys.tolist(), np.split(order, starts[1:])))
+    return index
+
+def lookup(index: Dict[str, Dict[int, np.ndarray]], n_rows: int, **criteria) -> np.ndarray:
+    """
+    Row ids matching every criterion (column=list of accepted codes); no criteria: all rows
+    """
+    selections = []
+    for column, codes in criteria.items():
+        if codes is None:
+            continue
+        groups = [index[column].get(code) for code in codes]
+        selections.append(np.sort(np.concatenate([g for g in groups if g is not None] or [np.zeros(0, dtype=int)])))
+    if not selections:
+        return np.arange(n_rows)
+    selections.sort(key=len)
+    rows = selections[0]
+    for selection in selections[1:]:
+        rows = np.intersect1d(rows, selection, assume_unique=True)
+    return rows
+
+def match_names(pattern: Optional[str], names: List[str], what: str, display=lambda name: name) -> Optional[List[int]]:
+    """
+    Codes of the names containing the pattern (case-insensitive); None when no pattern is given
+    Raises ValueError when no name matches.
+    """
+    if pattern is None:
+        return None
+    text = pattern.lower()
+    exact = [i for i, name in enumerate(names) if text in (name.lower(), display(name).lower())]
+    matches = exact or [i for i, name in enumerate(names) if text in name.lower() or text in display(name).lower()]
+    if not matches:
+        raise ValueError(f"no {what} matches '{pattern}' (known: {', '.join(names)})")
+    return matches
+
+def category_list(text: str) -> List[str]:
+    """argparse type: 'd,E' -> ['D', 'E'] (A-F only)"""
+    categories = [c.strip().upper() for c in text.split(',') if c.strip()]
+    unknown = [c for c in categories if c not in CATEGORIES]
+    if unknown or not categories:
+        raise argparse.ArgumentTypeError(f"categories must be among {', '.join(CATEGORIES)}, got '{text}'")
+    return categories
+
+class EvaluationIndex:
+    """
+    Classifications and conflicts with their lookup indexes, built once
+    """
+
+    def __init__(self, analysis_dir: str = 'analysis', conflicts_file: str = DEFAULT_CONFLICTS_FILE,
+                 manifest_file: str = DEFAULT_MANIFEST):
+        self.table = load_classification_table(discover_analysis_files(analysis_dir))
+        self.classification_index = build_index({
+            'evaluator': self.table['evaluator'],
+            'category': self.table['category'],
+            'item': self.table['item'],
+            'article': self.table['article']
+        })
+
+        # Conflicts compare two evaluators; with fewer only the classifications are queryable
+        n_evaluators = len(self.table['evaluators'])
+        self.conflicts_unavailable = None if n_evaluators >= 2 else \
+            f"conflicts need two evaluators, found {n_evaluators} analysis_*.json in {analysis_dir}"
+        if self.conflicts_unavailable is None:
+            self._index_conflicts(conflicts_file)
+
+        self.manifest = load_manifest(manifest_file)['articles'] if os.path.exists(manifest_file) else {}
+
+    def _index_conflicts(self, conflicts_file: str):
+        """Conflicts of the first two evaluators and their lookup index"""
+        # Every comparison the two evaluators disagree on, joined with the report's verdicts
+        # (conflicts without a record in the report are included as unresolved)
+        self.engine = AccuracyEngine(self.table, *self.table['evaluators'][:2])
+        self.records = parse_conflicts_report(conflicts_file)['records']
+        self.engine.add_resolutions(self.records)
+        record_at = {(r['article'], conflict_item(r)): r for r in self.records}
+        rows, columns = np.nonzero(self.engine.scopes > 0)
+        self.conflicts = []
+        for r, c in zip(rows, columns):
+            article, item = int(self.table['articles'][r]), self.table['items'][c]
+            record = record_at.get((article, item), {})
+            self.conflicts.append({
+                'article': article, 'item': item, 'scope': COMPARISON_SCOPES[self.engine.scopes[r, c]],
+                'categories': {e: CATEGORIES[code] for e, code in zip(self.table['evaluators'], self.table['codes'][r, c])
+                               if code >= 0},
+                'verdict': VERDICTS[self.engine.verdicts[r, c]],
+                'resolution': record.get('resolution'),
+                'explanation': record.get('explanation', {})
+            })
+        self.conflict_index = build_index({
+            'item': np.array([self.table['items'].index(c['item']) for c in self.conflicts], dtype=int),
+            'scope': np.array([COMPARISON_SCOPES.index(c['scope']) for c in self.conflicts], dtype=int),
+            'verdict': np.array([VERDICTS.index(c['verdict']) for c in self.conflicts], dtype=int),
+            'article': np.array([c['article'] for c in self.conflicts], dtype=int)
+        })
+        self.conflict_categories = [set(c['categories'].values()) for c in self.conflicts]
+
+    def _articles(self, article: Optional[int]) -> Optional[List[int]]:
+        """Article filter for lookup (ValueError for article numbers without evaluations)"""
+        if article is None:
+            return None
+        if article not in self.classification_index['article']:
+            raise ValueError(f"no evaluations for article {article}")
+        return [article]
+
+    def _article_info(self, article: int) -> Dict:
+        entry = self.manifest.get(article)
+        return {'doi': entry['doi'], 'title': entry['title']} if entry else {}
+
+    def classifications(self, category: Optional[List[str]] = None, field: Optional[str] = None,
+                        evaluator: Optional[str] = None, article: Optional[int] = None,
+                        only: Optional[str] = None) -> List[Dict]:
+        """
+        Classification rows matching the filters
+        only: the category was given by this evaluator and by none of the others on the same item.
+        """
+        table = self.table
+        categories = [CATEGORIES.index(c) for c in category] if category else None
+        evaluators = match_names(only or evaluator, table['evaluators'], 'evaluator', evaluator_name)
+        rows = lookup(self.classification_index, len(table['category']), category=categories,
+                      item=match_names(field, table['items'], 'field'), evaluator=evaluators,
+                      article=self._articles(article))
+        if only and len(rows):
+            # Keep rows whose category no other evaluator gave on the same (article, item)
+            article_rows = np.searchsorted(table['articles'], table['article'][rows])
+            codes = table['codes'][article_rows, table['item'][rows]]
+            same = codes == table['category'][rows][:, None]
+            same[np.arange(len(rows)), table['evaluator'][rows]] = False
+            rows = rows[~same.any(axis=1)]
+        return [dict({'article': int(table['article'][r]), 'field': table['items'][table['item'][r]],
+                      'evaluator': table['evaluators'][table['evaluator'][r]],
+                      'category': CATEGORIES[table['category'][r]]}, **self._article_info(int(table['article'][r])))
+                for r in rows]
+
+    def conflict_rows(self, category: Optional[List[str]] = None, field: Optional[str] = None,
+                      scope: Optional[str] = None, verdict: Optional[str] = None,
+                      article: Optional[int] = None) -> List[Dict]:
+        """Conflicts matching the filters (category: any evaluator gave one of the categories)"""
+        if self.conflicts_unavailable:
+            raise ValueError(self.conflicts_unavailable)
+        rows = lookup(self.conflict_index, len(self.conflicts), item=match_names(field, self.table['items'], 'field'),
+                      scope=match_names(scope, COMPARISON_SCOPES, 'scope'),
+                      verdict=match_names(verdict, VERDICTS, 'verdict'),
+                      article=self._articles(article))
+        if category:
+            wanted = set(category)
+            rows = [r for r in rows if self.conflict_categories[r] & wanted]
+        return [dict(self.conflicts[r], **self._article_info(self.conflicts[r]['article'])) for r in rows]
+
+def format_table(rows: List[Dict], columns: List[str]) -> str:
+    """Aligned text table of the given columns (dict values shown as key=value)"""
+    def text(value) -> str:
+        if isinstance(value, dict):
+            return ", ".join(f"{k}={v}" for k, v in value.items())
+        return '' if value is None else " ".join(str(value).split())
+
+    cells = [[text(row.get(column)) for column in columns] for row in rows]
+    widths = [min(60, max(len(column), *(len(c[i]) for c in cells))) if cells else len(column)
+              for i, column in enumerate(columns)]
+    lines = ["| " + " | ".join(f"{c:<{w}}" for c, w in zip(columns, widths)) + " |"]
+    lines.append("|" + "|".join('-' * (w + 2) for w in widths) + "|")
+    for row in cells:
+        lines.append("| " + " | ".join(f"{c[:w]:<{w}}" for c, w in zip(row, widths)) + " |")
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to query the evaluation data
+    """
+    parser = argparse.ArgumentParser(description="Query classifications and conflicts from prebuilt indexes")
+    parser.add_argument('--analysis-dir', default='analysis')
+    parser.add_argument('--conflicts', default=DEFAULT_CONFLICTS_FILE)
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST)
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument('--format', choices=['table', 'jsonl'], default='table')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    classifications = subparsers.add_parser('classifications', parents=[output],
+                                            help="Classification rows (article x field x evaluator)")
+    classifications.add_argument('--category', type=category_list, help="A-F, comma-separated for several")
+    classifications.add_argument('--field', help="Scientific field (substring, e.g. 'Year', 'sample')")
+    classifications.add_argument('--evaluator', help="Evaluator (e.g. claude)")
+    classifications.add_argument('--only', help="Category given by this evaluator and no other")
+    classifications.add_argument('--article', type=int)
+
+    conflicts = subparsers.add_parser('conflicts', parents=[output],
+                                      help="Conflicts with scope, categories and resolution")
+    conflicts.add_argument('--category', type=category_list,
+                           help="A-F given by any evaluator, comma-separated for several")
+    conflicts.add_argument('--field', help="Scientific field (substring)")
+    conflicts.add_argument('--scope', help="claude_only, deepseek_only or both_models")
+    conflicts.add_argument('--verdict', help="infinity, manual, both or unresolved")
+    conflicts.add_argument('--article', type=int)
+    args = parser.parse_args()
+
+    index = EvaluationIndex(args.analysis_dir, args.conflicts, args.manifest)
+    try:
+        if args.command == 'classifications':
+            rows = index.classifications(args.category, args.field, args.evaluator, args.article, args.only)
+            columns = ['article', 'field', 'evaluator', 'category', 'doi']
+        else:
+            rows = index.conflict_rows(args.category, args.field, args.scope, args.verdict, args.article)
+            columns = ['article', 'item', 'scope', 'categories', 'verdict', 'resolution']
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.format == 'jsonl':
+        for row in rows:
+            sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+    else:
+        print(format_table(rows, columns))
+        print(f"\n{len(rows)} rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+🎬 API REPLAY SERVER - Infinity Research Paper
+==============================================
+
+Local HTTP/1.1 stand-in for the 11 bibliographic API sources. Serves the
+recorded `apis_raw_json.json` payloads per source and per article, with
+latency and errors taken from the recorded `processing_time_ms`, `success`
+and `error` values, so fetchers and fan-out strategies can be load-tested
+reproducibly without network access.
+
+Routes:
+    GET /<source>/<Article_XX>           recorded entry of that article
+    GET /<source>?doi=...|pmid=...|title=...  same, looked up by identifier
+    GET /_stats                          per-source request counters
+
+Responses are JSON `{"success", "data" | "error"}`: 200 for recorded
+successes, 404 for "not found" failures, 502 for other failures and 429
+(with Retry-After) when a per-source rate limit is exceeded. Connections
+are kept alive; one asyncio task per connection handles thousands of
+concurrent clients.
+
+Latency modes:
+    recorded  each article/source pair answers after its own recorded time
+    sampled   latency drawn from the source's recorded distribution (successes
+              and failures separately)
+    --sample-errors (either mode) also fails recorded successes at the
+              source's recorded failure rate, with a recorded error message
+
+Example:
+    python scripts/replay_server.py --port 8765 --mode sampled --time-scale 0.1 \\
+        --rate-limit semantic_scholar=100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from article_metrics import API_SOURCES, load_article_jsons, source_entries
+from field_normalizer import fold_text
+from simulate_pipeline import parse_source_overrides
+
+# Recorded error messages answered with 404 (the source had no record)
+NOT_FOUND_ERRORS = re.compile(r'no (results|doi|record|match)|not found', re.IGNORECASE)
+
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 429: 'Too Many Requests',
+                502: 'Bad Gateway'}
+
+class ReplayStore:
+    """
+    Recorded payloads indexed by (source, article) plus identifier lookups
+    and per-source latency/error distributions
+    """
+
+    def __init__(self, json_dir: str = "json"):
+        self.entries: Dict[Tuple[str, str], Dict] = {}
+        self.index: Dict[Tuple[str, str], str] = {}
+        self.latencies = {s: {True: [], False: []} for s in API_SOURCES}
+        self.errors = {s: [] for s in API_SOURCES}
+
+        for article in load_article_jsons(json_dir):
+            folder = article['folder']
+            entries = source_entries(article['apis_raw'])
+            for source in API_SOURCES:
+                entry = entries.get(source)
+                if entry is None:
+                    continue
+                self.entries[(source, folder)] = entry
+                success = bool(entry.get('success'))
+                if entry.get('processing_time_ms') is not None:
+                    self.latencies[source][success].append(float(entry['processing_time_ms']) / 1000.0)
+                if not success and entry.get('error'):
+                    self.errors[source].append(entry['error'])
+
+            # Identifier lookups: the Vision extraction is what a fetcher would query with
+            extracted = (article['vision'] or {}).get('extracted_data') or {}
+            for key in ('DOI', 'PMID', 'Title'):
+                value = extracted.get(key)
+                if value:
+                    self.index[(key.lower(), self.normalize(key.lower(), value))] = folder
+            self.index[('article', folder.lower())] = folder
+            self.index[('article', str(article['article_num']))] = folder
+
+    @staticmethod
+    def normalize(key: str, value) -> str:
+        value = unquote(str(value)).strip()
+        if key == 'doi':
+            return re.sub(r'^(https?://(dx\.)?doi\.org/|doi:)', '', value, flags=re.IGNORECASE).lower()
+        if key == 'title':
+            return fold_text(value)
+        return value.lower()
+
+    def resolve(self, key: str, value: str) -> Optional[str]:
+        return self.index.get((key, self.normalize(key, value)))
+
+    def failure_rate(self, source: str) -> float:
+        ok, failed = len(self.latencies[source][True]), len(self.latencies[source][False])
+        return failed / (ok + failed) if ok + failed else 0.0
+
+class TokenBucket:
+    """Requests/minute limiter with a burst allowance (loop time based)"""
+
+    def __init__(self, per_minute: float, burst: float):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, burst)
+        self.tokens = self.capacity
+        self.updated = None
+
+    def try_acquire(self, now: float) -> Tuple[bool, float]:
+        """Take one token; returns (allowed, seconds until the next token)"""
+        if self.updated is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True, 0.0
+        return False, (1.0 - self.tokens) / self.rate
+
+class ReplayServer:
+    """
+    asyncio HTTP/1.1 server answering from a ReplayStore
+    """
+
+    def __init__(self, store: ReplayStore, mode: str = 'recorded', sample_errors: bool = False,
+                 time_scale: float = 1.0, rate_limits: Optional[Dict[str, float]] = None,
+                 burst: float = 5.0, seed: int = 42):
+        self.store = store
+        self.mode = mode
+        self.sample_errors = sample_errors
+        self.time_scale = time_scale
+        self.seed = seed
+        self.buckets = {s: TokenBucket(r, burst) for s, r in (rate_limits or {}).items()}
+        self.request_counts = defaultdict(int)
+        self.stats = {s: defaultdict(int) for s in API_SOURCES}
+        self.open_connections = 0
+        self.peak_connections = 0
+
+    def draw_response(self, source: str, folder: str) -> Tuple[int, Dict, float]:
+        """
+        Status, body and delay (seconds) for one request
+
+        The RNG is seeded per (source, article, n-th request) so results do not
+        depend on how concurrent requests interleave.
+        """
+        entry = self.store.entries.get((source, folder))
+        n = self.request_counts[(source, folder)]
+        self.request_counts[(source, folder)] += 1
+        rng = random.Random(f"{self.seed}:{source}:{folder}:{n}")
+
+        success = bool(entry.get('success'))
+        error = entry.get('error')
+        if self.sample_errors and success and rng.random() < self.store.failure_rate(source):
+            success = False
+            error = rng.choice(self.store.errors[source]) if self.store.errors[source] else 'Sampled failure'
+
+        if self.mode == 'sampled' and self.store.latencies[source][success]:
+            delay = rng.choice(self.store.latencies[source][success])
+        else:
+            delay = float(entry.get('processing_time_ms') or 0) / 1000.0
+
+        if success:
+            return 200, {'success': True, 'data': entry.get('data')}, delay * self.time_scale
+        status = 404 if NOT_FOUND_ERRORS.search(str(error or '')) else 502
+        return status, {'success': False, 'error': error or 'Unknown error'}, delay * self.time_scale
+
+    async def handle_request(self, method: str, target: str) -> Tuple[int, Dict, Dict]:
+        """Route one request; returns (status, body, extra headers)"""
+        url = urlsplit(target)
+        parts = [unquote(p) for p in url.path.strip('/').split('/') if p]
+
+        if parts == ['_stats']:
+            return 200, {'sources': {s: dict(c) for s, c in self.stats.items()},
+                         'peak_connections': self.peak_connections}, {}
+        if method != 'GET' or not parts or parts[0] not in API_SOURCES:
+            return 400, {'success': False, 'error': f"Unknown route {target}"}, {}
+
+        source = parts[0]
+        stats = self.stats[source]
+        stats['requests'] += 1
+
+        bucket = self.buckets.get(source)
+        if bucket is not None:
+            allowed, retry_after = bucket.try_acquire(asyncio.get_running_loop().time())
+            if not allowed:
+                stats['rate_limited'] += 1
+                return 429, {'success': False, 'error': 'Rate limit exceeded'}, \
+                    {'Retry-After': f"{max(1, round(retry_after))}"}
+
+        folder = None
+        if len(parts) > 1:
+            folder = self.store.resolve('article', parts[1])
+        else:
+            query = parse_qs(url.query)
+            for key in ('doi', 'pmid', 'title'):
+                if key in query:
+                    folder = self.store.resolve(key, query[key][0])
+                    break
+
+        if folder is None or (source, folder) not in self.store.entries:
+            stats['not_found'] += 1
+            delay = random.Random(f"{self.seed}:{source}:{target}").choice(
+                self.store.latencies[source][False] or [0.0])
+            await asyncio.sleep(delay * self.time_scale)
+            return 404, {'success': False, 'error': 'No results found'}, {}
+
+        status, body, delay = self.draw_response(source, folder)
+        await asyncio.sleep(delay)
+        stats['ok' if status == 200 else 'failed'] += 1
+        return status, body, {}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve keep-alive HTTP/1.1 requests on one connection"""
+        self.open_connections += 1
+        self.peak_connections = max(self.peak_connections, self.open_connections)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                if headers.get('content-length'):
+                    await reader.readexactly(int(headers['content-length']))
+
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and (version == 'HTTP/1.1' or headers.get('connection', '').lower() == 'keep-alive'))
+
+                status, body, extra = await self.handle_request(method, target)
+                payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                head = [f"HTTP/1.1 {status} {HTTP_REASONS.get(status, 'Error')}",
+                        "Content-Type: application/json",
+                        f"Content-Length: {len(payload)}",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                head += [f"{name}: {value}" for name, value in extra.items()]
+                writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.open_connections -= 1
+            writer.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765, backlog: int = 4096) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_connection, host, port, backlog=backlog)
+
+def raise_open_file_limit():
+    """Lift the soft file-descriptor limit to the hard limit (one fd per connection)"""
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if hard == resource.RLIM_INFINITY or hard > soft:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard if hard != resource.RLIM_INFINITY else 65536, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+def format_stats(server: ReplayServer) -> List[str]:
+    lines = []
+    for source in API_SOURCES:
+        stats = server.stats[source]
+        if stats['requests']:
+            lines.append(f"   {source:<17} {stats['requests']:6d} requests: {stats['ok']} ok, {stats['failed']} failed, "
+                         f"{stats['not_found']} not found, {stats['rate_limited']} rate limited")
+    lines.append(f"   Peak concurrent connections: {server.peak_connections}")
+    return lines
+
+async def serve(args, store: ReplayStore):
+    server = ReplayServer(
+        store,
+        mode=args.mode,
+        sample_errors=args.sample_errors,
+        time_scale=args.time_scale,
+        rate_limits=parse_source_overrides(args.rate_limit, float),
+        burst=args.burst,
+        seed=args.seed
+    )
+    listener = await server.start(args.host, args.port, args.backlog)
+    print(f"   ✅ Listening on http://{args.host}:{args.port}/<source>/<Article_XX>")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        print(f"\n📈 REPLAY STATISTICS:")
+        print("=" * 50)
+        for line in format_stats(server):
+            print(line)
+
+def main():
+    """
+    Main function to run the replay server
+    """
+    parser = argparse.ArgumentParser(description="Replay recorded apis_raw_json payloads over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--mode', choices=['recorded', 'sampled'], default='recorded')
+    parser.add_argument('--sample-errors', action='store_true',
+                        help="fail recorded successes at each source's recorded failure rate")
+    parser.add_argument('--time-scale', type=float, default=1.0, help="latency multiplier (0.1 = 10x faster)")
+    parser.add_argument('--rate-limit', action='append', metavar='SOURCE=N',
+                        help="requests/minute for a source, answered with 429 beyond it (repeatable)")
+    parser.add_argument('--burst', type=float, default=5.0, help="requests allowed in a burst per limited source")
+    parser.add_argument('--backlog', type=int, default=4096)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json-dir', default='json')
+    args = parser.parse_args()
+
+    print("🎬 INFINITY RESEARCH - API Replay Server")
+    print("=" * 50)
+
+    if not os.path.exists(args.json_dir):
+        print(f"❌ Error: {args.json_dir} folder not found!")
+        return
+
+    store = ReplayStore(args.json_dir)
+    print(f"📁 Loaded {len(store.entries)} recorded source responses")
+    for source in API_SOURCES:
+        ok, failed = len(store.latencies[source][True]), len(store.latencies[source][False])
+        print(f"   {source:<17} {ok:3d} ok / {failed:3d} failed ({store.failure_rate(source) * 100:.0f}% failures)")
+
+    raise_open_file_limit()
+    try:
+        asyncio.run(serve(args, store))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+🗄️ API RESPONSE CACHE - Infinity Research Paper
+===============================================
+
+On-disk (sqlite) cache of successful bibliographic API responses, keyed by
+source + normalized identifier:
+
+- `doi:10.1016/j.xyz` (lowercase, resolver prefix stripped)
+- `pmid:35123456` (digits only)
+- `title:folded lowercase ascii title`
+
+A response is stored under every identifier of its article, so a later
+lookup by DOI, PMID or title hits the same entry. Entries expire after a TTL;
+when the cache exceeds its size budget the least recently used entries are
+evicted. Failed calls are not cached as responses; structural failures
+("No results found", see preflight_rules.py) go to a separate negative cache
+with a shorter TTL, so doomed calls are skipped on re-runs.
+
+Used by the fan-out client, which records per-article hit/miss counters in
+`apis_raw_json.json` under the `_cache` key (keys starting with `_` are run
+metadata, not sources).
+
+Input: apis_raw_json.json files (to warm the cache) or live fan-out results
+Output: cache/api_responses.sqlite
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+from article_metrics import API_SOURCES, load_article_jsons, source_entries
+from field_normalizer import fold_text
+from source_extractors import strip_doi
+
+DEFAULT_CACHE_PATH = 'cache/api_responses.sqlite'
+DEFAULT_TTL_DAYS = 30
+DEFAULT_MAX_MB = 512
+DEFAULT_NEGATIVE_TTL_DAYS = 7
+
+# Identifier kinds in lookup order (most specific first)
+IDENTIFIER_KINDS = ['DOI', 'PMID', 'Title']
+
+def normalize_identifier(kind: str, value) -> Optional[str]:
+    """Cache key for one identifier ('doi:...', 'pmid:...', 'title:...'), None if unusable"""
+    if value is None:
+        return None
+    if kind == 'DOI':
+        doi = strip_doi(str(value))
+        return f"doi:{doi.lower()}" if doi else None
+    if kind == 'PMID':
+        digits = re.sub(r'\D', '', str(value))
+        return f"pmid:{digits}" if digits else None
+    if kind == 'Title':
+        title = fold_text(value)
+        return f"title:{title}" if len(title) >= 10 else None
+    return None
+
+def identifier_keys(identifiers: Dict) -> List[str]:
+    """All cache keys of an article, in lookup order"""
+    keys = [normalize_identifier(kind, identifiers.get(kind)) for kind in IDENTIFIER_KINDS]
+    return [key for key in keys if key]
+
+class ResponseCache:
+    """
+    sqlite response cache with TTL expiry and LRU size eviction
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: float = DEFAULT_TTL_DAYS * 86400,
+                 max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+                 negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_DAYS * 86400):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                source TEXT NOT NULL,
+                key TEXT NOT NULL,
+                data TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (source, key)
+            )""")
+        self.db.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS negative_results (
+                source TEXT NOT NULL,
+                key TEXT NOT NULL,
+                error TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                PRIMARY KEY (source, key)
+            )""")
+        self.total_bytes = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.stats = {s: {'hits': 0, 'misses': 0, 'expired': 0, 'stored': 0} for s in API_SOURCES}
+        self.evicted = 0
+
+    def get(self, source: str, identifiers: Dict) -> Optional[Dict]:
+        """
+        Cached 'data' payload for a source and article, or None
+        Expired entries are removed on lookup.
+        """
+        now = time.time()
+        stats = self.stats.setdefault(source, {'hits': 0, 'misses': 0, 'expired': 0, 'stored': 0})
+        for key in identifier_keys(identifiers):
+            row = self.db.execute("SELECT data, size, stored_at FROM responses WHERE source = ? AND key = ?",
+                                  (source, key)).fetchone()
+            if row is None:
+                continue
+            data, size, stored_at = row
+            if now - stored_at > self.ttl_seconds:
+                self.db.execute("DELETE FROM responses WHERE source = ? AND key = ?", (source, key))
+                self.total_bytes -= size
+                stats['expired'] += 1
+                continue
+            self.db.execute("UPDATE responses SET last_access = ? WHERE source = ? AND key = ?",
+                            (now, source, key))
+            stats['hits'] += 1
+            return json.loads(data)
+        stats['misses'] += 1
+        return None
+
+    def put(self, source: str, identifiers: Dict, data, stored_at: Optional[float] = None):
+        """Store a successful payload under every identifier of the article"""
+        keys = identifier_keys(identifiers)
+        if not keys:
+            return
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        size = len(payload.encode('utf-8'))
+        now = time.time()
+        stored_at = now if stored_at is None else stored_at
+        for key in keys:
+            previous = self.db.execute("SELECT size FROM responses WHERE source = ? AND key = ?",
+                                       (source, key)).fetchone()
+            self.db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                            (source, key, payload, size, stored_at, now))
+            self.total_bytes += size - (previous[0] if previous else 0)
+        self.stats.setdefault(source, {'hits': 0, 'misses': 0, 'expired': 0, 'stored': 0})['stored'] += 1
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    def get_negative(self, source: str, identifiers: Dict) -> Optional[Tuple[str, float]]:
+        """(error, stored_at) of a recent structural failure for a source and article, or None"""
+        cutoff = time.time() - self.negative_ttl_seconds
+        for key in identifier_keys(identifiers):
+            row = self.db.execute("SELECT error, stored_at FROM negative_results WHERE source = ? AND key = ?",
+                                  (source, key)).fetchone()
+            if row is not None and row[1] >= cutoff:
+                return row[0], row[1]
+        return None
+
+    def put_negative(self, source: str, identifiers: Dict, error: str):
+        """Remember a structural failure under every identifier of the article"""
+        now = time.time()
+        self.db.executemany("INSERT OR REPLACE INTO negative_results VALUES (?, ?, ?, ?)",
+                            [(source, key, error, now) for key in identifier_keys(identifiers)])
+
+    def evict(self):
+        """Drop least recently used entries until the cache is back under 90% of its budget"""
+        target = self.max_bytes * 0.9
+        rows = self.db.execute("SELECT source, key, size FROM responses ORDER BY last_access").fetchall()
+        doomed = []
+        for source, key, size in rows:
+            if self.total_bytes <= target:
+                break
+            doomed.append((source, key))
+            self.total_bytes -= size
+        self.db.executemany("DELETE FROM responses WHERE source = ? AND key = ?", doomed)
+        self.evicted += len(doomed)
+
+    def purge_expired(self) -> int:
+        cutoff = time.time() - self.ttl_seconds
+        removed = self.db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses WHERE stored_at < ?",
+                                  (cutoff,)).fetchone()
+        self.db.execute("DELETE FROM responses WHERE stored_at < ?", (cutoff,))
+        self.total_bytes -= removed[1]
+        negatives = self.db.execute("DELETE FROM negative_results WHERE stored_at < ?",
+                                    (time.time() - self.negative_ttl_seconds,)).rowcount
+        return removed[0] + negatives
+
+    def entry_counts(self) -> Dict[str, int]:
+        return dict(self.db.execute("SELECT source, COUNT(*) FROM responses GROUP BY source").fetchall())
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+def warm_cache(cache: ResponseCache, json_dir: str = "json") -> int:
+    """Seed the cache with the successful responses recorded in apis_raw_json.json"""
+    stored = 0
+    for article in load_article_jsons(json_dir):
+        extracted = (article['vision'] or {}).get('extracted_data') or {}
+        identifiers = {kind: extracted.get(kind) for kind in IDENTIFIER_KINDS}
+        entries = source_entries(article['apis_raw'])
+        for source in API_SOURCES:
+            entry = entries.get(source)
+            if entry is not None and entry.get('success'):
+                cache.put(source, identifiers, entry.get('data'))
+                stored += 1
+    return stored
+
+def format_cache_stats(cache: ResponseCache) -> str:
+    counts = cache.entry_counts()
+    lines = [f"Cache {cache.path}: {sum(counts.values())} entries, {cache.total_bytes / 1024 / 1024:.1f} MB "
+             f"of {cache.max_bytes / 1024 / 1024:.1f} MB, TTL {cache.ttl_seconds / 86400:.0f} days"]
+    negatives = dict(cache.db.execute("SELECT source, COUNT(*) FROM negative_results GROUP BY source").fetchall())
+    for source in API_SOURCES:
+        lines.append(f"   {source:<16} {counts.get(source, 0):6d} keys, {negatives.get(source, 0):5d} negative")
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to inspect, warm or purge the response cache
+    """
+    parser = argparse.ArgumentParser(description="On-disk cache of bibliographic API responses")
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH)
+    parser.add_argument('--ttl-days', type=float, default=DEFAULT_TTL_DAYS)
+    parser.add_argument('--max-mb', type=float, default=DEFAULT_MAX_MB)
+    parser.add_argument('--negative-ttl-days', type=float, default=DEFAULT_NEGATIVE_TTL_DAYS)
+    parser.add_argument('--warm', action='store_true', help="seed from the recorded apis_raw_json files")
+    parser.add_argument('--purge-expired', action='store_true')
+    parser.add_argument('--json-dir', default='json')
+    args = parser.parse_args()
+
+    print("🗄️ INFINITY RESEARCH - API Response Cache")
+    print("=" * 50)
+
+    cache = ResponseCache(args.cache, args.ttl_days * 86400, int(args.max_mb * 1024 * 1024),
+                          args.negative_ttl_days * 86400)
+    if args.warm:
+        print(f"✅ Stored {warm_cache(cache, args.json_dir)} recorded responses")
+    if args.purge_expired:
+        print(f"✅ Removed {cache.purge_expired()} expired entries")
+    if cache.total_bytes > cache.max_bytes:
+        cache.evict()
+        print(f"✅ Evicted {cache.evicted} least recently used entries")
+    print(format_cache_stats(cache))
+    cache.close()
+
+    print(f"\n🎯 Cache maintenance complete!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+⏱️ PIPELINE CAPACITY SIMULATOR - Infinity Research Paper
+========================================================
+
+Discrete-event simulation of the extraction pipeline
+(Vision → 11-API fan-out → Consensus → Topics) for capacity planning.
+
+Service times are drawn from the recorded per-phase and per-API latencies
+(empirical distributions), so a large batch can be sized without spending
+real API budget. Worker counts, per-source concurrency and rate limits,
+and inter-stage queue sizes are configurable.
+
+Input: JSON files from infinity-research-paper/json/Article_XX/
+Output: simulation_report.txt with throughput, queueing delay and utilisation
+
+Example:
+    python scripts/simulate_pipeline.py --articles 50000 --vision-workers 16 \\
+        --consensus-workers 32 --topics-workers 16 --rate-limit semantic_scholar=100
+"""
+
+import argparse
+import heapq
+import os
+from collections import deque
+from typing import Dict, List, Optional
+import numpy as np
+
+from article_metrics import API_SOURCES, load_metrics_table
+
+class Stage:
+    """
+    Worker-pool stage with a bounded input queue
+
+    An upstream worker that finishes while this queue is full stays blocked
+    (holding its article) until a slot frees up.
+    """
+
+    def __init__(self, name: str, workers: int, queue_size: Optional[int], n_articles: int):
+        self.name = name
+        self.workers = workers
+        self.free = workers
+        self.queue_size = queue_size
+        self.queue = deque()      # (article_id, enqueue_time)
+        self.blocked = deque()    # (upstream_stage, article_id, blocked_since)
+        self.waits = np.zeros(n_articles)
+        self.busy_time = 0.0
+        self.blocked_time = 0.0
+        self.served = 0
+
+    def has_room(self) -> bool:
+        return self.queue_size is None or len(self.queue) < self.queue_size
+
+class SourcePool:
+    """Per-API request pool: concurrency cap plus minimum spacing between request starts"""
+
+    def __init__(self, name: str, concurrency: int, rate_per_min: Optional[float], n_articles: int):
+        self.name = name
+        self.concurrency = concurrency
+        self.free = concurrency
+        self.min_interval = 60.0 / rate_per_min if rate_per_min else 0.0
+        self.next_allowed = 0.0
+        self.wakeup_pending = False
+        self.queue = deque()      # (article_id, enqueue_time)
+        self.waits = np.zeros(n_articles)
+        self.busy_time = 0.0
+        self.served = 0
+
+class PipelineSimulator:
+    """
+    Event-driven simulator: Vision → Fan-out (11 source pools) → Consensus → Topics
+    All articles of the batch are available at t=0 in the Vision backlog.
+    """
+
+    def __init__(self, samples: Dict[str, np.ndarray], config: Dict, rng: np.random.Generator):
+        n = config['articles']
+        self.n = n
+        self.config = config
+        self.events = []
+        self.seq = 0
+        self.now = 0.0
+        self.completed = 0
+        self.finish_times = np.zeros(n)
+
+        # Pre-draw every service time from the empirical distributions (seconds)
+        self.service = {
+            'vision': rng.choice(samples['vision'], size=n),
+            'consensus': rng.choice(samples['consensus'], size=n),
+            'topics': rng.choice(samples['topics'], size=n)
+        }
+        self.source_service = {
+            source: rng.choice(samples['sources'][source], size=n)
+            for source in config['sources']
+        }
+
+        queue_size = config['queue_size']
+        self.vision = Stage('Vision', config['vision_workers'], None, n)
+        self.fanout = Stage('API fan-out', config['fanout_inflight'] or n, queue_size, n)
+        self.consensus = Stage('Consensus', config['consensus_workers'], queue_size, n)
+        self.topics = Stage('Topics', config['topics_workers'], queue_size, n)
+        self.stages = [self.vision, self.fanout, self.consensus, self.topics]
+        self.next_stage = {
+            'Vision': self.fanout,
+            'API fan-out': self.consensus,
+            'Consensus': self.topics,
+            'Topics': None
+        }
+
+        self.pools = {
+            source: SourcePool(source, config['concurrency'].get(source, config['source_concurrency']),
+                               config['rate_limits'].get(source), n)
+            for source in config['sources']
+        }
+        self.fanout_pending = np.zeros(n, dtype=np.int32)
+        self.fanout_start = np.zeros(n)
+
+    def schedule(self, time: float, kind: str, *payload):
+        heapq.heappush(self.events, (time, self.seq, kind, payload))
+        self.seq += 1
+
+    def run(self) -> Dict:
+        for article_id in range(self.n):
+            self.vision.queue.append((article_id, 0.0))
+        self.dispatch(self.vision)
+
+        while self.events:
+            time, _, kind, payload = heapq.heappop(self.events)
+            self.now = time
+            if kind == 'stage_done':
+                stage, article_id, started = payload
+                stage.busy_time += time - started
+                stage.served += 1
+                self.hand_over(stage, article_id)
+            elif kind == 'request_done':
+                pool, article_id, started = payload
+                pool.busy_time += time - started
+                pool.served += 1
+                pool.free += 1
+                self.fanout_pending[article_id] -= 1
+                if self.fanout_pending[article_id] == 0:
+                    self.fanout.busy_time += time - self.fanout_start[article_id]
+                    self.fanout.served += 1
+                    self.hand_over(self.fanout, article_id)
+                self.dispatch_pool(pool)
+            elif kind == 'pool_wakeup':
+                pool = payload[0]
+                pool.wakeup_pending = False
+                self.dispatch_pool(pool)
+
+        if self.completed != self.n:
+            raise RuntimeError(f"Simulation stalled with {self.n - self.completed} of {self.n} articles unfinished "
+                               f"(no events left; check queue sizes and worker counts)")
+        return self.summarize()
+
+    def hand_over(self, stage: Stage, article_id: int):
+        """Pass a finished article downstream, blocking the worker if the next queue is full"""
+        downstream = self.next_stage[stage.name]
+        if downstream is None:
+            self.finish_times[article_id] = self.now
+            self.completed += 1
+            stage.free += 1
+            self.dispatch(stage)
+            return
+
+        if downstream.has_room():
+            downstream.queue.append((article_id, self.now))
+            stage.free += 1
+            self.dispatch(downstream)
+            self.dispatch(stage)
+        else:
+            downstream.blocked.append((stage, article_id, self.now))
+
+    def dispatch(self, stage: Stage):
+        """Start as many queued articles as there are free workers"""
+        while stage.free > 0 and stage.queue:
+            article_id, enqueued = stage.queue.popleft()
+            stage.waits[article_id] = self.now - enqueued
+            stage.free -= 1
+
+            if stage is self.fanout:
+                self.fanout_start[article_id] = self.now
+                self.fanout_pending[article_id] = len(self.pools)
+                for pool in self.pools.values():
+                    pool.queue.append((article_id, self.now))
+                    self.dispatch_pool(pool)
+            else:
+                key = stage.name.lower()
+                self.schedule(self.now + self.service[key][article_id], 'stage_done',
+                              stage, article_id, self.now)
+
+            # A queue slot opened: admit one blocked upstream article
+            if stage.blocked:
+                upstream, blocked_id, since = stage.blocked.popleft()
+                upstream.blocked_time += self.now - since
+                stage.queue.append((blocked_id, self.now))
+                upstream.free += 1
+                self.dispatch(upstream)
+
+    def dispatch_pool(self, pool: SourcePool):
+        """Start queued requests of one source, honouring concurrency and rate limit"""
+        while pool.free > 0 and pool.queue:
+            if pool.min_interval and self.now < pool.next_allowed:
+                if not pool.wakeup_pending:
+                    pool.wakeup_pending = True
+                    self.schedule(pool.next_allowed, 'pool_wakeup', pool)
+                return
+            article_id, enqueued = pool.queue.popleft()
+            pool.waits[article_id] = self.now - enqueued
+            pool.free -= 1
+            pool.next_allowed = self.now + pool.min_interval
+            self.schedule(self.now + self.source_service[pool.name][article_id], 'request_done',
+                          pool, article_id, self.now)
+
+    def summarize(self) -> Dict:
+        makespan = float(self.finish_times.max()) if self.n else 0.0
+        stage_stats = []
+        for stage in self.stages:
+            capacity = stage.workers * makespan
+            stage_stats.append({
+                'name': stage.name,
+                'workers': stage.workers,
+                'mean_wait': float(stage.waits.mean()) if self.n else 0.0,
+                'p95_wait': float(np.percentile(stage.waits, 95)) if self.n else 0.0,
+                'utilisation': stage.busy_time / capacity if capacity > 0 else 0.0,
+                'blocked_time': stage.blocked_time
+            })
+
+        pool_stats = []
+        for pool in self.pools.values():
+            capacity = pool.concurrency * makespan
+            pool_stats.append({
+                'name': pool.name,
+                'concurrency': pool.concurrency,
+                'rate_per_min': 60.0 / pool.min_interval if pool.min_interval else None,
+                'mean_wait': float(pool.waits.mean()) if self.n else 0.0,
+                'p95_wait': float(np.percentile(pool.waits, 95)) if self.n else 0.0,
+                'mean_service': float(self.source_service[pool.name].mean()) if self.n else 0.0,
+                'utilisation': pool.busy_time / capacity if capacity > 0 else 0.0
+            })
+
+        return {
+            'articles': self.n,
+            'makespan_s': makespan,
+            'articles_per_hour': self.n / makespan * 3600 if makespan > 0 else 0.0,
+            'mean_latency_s': float(self.finish_times.mean()) if self.n else 0.0,
+            'stages': stage_stats,
+            'pools': pool_stats
+        }
+
+def extract_latency_samples(table: Dict[str, np.ndarray]) -> Dict:
+    """
+    Build empirical service-time distributions (seconds) from the metrics table
+    Zero or missing latencies are dropped; a source never recorded falls back to 1s.
+    """
+    def positive(values: np.ndarray) -> np.ndarray:
+        values = values[np.isfinite(values) & (values > 0)] / 1000.0
+        return values if len(values) else np.array([1.0])
+
+    # Consensus LLM time; older records only have the APIs+Consensus total
+    consensus = np.where(table['consensus_time_ms'] > 0, table['consensus_time_ms'],
+                         table['apis_time_ms'] - table['fanout_time_ms'])
+
+    return {
+        'vision': positive(table['vision_time_ms']),
+        'consensus': positive(consensus),
+        'topics': positive(table['topics_time_ms']),
+        'sources': {
+            source: positive(table['api_time_ms'][:, j])
+            for j, source in enumerate(API_SOURCES)
+        }
+    }
+
+def parse_source_overrides(values: List[str], cast) -> Dict:
+    """Parse repeated 'source=value' CLI options"""
+    result = {}
+    for item in values or []:
+        if '=' not in item:
+            raise SystemExit(f"❌ Expected source=value, got '{item}'")
+        source, value = item.split('=', 1)
+        source = source.strip().lower()
+        if source not in API_SOURCES:
+            raise SystemExit(f"❌ Unknown source '{source}' (known: {', '.join(API_SOURCES)})")
+        result[source] = cast(value)
+    return result
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as 'Xh Ym' / 'Ym Zs' / 'Z.Zs'"""
+    if seconds >= 3600:
+        return f"{int(seconds // 3600)}h {int(seconds % 3600 // 60):02d}m"
+    if seconds >= 60:
+        return f"{int(seconds // 60)}m {int(seconds % 60):02d}s"
+    return f"{seconds:.1f}s"
+
+def generate_simulation_report(result: Dict, config: Dict, samples: Dict) -> str:
+    """
+    Generate the capacity planning report
+    """
+    lines = ["Pipeline Capacity Simulation", ""]
+    lines.append(f"Simulated articles: {result['articles']} (seed {config['seed']}, "
+                 f"{len(samples['vision'])} recorded articles as empirical distributions)")
+    lines.append(f"Makespan: {format_duration(result['makespan_s'])} "
+                 f"({result['makespan_s']:.0f} s)")
+    lines.append(f"Throughput: {result['articles_per_hour']:.1f} articles/hour")
+    lines.append(f"Mean time to completion: {format_duration(result['mean_latency_s'])}")
+    lines.append("")
+
+    lines.append("| Stage          | Workers   | Mean queue wait | P95 queue wait | Utilisation | Blocked worker-time |")
+    lines.append("|----------------|-----------|-----------------|----------------|-------------|---------------------|")
+    for stage in result['stages']:
+        workers = 'unbounded' if stage['name'] == 'API fan-out' and not config['fanout_inflight'] else str(stage['workers'])
+        utilisation = '-' if workers == 'unbounded' else f"{stage['utilisation']*100:5.1f}%"
+        lines.append(f"| {stage['name']:<14} | {workers:>9} | {format_duration(stage['mean_wait']):>15} | "
+                     f"{format_duration(stage['p95_wait']):>14} | {utilisation:>11} | "
+                     f"{format_duration(stage['blocked_time']):>19} |")
+    lines.append("")
+
+    lines.append("| API Source       | Concurrency | Rate limit (/min) | Mean latency | Mean queue wait | P95 queue wait | Utilisation |")
+    lines.append("|------------------|-------------|-------------------|--------------|-----------------|----------------|-------------|")
+    for pool in sorted(result['pools'], key=lambda p: p['utilisation'], reverse=True):
+        rate = f"{pool['rate_per_min']:.0f}" if pool['rate_per_min'] else 'none'
+        lines.append(f"| {pool['name']:<16} | {pool['concurrency']:>11} | {rate:>17} | "
+                     f"{pool['mean_service']:11.2f}s | {format_duration(pool['mean_wait']):>15} | "
+                     f"{format_duration(pool['p95_wait']):>14} | {pool['utilisation']*100:10.1f}% |")
+    lines.append("")
+
+    # Bottleneck: the most utilised bounded resource
+    candidates = [(s['utilisation'], s['name']) for s in result['stages']
+                  if not (s['name'] == 'API fan-out' and not config['fanout_inflight'])]
+    candidates += [(p['utilisation'], f"{p['name']} (API source)") for p in result['pools']]
+    utilisation, name = max(candidates)
+    lines.append(f"Bottleneck: {name} at {utilisation*100:.1f}% utilisation. "
+                 f"Blocked worker-time counts workers holding a finished article "
+                 f"while the downstream queue is full.")
+
+    return "\n".join(lines)
+
+def positive_int(text: str) -> int:
+    """argparse type: integer >= 1"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+def main():
+    """
+    Main function to run the pipeline capacity simulation
+    """
+    parser = argparse.ArgumentParser(description="Discrete-event simulator of the extraction pipeline")
+    parser.add_argument('--articles', type=positive_int, default=50000, help="articles in the simulated batch")
+    parser.add_argument('--vision-workers', type=positive_int, default=8)
+    parser.add_argument('--consensus-workers', type=positive_int, default=8)
+    parser.add_argument('--topics-workers', type=positive_int, default=8)
+    parser.add_argument('--fanout-inflight', type=positive_int, default=None,
+                        help="max articles in the API fan-out at once (default: unbounded)")
+    parser.add_argument('--queue-size', type=positive_int, default=None,
+                        help="input queue size of the fan-out, consensus and topics stages (default: unbounded)")
+    parser.add_argument('--source-concurrency', type=positive_int, default=4,
+                        help="default concurrent requests per API source")
+    parser.add_argument('--concurrency', action='append', metavar='SOURCE=N',
+                        help="per-source concurrency override (repeatable)")
+    parser.add_argument('--rate-limit', action='append', metavar='SOURCE=N',
+                        help="per-source rate limit in requests per minute (repeatable)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--output', default='plots/simulation_report.txt')
+    args = parser.parse_args()
+
+    print("🚀 INFINITY RESEARCH - Pipeline Capacity Simulator")
+    print("=" * 50)
+
+    if not os.path.exists(args.json_dir):
+        print(f"❌ Error: {args.json_dir} folder not found!")
+        return
+
+    print("📊 Building empirical latency distributions...")
+    table = load_metrics_table(args.json_dir)
+    if len(table['article_num']) == 0:
+        print("❌ No article data found!")
+        return
+    samples = extract_latency_samples(table)
+
+    print(f"   Recorded articles: {len(table['article_num'])}")
+    print(f"   Vision mean: {samples['vision'].mean():.1f}s, Consensus mean: {samples['consensus'].mean():.1f}s, "
+          f"Topics mean: {samples['topics'].mean():.1f}s")
+
+    config = {
+        'articles': args.articles,
+        'vision_workers': args.vision_workers,
+        'consensus_workers': args.consensus_workers,
+        'topics_workers': args.topics_workers,
+        'fanout_inflight': args.fanout_inflight,
+        'queue_size': args.queue_size,
+        'source_concurrency': args.source_concurrency,
+        'concurrency': parse_source_overrides(args.concurrency, int),
+        'rate_limits': parse_source_overrides(args.rate_limit, float),
+        'sources': API_SOURCES,
+        'seed': args.seed
+    }
+
+    print(f"\n⏱️ Simulating {args.articles} articles...")
+    simulator = PipelineSimulator(samples, config, np.random.default_rng(args.seed))
+    result = simulator.run()
+
+    print(f"   Makespan: {format_duration(result['makespan_s'])}")
+    print(f"   Throughput: {result['articles_per_hour']:.1f} articles/hour")
+
+    print(f"\n📝 Generating simulation report...")
+    report = generate_simulation_report(result, config, samples)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(report)
+    print(f"   ✅ Report saved: {args.output}")
+
+    print(f"\n🎯 Pipeline simulation complete!")
+    print(f"   📊 Report: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+🔌 SOURCE EXTRACTORS - Infinity Research Paper
+==============================================
+
+Maps the raw payload of each of the 11 bibliographic API sources
+(`apis_raw_json.json`) onto the 16 metadata fields used by Vision and the
+consensus (`METADATA_FIELDS`). One small extractor per source; values keep
+the source's own formatting except for authors, which are returned as
+"Family, Given" strings like the consensus result.
+
+ORCID describes the author rather than the work and contributes no fields.
+
+Input: apis_raw_json.json entries ({'success', 'data', ...}) per source
+Output: Dict[source, Dict[field, value]] with only non-empty fields
+"""
+
+import html
+import re
+from typing import Callable, Dict, Optional
+
+from article_metrics import API_SOURCES, is_field_filled, source_entries
+
+_TAG = re.compile(r'<[^>]+>')
+_SPACES = re.compile(r'\s+')
+
+def clean_text(value) -> Optional[str]:
+    """Strip JATS/HTML tags, unescape entities and collapse whitespace"""
+    if not isinstance(value, str):
+        return None
+    text = _SPACES.sub(' ', html.unescape(_TAG.sub(' ', value))).strip()
+    return text or None
+
+def strip_doi(value) -> Optional[str]:
+    """DOI without resolver prefix ('https://doi.org/10.x/y' -> '10.x/y')"""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    return re.sub(r'^(https?://(dx\.)?doi\.org/|doi:)', '', value.strip(), flags=re.IGNORECASE)
+
+def format_author(family: Optional[str], given: Optional[str]) -> Optional[str]:
+    family = (family or '').strip()
+    given = (given or '').strip()
+    if family and given:
+        return f"{family}, {given}"
+    return family or given or None
+
+def split_display_name(name: str) -> Optional[str]:
+    """'P. Sparwasser' -> 'Sparwasser, P.' (names already containing a comma are kept)"""
+    name = (name or '').strip()
+    if not name or ',' in name:
+        return name or None
+    parts = name.split()
+    return format_author(parts[-1], ' '.join(parts[:-1])) if len(parts) > 1 else name
+
+def first(values) -> Optional[str]:
+    if isinstance(values, list):
+        return values[0] if values else None
+    return values
+
+def first_year(date_parts) -> Optional[int]:
+    """Crossref {'date-parts': [[2022, 1, 16]]} -> 2022"""
+    try:
+        return int(date_parts['date-parts'][0][0])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+def extract_core(data: Dict) -> Dict:
+    record = data.get('data') or {}
+    return {
+        'DOI': strip_doi(record.get('doi')),
+        'Title': clean_text(record.get('title')),
+        'Authors': [a for a in (record.get('authors') or []) if a],
+        'Journal': record.get('journal'),
+        'Year': record.get('year'),
+        'Abstract': clean_text(record.get('abstract')),
+        'Citations': record.get('citation_count') or None,
+        'PDFUrl': record.get('pdf_url')
+    }
+
+def extract_doaj(data: Dict) -> Dict:
+    results = data.get('results') or []
+    if not results:
+        return {}
+    bibjson = results[0].get('bibjson') or {}
+    journal = bibjson.get('journal') or {}
+    start, end = bibjson.get('start_page'), bibjson.get('end_page')
+    return {
+        'Title': clean_text(bibjson.get('title')),
+        'Journal': journal.get('title'),
+        'Volume': journal.get('volume'),
+        'Issue': journal.get('number'),
+        'Pages': f"{start}-{end}" if start and end and start != end else start,
+        'Year': bibjson.get('year'),
+        'Publisher': journal.get('publisher'),
+        'Abstract': clean_text(bibjson.get('abstract')),
+        'Keywords': bibjson.get('keywords') or [],
+        'OpenAccess': True
+    }
+
+def extract_arxiv(data: Dict) -> Dict:
+    entry = first(data.get('entries')) if isinstance(data.get('entries'), list) else data
+    if not isinstance(entry, dict):
+        return {}
+    authors = entry.get('authors') or []
+    return {
+        'DOI': strip_doi(entry.get('doi')),
+        'Title': clean_text(entry.get('title')),
+        'Authors': [split_display_name(a.get('name') if isinstance(a, dict) else a) for a in authors],
+        'Year': str(entry.get('published') or '')[:4] or None,
+        'Abstract': clean_text(entry.get('summary') or entry.get('abstract')),
+        'PDFUrl': entry.get('pdf_url'),
+        'OpenAccess': True if entry else None
+    }
+
+def extract_orcid(data: Dict) -> Dict:
+    return {}
+
+def extract_pubmed(data: Dict) -> Dict:
+    articles = data.get('PubmedArticle') or []
+    if not articles:
+        return {}
+    citation = articles[0].get('MedlineCitation') or {}
+    article = citation.get('Article') or {}
+    journal = article.get('Journal') or {}
+    issue = journal.get('JournalIssue') or {}
+    abstract = (article.get('Abstract') or {}).get('AbstractText') or []
+    authors = ((article.get('AuthorList') or {}).get('Author')) or []
+    return {
+        'PMID': (citation.get('PMID') or {}).get('content'),
+        'Title': clean_text(article.get('ArticleTitle')),
+        'Authors': [format_author(a.get('LastName'), a.get('ForeName')) for a in authors],
+        'Journal': journal.get('Title'),
+        'Volume': issue.get('Volume'),
+        'Issue': issue.get('Issue'),
+        'Year': (issue.get('PubDate') or {}).get('Year'),
+        'Pages': (article.get('Pagination') or {}).get('MedlinePgn'),
+        'Abstract': clean_text(' '.join(a for a in abstract if isinstance(a, str)))
+    }
+
+def extract_crossref(data: Dict) -> Dict:
+    message = data.get('message') or {}
+    pdf_links = [l.get('URL') for l in message.get('link') or [] if l.get('content-type') == 'application/pdf']
+    licenses = [l.get('URL') or '' for l in message.get('license') or []]
+    year = None
+    for key in ('published-print', 'published', 'issued', 'published-online'):
+        year = first_year(message.get(key))
+        if year:
+            break
+    return {
+        'DOI': strip_doi(message.get('DOI')),
+        'Title': clean_text(first(message.get('title'))),
+        'Authors': [format_author(a.get('family'), a.get('given')) for a in message.get('author') or []],
+        'Journal': first(message.get('container-title')),
+        'Volume': message.get('volume'),
+        'Issue': message.get('issue'),
+        'Pages': message.get('page') or message.get('article-number'),
+        'Year': year,
+        'Publisher': message.get('publisher'),
+        'Abstract': clean_text(re.sub(r'<jats:title>.*?</jats:title>', ' ', message.get('abstract') or '')),
+        'Citations': message.get('is-referenced-by-count') or None,
+        'OpenAccess': True if any('creativecommons.org' in l for l in licenses) else None,
+        'PDFUrl': first(pdf_links)
+    }
+
+def extract_datacite(data: Dict) -> Dict:
+    attributes = (data.get('data') or {}).get('attributes') or {}
+    publisher = attributes.get('publisher')
+    descriptions = [d.get('description') for d in attributes.get('descriptions') or []
+                    if d.get('descriptionType') == 'Abstract']
+    return {
+        'DOI': strip_doi(attributes.get('doi')),
+        'Title': clean_text(first([t.get('title') for t in attributes.get('titles') or []])),
+        'Authors': [format_author(c.get('familyName'), c.get('givenName')) if c.get('familyName')
+                    else c.get('name') for c in attributes.get('creators') or []],
+        'Year': attributes.get('publicationYear'),
+        'Publisher': publisher.get('name') if isinstance(publisher, dict) else publisher,
+        'Abstract': clean_text(first(descriptions)),
+        'Keywords': [s.get('subject') for s in attributes.get('subjects') or [] if s.get('subject')],
+        'Citations': attributes.get('citationCount') or None,
+        'PDFUrl': first(attributes.get('contentUrl'))
+    }
+
+def extract_openalex(data: Dict) -> Dict:
+    open_access = data.get('open_access') or {}
+    return {
+        'DOI': strip_doi(data.get('doi')),
+        'Title': clean_text(data.get('title')),
+        'Year': data.get('publication_year'),
+        'Citations': data.get('cited_by_count'),
+        'OpenAccess': open_access.get('is_oa'),
+        'PDFUrl': open_access.get('oa_url')
+    }
+
+def extract_unpaywall(data: Dict) -> Dict:
+    return {
+        'DOI': strip_doi(data.get('doi')),
+        'Title': clean_text(data.get('title')),
+        'Journal': data.get('journal_name'),
+        'Year': data.get('year'),
+        'Publisher': data.get('publisher'),
+        'OpenAccess': data.get('is_oa')
+    }
+
+def extract_europe_pmc(data: Dict) -> Dict:
+    journal_info = data.get('journalInfo') or {}
+    authors = (data.get('authorList') or {}).get('author') or []
+    pdf_urls = [u.get('url') for u in (data.get('fullTextUrlList') or {}).get('fullTextUrl') or []
+                if u.get('documentStyle') == 'pdf' and u.get('availability') == 'Open access']
+    return {
+        'DOI': strip_doi(data.get('doi')),
+        'PMID': data.get('pmid'),
+        'PMCID': data.get('pmcid'),
+        'Title': clean_text((data.get('title') or '').rstrip('.')),
+        'Authors': [format_author(a.get('lastName'), a.get('firstName')) for a in authors],
+        'Journal': (journal_info.get('journal') or {}).get('title'),
+        'Volume': journal_info.get('volume'),
+        'Issue': journal_info.get('issue'),
+        'Year': journal_info.get('yearOfPublication') or data.get('pubYear'),
+        'Pages': data.get('pageInfo'),
+        'Abstract': clean_text(data.get('abstractText')),
+        'Keywords': (data.get('keywordList') or {}).get('keyword') or [],
+        'Citations': data.get('citedByCount') or None,
+        'OpenAccess': {'Y': True, 'N': False}.get(data.get('isOpenAccess')),
+        'PDFUrl': first(pdf_urls)
+    }
+
+def extract_semantic_scholar(data: Dict) -> Dict:
+    external = data.get('externalIds') or {}
+    journal = data.get('journal') or {}
+    pmcid = external.get('PubMedCentral')
+    pages = clean_text(journal.get('pages'))
+    return {
+        'DOI': strip_doi(external.get('DOI')),
+        'PMID': external.get('PubMed'),
+        'PMCID': f"PMC{pmcid}" if pmcid and not str(pmcid).startswith('PMC') else pmcid,
+        'Title': clean_text(data.get('title')),
+        'Authors': [split_display_name(a.get('name')) for a in data.get('authors') or []],
+        'Journal': journal.get('name'),
+        'Volume': journal.get('volume'),
+        'Pages': pages.replace(' - ', '-') if pages else None,
+        'Year': data.get('year'),
+        'Abstract': clean_text(data.get('abstract')),
+        'Citations': data.get('citationCount'),
+        'OpenAccess': data.get('isOpenAccess'),
+        'PDFUrl': (data.get('openAccessPdf') or {}).get('url') or None
+    }
+
+# Source name (apis_raw_json key) -> extractor of its 'data' payload
+EXTRACTORS: Dict[str, Callable[[Dict], Dict]] = {
+    'core': extract_core,
+    'doaj': extract_doaj,
+    'arxiv': extract_arxiv,
+    'orcid': extract_orcid,
+    'pubmed': extract_pubmed,
+    'crossref': extract_crossref,
+    'datacite': extract_datacite,
+    'openalex': extract_openalex,
+    'unpaywall': extract_unpaywall,
+    'europe_pmc': extract_europe_pmc,
+    'semantic_scholar': extract_semantic_scholar
+}
+
+def extract_source_fields(source: str, entry: Dict) -> Dict:
+    """
+    Metadata fields from one apis_raw_json entry (empty for failed calls)
+    Lists are cleaned of empty items; unfilled fields are dropped.
+    """
+    if not isinstance(entry, dict) or not entry.get('success') or source not in EXTRACTORS:
+        return {}
+    try:
+        fields = EXTRACTORS[source](entry.get('data') or {})
+    except (AttributeError, TypeError) as e:
+        print(f"      ⚠️ Error extracting {source} fields: {e}")
+        return {}
+
+    cleaned = {}
+    for field, value in fields.items():
+        if isinstance(value, list):
+            value = [v for v in value if is_field_filled(v)]
+        # False (closed access) and 0 (no citations) are values, not gaps
+        if is_field_filled(value) or value is False or (field == 'Citations' and value == 0):
+            cleaned[field] = value
+    return cleaned
+
+def extract_all_sources(apis_raw: Dict) -> Dict[str, Dict]:
+    """Fields of every successful source, ordered as API_SOURCES"""
+    entries = source_entries(apis_raw)
+    sources = {}
+    for source in API_SOURCES:
+        fields = extract_source_fields(source, entries.get(source))
+        if fields:
+            sources[source] = fields
+    return sources
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+✂️ SOURCE PRUNING ADVISOR - Infinity Research Paper
+===================================================
+
+Which of the 11 API sources are worth calling? Built on the API x field
+contribution data of Figure 6 (the source bitmasks of the consensus
+`field_sources` encoded by `analyze_field_sources`):
+
+- leave-one-source-out: for each API, the field instances it supplies
+  alone (lost without it), together with Vision only, or together with
+  other APIs (co-validated), and the coverage / fan-out latency without it
+- greedy weighted set cover: starting from Vision alone, add the source
+  with the most newly covered field instances per unit of cost (increase of
+  the expected fan-out critical path + a fixed cost per call) until the
+  coverage target is met, then drop sources that are no longer needed
+
+A field instance (article x field) is covered when at least one of its
+contributing sources is called; Vision is always available. The expected
+critical path is the mean over articles of the slowest selected source's
+recorded latency (`apis_raw_json` processing_time_ms).
+
+Input: JSON files from infinity-research-paper/json/Article_XX/
+Output: source_pruning_report.txt
+"""
+
+import argparse
+import os
+from typing import Dict, List, Tuple
+import numpy as np
+
+from article_metrics import API_SOURCES, load_metrics_table
+from generate_figure6_chart import load_field_sources, source_bits
+
+DEFAULT_COVERAGE_TARGET = 0.98
+
+# Cost of one extra call per article, in seconds of critical path (rate-limit budget, failures)
+DEFAULT_CALL_COST = 0.25
+
+def build_coverage_matrix(json_dir: str) -> Tuple[np.ndarray, List[Tuple[str, str]], np.ndarray]:
+    """
+    Boolean (field instances x sources) matrix from the encoded consensus field_sources
+    Returns (matrix, [(article, field)], vision_mask) with columns ordered as API_SOURCES.
+    """
+    encoding = load_field_sources(json_dir)['encoding']
+
+    bits = source_bits(encoding)
+    # Field-major order: one row per (article, field) with field_sources
+    present = (encoding['types'] >= 0).T
+    fields, articles = np.nonzero(present)
+    instances = [(encoding['articles'][i], encoding['fields'][j]) for j, i in zip(fields, articles)]
+    columns = [encoding['sources'].index(source) for source in API_SOURCES]
+    matrix = bits[articles, fields][:, columns]
+    vision = bits[articles, fields, encoding['sources'].index('vision')]
+    return matrix, instances, vision
+
+def coverage(matrix: np.ndarray, vision: np.ndarray, selected: np.ndarray) -> np.ndarray:
+    """Covered mask of the field instances for a boolean source selection"""
+    return vision | (matrix & selected).any(axis=1)
+
+def mean_seconds(latency_ms: np.ndarray) -> float:
+    """Mean of the recorded latencies in seconds (missing recordings ignored; 0 when none)"""
+    recorded = latency_ms[~np.isnan(latency_ms)]
+    return float(recorded.mean()) / 1000 if len(recorded) else 0.0
+
+def critical_path(latency_ms: np.ndarray, selected: np.ndarray) -> float:
+    """
+    Mean over articles of the slowest selected source (seconds)
+    Sources without a recorded latency for an article are left out of its maximum.
+    """
+    if not selected.any():
+        return 0.0
+    return mean_seconds(np.fmax.reduce(latency_ms[:, selected], axis=1))
+
+def leave_one_out(matrix: np.ndarray, vision: np.ndarray, latency_ms: np.ndarray) -> List[Dict]:
+    """
+    Unique vs. co-validated contributions and the effect of dropping each source
+    """
+    everything = np.ones(len(API_SOURCES), dtype=bool)
+    full_critical = critical_path(latency_ms, everything)
+    rows = []
+    for j, source in enumerate(API_SOURCES):
+        supplies = matrix[:, j]
+        others = matrix.copy()
+        others[:, j] = False
+        other_apis = others.any(axis=1)
+        without = everything.copy()
+        without[j] = False
+        rows.append({
+            'source': source,
+            'instances': int(supplies.sum()),
+            'unique': int((supplies & ~other_apis & ~vision).sum()),
+            'vision_only': int((supplies & ~other_apis & vision).sum()),
+            'co_validated': int((supplies & other_apis).sum()),
+            'coverage_without': float(coverage(matrix, vision, without).mean()),
+            'critical_saved': full_critical - critical_path(latency_ms, without),
+            'mean_latency': mean_seconds(latency_ms[:, j])
+        })
+    return rows
+
+def greedy_source_selection(matrix: np.ndarray, vision: np.ndarray, latency_ms: np.ndarray,
+                            target: float = DEFAULT_COVERAGE_TARGET,
+                            call_cost: float = DEFAULT_CALL_COST) -> Dict:
+    """
+    Weighted greedy set cover up to the coverage target, then reverse deletion
+    """
+    selected = np.zeros(len(API_SOURCES), dtype=bool)
+    steps = []
+    covered = coverage(matrix, vision, selected)
+    while covered.mean() < target:
+        best, best_ratio = None, 0.0
+        for j in np.flatnonzero(~selected):
+            gain = int((matrix[:, j] & ~covered).sum())
+            if gain == 0:
+                continue
+            trial = selected.copy()
+            trial[j] = True
+            cost = critical_path(latency_ms, trial) - critical_path(latency_ms, selected) + call_cost
+            ratio = gain / cost
+            if ratio > best_ratio:
+                best, best_ratio = j, ratio
+        if best is None:
+            break
+        selected[best] = True
+        covered = coverage(matrix, vision, selected)
+        steps.append({'source': API_SOURCES[best], 'coverage': float(covered.mean()),
+                      'critical_path': critical_path(latency_ms, selected)})
+
+    # Reverse deletion: drop the slowest sources the target no longer needs
+    for j in sorted(np.flatnonzero(selected), key=lambda j: -mean_seconds(latency_ms[:, j])):
+        trial = selected.copy()
+        trial[j] = False
+        if coverage(matrix, vision, trial).mean() >= target:
+            selected = trial
+            steps.append({'source': f"-{API_SOURCES[j]}", 'coverage': float(coverage(matrix, vision, selected).mean()),
+                          'critical_path': critical_path(latency_ms, selected)})
+
+    covered = coverage(matrix, vision, selected)
+    return {
+        'selected': [API_SOURCES[j] for j in np.flatnonzero(selected)],
+        'dropped': [API_SOURCES[j] for j in np.flatnonzero(~selected)],
+        'coverage': float(covered.mean()),
+        'critical_path': critical_path(latency_ms, selected),
+        'calls': int(selected.sum()),
+        'steps': steps,
+        'lost': np.flatnonzero(~covered)
+    }
+
+def generate_pruning_report(matrix: np.ndarray, instances: List[Tuple[str, str]], vision: np.ndarray,
+                            latency_ms: np.ndarray, loo: List[Dict], selection: Dict,
+                            target: float, call_cost: float) -> str:
+    """
+    Generate the source pruning report
+    """
+    full_critical = critical_path(latency_ms, np.ones(len(API_SOURCES), dtype=bool))
+    lines = ["API Source Pruning Advisor", ""]
+    lines.append(f"{len(instances)} populated field instances ({len(latency_ms)} articles) from the consensus "
+                 f"field_sources; {int(vision.sum())} are supplied by Vision. All 11 sources: expected "
+                 f"critical path {full_critical:.2f}s, 11 calls per article.")
+    lines.append("")
+    lines.append("Leave-one-source-out:")
+    lines.append("| Source           | Instances | Unique | Vision only | Co-validated | Coverage without | Critical path saved (s) | Mean latency (s) |")
+    lines.append("|------------------|-----------|--------|-------------|--------------|------------------|-------------------------|------------------|")
+    for row in sorted(loo, key=lambda r: (r['unique'], r['instances'])):
+        lines.append(f"| {row['source']:<16} | {row['instances']:9d} | {row['unique']:6d} | {row['vision_only']:11d} | "
+                     f"{row['co_validated']:12d} | {row['coverage_without'] * 100:15.1f}% | "
+                     f"{row['critical_saved']:23.2f} | {row['mean_latency']:16.2f} |")
+    lines.append("")
+    lines.append(f"Greedy selection (coverage target {target * 100:.0f}%, call cost {call_cost:.2f}s):")
+    for step in selection['steps']:
+        action = f"drop {step['source'][1:]}" if step['source'].startswith('-') else f"add  {step['source']}"
+        lines.append(f"  {action:<22} coverage {step['coverage'] * 100:5.1f}%  critical path {step['critical_path']:.2f}s")
+    lines.append("")
+    lines.append(f"Recommended sources ({selection['calls']} calls per article): {', '.join(selection['selected'])}")
+    lines.append(f"Dropped: {', '.join(selection['dropped']) or 'none'}")
+    lines.append(f"Coverage {selection['coverage'] * 100:.1f}%, expected critical path "
+                 f"{full_critical:.2f}s -> {selection['critical_path']:.2f}s.")
+    if len(selection['lost']):
+        lost = [f"{instances[i][0].replace('Article_', 'Art')}/{instances[i][1]}" for i in selection['lost']]
+        lines.append(f"Field instances no longer covered: {', '.join(lost)}")
+    return "\n".join(lines)
+
+def main():
+    """
+    Main function to run the source pruning analysis
+    """
+    parser = argparse.ArgumentParser(description="Leave-one-source-out and greedy API source selection")
+    parser.add_argument('--json-dir', default='json')
+    parser.add_argument('--target', type=float, default=DEFAULT_COVERAGE_TARGET, help="field coverage (0-1)")
+    parser.add_argument('--call-cost', type=float, default=DEFAULT_CALL_COST, help="seconds per extra call")
+    parser.add_argument('--output', default='plots/source_pruning_report.txt')
+    args = parser.parse_args()
+
+    print("✂️ INFINITY RESEARCH - Source Pruning Advisor")
+    print("=" * 50)
+
+    if not os.path.exists(args.json_dir):
+        print(f"❌ Error: {args.json_dir} folder not found!")
+        return
+
+    matrix, instances, vision = build_coverage_matrix(args.json_dir)
+    table = load_metrics_table(args.json_dir)
+    print(f"📁 {len(table['article_num'])} articles, {len(instances)} field instances")
+
+    loo = leave_one_out(matrix, vision, table['api_time_ms'])
+    selection = greedy_source_selection(matrix, vision, table['api_time_ms'], args.target, args.call_cost)
+    report = generate_pruning_report(matrix, instances, vision, table['api_time_ms'], loo, selection,
+                                     args.target, args.call_cost)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(report)
+
+    print(f"\n{report}")
+    print(f"\n🎯 Source pruning complete!")
+    print(f"   📊 Report: {args.output}")
+
+if __name__ == "__main__":
+    main()